@@ -20,7 +20,8 @@ class ZecpathProductionPolish:
     # PATCH C: Graceful Error Handling for ATS
     def parse_resume_safely(self, file_payload: dict) -> dict:
         try:
-            if file_payload.get('is_flattened_image'):
+            # 'extraction_status' is set by parsers/document_extractor when a PDF has no text layer
+            if file_payload.get('is_flattened_image') or file_payload.get('extraction_status') == 'image_only':
                 # Graceful degradation instead of a silent crash
                 return {
                     "success": False,
@@ -1,127 +1,597 @@
 import os
+import re
 import json
 import csv
-from parsers.semantic_engine import SemanticEngine
+import queue
+import threading
+import multiprocessing
+from collections import Counter, deque
 from parsers.scoring_engine import ScoringEngine
 from parsers.eligibility_engine import EligibilityEngine
+from parsers.matching_cascade import MatchingCascade
+from parsers.candidate_store import CandidateStore, STORE_DIRNAME
+from parsers.candidate_index import CandidateVectorIndex, profile_parts, profile_tag
 
-def stream_candidates(processed_folder):
+def stream_candidates(processed_folder, columns=None):
     """
     ENTERPRISE GENERATOR (Day 18 Optimization)
     Yields one candidate at a time. Memory usage stays flat at 1%.
+    If the folder holds a consolidated candidate store, records stream out of its
+    NDJSON segments instead of one json.load per file. 'columns' keeps only those keys.
     """
     if not os.path.exists(processed_folder):
         print(f"⚠️ Folder not found: {processed_folder}")
         return
 
-    for filename in os.listdir(processed_folder):
-        if filename.endswith(".json") and not filename.startswith('.'):
-            file_path = os.path.join(processed_folder, filename)
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    candidate_data = json.load(f)
+    store_dir = os.path.join(processed_folder, STORE_DIRNAME)
+    in_store = set()
+    if CandidateStore.exists(store_dir):
+        # Read-only: a reader must never republish index.json under a live --watch writer
+        with CandidateStore(store_dir, read_only=True) as store:
+            in_store = set(store.ids())
+            for filename, candidate_data in store.stream(columns):
+                candidate_data["filename"] = filename
+                yield filename, candidate_data
+
+    # Per-file JSON (legacy runs, or parses made without --store) that the store doesn't hold yet
+    legacy = [filename for filename in os.listdir(processed_folder)
+              if filename.endswith(".json") and not filename.startswith('.') and filename not in in_store]
+    if in_store and legacy:
+        print(f"ℹ️ Also streaming {len(legacy)} per-file JSON candidates that are not in the candidate store")
+
+    for filename in legacy:
+        file_path = os.path.join(processed_folder, filename)
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                candidate_data = json.load(f)
+                
+                # 🛡️ DEFENSIVE PROGRAMMING: Only process if it's a Dictionary
+                if isinstance(candidate_data, dict):
+                    if columns is not None:
+                        candidate_data = {key: candidate_data.get(key) for key in columns}
+                    # Ensure filename is passed down so the Eligibility Engine can log it
+                    candidate_data["filename"] = filename 
+                    yield filename, candidate_data 
+                else:
+                    print(f"⏭️ Skipping {filename}: Not a valid candidate dictionary format.")
                     
-                    # 🛡️ DEFENSIVE PROGRAMMING: Only process if it's a Dictionary
-                    if isinstance(candidate_data, dict):
-                        # Ensure filename is passed down so the Eligibility Engine can log it
-                        candidate_data["filename"] = filename 
-                        yield filename, candidate_data 
-                    else:
-                        print(f"⏭️ Skipping {filename}: Not a valid candidate dictionary format.")
-                        
-            except Exception as e:
-                print(f"⚠️ Could not read {filename}: {e}")
-
-def run_master_orchestrator():
-    print("🚀 Booting up the Zecpath Master Orchestrator V4.1 (Eligibility Mode)...")
+        except Exception as e:
+            print(f"⚠️ Could not read {filename}: {e}")
+
+# The default requisition (matches our Day 21 JSON Rules!)
+DEFAULT_JD = {
+    "role": "Data Scientist",
+    "role_level": "mid_level",
+    "required_skills": ["Python", "Machine Learning", "Statistical Modeling", "SQL", "Data Visualization"],
+}
+
+# Added Day 21 Eligibility Columns
+RESULT_HEADER = ["Filename", "Final_Score", "Eligibility", "Reason", "Matched_Skills", "Missing_Skills"]
+
+def analyze_skill_gaps(skill_matcher, candidate_skills, jds):
+    """
+    Skill gap analysis of one candidate against SEVERAL JDs at once: one similarity matrix
+    over the union of all JD skills (each candidate skill encoded and compared once),
+    then sliced per JD. Same result dicts as calling analyze_skill_gap per JD.
+    Matchers without a similarity_matrix (e.g. test doubles) fall back to that loop.
+    """
+    if not hasattr(skill_matcher, "similarity_matrix") or not candidate_skills:
+        return [skill_matcher.analyze_skill_gap(candidate_skills, jd["required_skills"]) for jd in jds]
+
+    union = list(dict.fromkeys(skill for jd in jds for skill in jd["required_skills"]))
+    if not union:
+        return [{"score": 0.0, "matched": [], "missing": []} for _ in jds]
+    similarity = skill_matcher.similarity_matrix(union, candidate_skills)
+    best_of = {skill: round(float(score), 3) for skill, score in zip(union, similarity.max(axis=1))}
+
+    analyses = []
+    for jd in jds:
+        jd_skills = jd["required_skills"]
+        if not jd_skills:
+            analyses.append({"score": 0.0, "matched": [], "missing": []})
+            continue
+        best_match_scores = [best_of[skill] for skill in jd_skills]
+        analyses.append({
+            "score": round(sum(best_match_scores) / len(jd_skills), 3),
+            "matched": [skill for skill, score in zip(jd_skills, best_match_scores) if score >= skill_matcher.threshold],
+            "missing": [skill for skill, score in zip(jd_skills, best_match_scores) if score < skill_matcher.threshold]
+        })
+    return analyses
+
+def ats_score_for_jd(candidate_data, jd_requirements, skill_matcher, scoring_engine, skill_analysis=None):
+    """ATS part of the scoring: returns (final score in %, skill gap analysis)."""
+    # Extract skills safely for semantic gap analysis
+    raw_candidate_skills = candidate_data.get("skills", [])
+    
+    # Simulated scores for developer testing
+    candidate_exp_score = 0.85 
+    candidate_project_score = 0.78
+    edu_score = 0.5
+    
+    # SEMANTIC GAP ANALYSIS
+    if skill_analysis is None:
+        skill_analysis = skill_matcher.analyze_skill_gap(raw_candidate_skills, jd_requirements["required_skills"])
+    
+    # PREPARE RAW SCORES
+    raw_scores = {
+        "skills": skill_analysis["score"],
+        "experience": candidate_exp_score,
+        "projects": candidate_project_score,
+        "education": edu_score
+    }
+    
+    # DYNAMIC SCORING
+    scoring_result = scoring_engine.calculate_final_score(jd_requirements["role_level"], raw_scores)
+    final_score_percent = round(scoring_result['final_score'] * 100, 1)
+    return final_score_percent, skill_analysis
+
+def score_candidate_for_jd(filename, candidate_data, jd_requirements, skill_matcher, scoring_engine, eligibility_engine,
+                           skill_analysis=None):
+    """
+    Full scoring of one candidate against one JD. Returns the CSV row (see RESULT_HEADER).
+    A precomputed skill_analysis (see analyze_skill_gaps) skips the per-JD gap analysis.
+    """
+    final_score_percent, skill_analysis = ats_score_for_jd(candidate_data, jd_requirements, skill_matcher,
+                                                           scoring_engine, skill_analysis)
+    
+    # --- DAY 21 ELIGIBILITY ENGINE PLUG-IN ---
+    # 🧠 Semantic Bridge: Pass the Semantic AI's 'matched' skills to the Gatekeeper!
+    # (on a shallow copy, so the same record can be scored against several JDs)
+    candidate_data = dict(candidate_data, skills=skill_analysis["matched"])
+    
+    eligibility_result = eligibility_engine.evaluate_candidate(
+        candidate_data=candidate_data, 
+        ats_score=final_score_percent, 
+        role_name=jd_requirements["role"]
+    )
     
+    decision = eligibility_result["eligibility_status"]
+    # Convert the checks dictionary into a readable string for the CSV
+    reason = str(eligibility_result["checks"])
+    # -----------------------------------------
+    
+    return [
+        filename, 
+        final_score_percent,
+        decision,
+        reason,
+        ", ".join(skill_analysis['matched']),
+        ", ".join(skill_analysis['missing'])
+    ]
+
+def score_candidates_for_jd(candidates, jd_requirements, skill_matcher, scoring_engine, eligibility_engine):
+    """
+    Batched score_candidate_for_jd over [(filename, candidate_data), ...]: the same rows,
+    but the eligibility gate runs ONCE per batch through EligibilityEngine.evaluate_batch.
+    The gate checks the semantically MATCHED JD skills (the Semantic Bridge), not the parsed
+    ones, so the parser's persisted skill bitsets can't answer it: it keeps the set check.
+    """
+    if not candidates:
+        return []
+    scored = [ats_score_for_jd(candidate_data, jd_requirements, skill_matcher, scoring_engine)
+              for _, candidate_data in candidates]
+    filenames = [filename for filename, _ in candidates]
+    matched = [skill_analysis["matched"] for _, skill_analysis in scored]
+
+    # 🧠 Semantic Bridge, columnar: the Gatekeeper sees each candidate's 'matched' skills
+    columns = {
+        "filename": filenames,
+        "skills": matched,
+        "experience_years": [candidate_data.get("experience_years") for _, candidate_data in candidates],
+        "location": [candidate_data.get("location", "") for _, candidate_data in candidates],
+        "available": [candidate_data.get("available", True) for _, candidate_data in candidates]
+    }
+    eligibility = eligibility_engine.evaluate_batch(columns, [score for score, _ in scored], jd_requirements["role"])
+
+    checks = eligibility["checks"]
+    rows = []
+    for i, (filename, (final_score_percent, skill_analysis)) in enumerate(zip(filenames, scored)):
+        # Same readable checks string evaluate_candidate gives the CSV
+        reason = str({"ats_score": final_score_percent,
+                      "skill_match": bool(checks["skill_match"][i]),
+                      "experience_match": bool(checks["experience_match"][i]),
+                      "location_match": bool(checks["location_match"][i]),
+                      "availability_match": bool(checks["availability_match"][i])})
+        rows.append([filename, final_score_percent, str(eligibility["eligibility_status"][i]), reason,
+                     ", ".join(skill_analysis['matched']), ", ".join(skill_analysis['missing'])])
+    return rows
+
+def update_candidate_index(semantic_engine, index, processed_folder, batch_size=256):
+    """
+    Incremental refresh: only candidates that are new, or whose skills/experience
+    changed since the last run, are embedded again; candidates no longer on disk are
+    dropped. Returns how many were (re)indexed or removed.
+    """
+    pending_ids, pending_parts = [], []
+    updated = 0
+    seen = set()
+
+    def flush():
+        skill_lists = [skills for skills, _ in pending_parts]
+        experience_texts = [experience for _, experience in pending_parts]
+        vectors = semantic_engine.embed_profiles(skill_lists, experience_texts)
+        index.add_many(pending_ids, vectors, [profile_tag(*parts) for parts in pending_parts])
+        return len(pending_ids)
+
+    for filename, candidate_data in stream_candidates(processed_folder, columns=["skills", "experience_entries"]):
+        seen.add(filename)
+        parts = profile_parts(candidate_data)
+        if index.tag(filename) == profile_tag(*parts):
+            continue
+        pending_ids.append(filename)
+        pending_parts.append(parts)
+        if len(pending_ids) >= batch_size:
+            updated += flush()
+            pending_ids, pending_parts = [], []
+    if pending_ids:
+        updated += flush()
+    for candidate_id in [candidate_id for candidate_id in index.ids if candidate_id not in seen]:
+        updated += index.remove(candidate_id)
+    return updated
+
+def shortlist_candidates(semantic_engine, index, jd_requirements, top_k, mode="exact", nprobe=8):
+    """Top-K retrieval against the JD's skill profile. Returns the set of filenames worth full scoring."""
+    jd_vector = semantic_engine.embed_profiles([jd_requirements["required_skills"]])[0]
+    if mode == "ivf" and index.needs_training():
+        index.train_ivf()  # First run, or the index doubled since nlist was picked
+    return {candidate_id for candidate_id, _ in index.search(jd_vector, k=top_k, mode=mode, nprobe=nprobe)}
+
+def reuse_duplicate_score(memo, filename, candidate_data, score):
+    """
+    Near-duplicate resumes (tagged 'duplicate_of' by the parser's dedup stage) share their
+    canonical copy's parse, so they also share its score: the row is computed once per
+    group and copied. Only rows of groups with a duplicate are memoized, so memory tracks
+    the number of duplicate groups, not the pool size.
+    """
+    canonical_id = candidate_data.get("duplicate_of")
+    cached = memo.get(canonical_id or filename)
+    if cached is not None:
+        return [filename] + cached[1:]
+    row = score()
+    if canonical_id is not None:
+        memo[canonical_id] = row
+    return row
+
+def score_candidate_batch(memo, candidates, jd_requirements, skill_matcher, scoring_engine, eligibility_engine):
+    """
+    reuse_duplicate_score for a batch: rows of duplicate groups already scored are copied,
+    everything else goes through ONE score_candidates_for_jd call. Rows come back in input order.
+    """
+    pending = [(filename, candidate_data) for filename, candidate_data in candidates
+               if memo.get(candidate_data.get("duplicate_of") or filename) is None]
+    scored = dict(zip((filename for filename, _ in pending),
+                      score_candidates_for_jd(pending, jd_requirements, skill_matcher, scoring_engine,
+                                              eligibility_engine)))
+    rows = []
+    for filename, candidate_data in candidates:
+        canonical_id = candidate_data.get("duplicate_of")
+        row = scored.get(filename)
+        if row is None:
+            row = [filename] + memo[canonical_id or filename][1:]
+        elif canonical_id is not None:
+            memo.setdefault(canonical_id, row)
+        rows.append(row)
+    return rows
+
+def run_master_orchestrator(top_k=None, index_mode="exact", precision="float32", use_cascade=False, batch_size=500):
+    print("🚀 Booting up the Zecpath Master Orchestrator V4.1 (Eligibility Mode)...")
+    # Imported here so the orchestrator module loads without the model stack (tests inject fakes)
+    from parsers.semantic_engine import SemanticEngine
+
     # Initialize all our AI and Logic Engines
     semantic_engine = SemanticEngine()
     scoring_engine = ScoringEngine()
     eligibility_engine = EligibilityEngine()
+    # Exact/alias/pruned pairs skip the transformer; only ambiguous ones reach it
+    skill_matcher = MatchingCascade(semantic_engine) if use_cascade else semantic_engine
     
     # 1. THE JOB DESCRIPTION
-    jd_requirements = {
-        "role": "Data Scientist", # Matches our Day 21 JSON Rules!
-        "role_level": "mid_level",
-        "required_skills": ["Python", "Machine Learning", "Statistical Modeling", "SQL", "Data Visualization"],
-    }
+    jd_requirements = DEFAULT_JD
     
     base_dir = os.path.dirname(os.path.abspath(__file__))
     processed_folder = os.path.join(base_dir, "data", "processed")
     results_file = os.path.join(base_dir, "data", "final_ats_scores.csv")
     
+    # --- TOP-K PREFILTER (optional) ---
+    # Vector retrieval picks the best top_k candidates; only they get the full gap analysis.
+    shortlist = None
+    if top_k:
+        index_path = os.path.join(base_dir, "data", "embeddings", "candidate_index.npz")
+        index = CandidateVectorIndex.load_or_create(index_path, semantic_engine.store.dim, precision=precision)
+        updated = update_candidate_index(semantic_engine, index, processed_folder)
+        needs_training = index_mode == "ivf" and index.needs_training()
+        shortlist = shortlist_candidates(semantic_engine, index, jd_requirements, top_k, mode=index_mode)
+        if updated or needs_training:
+            os.makedirs(os.path.dirname(index_path), exist_ok=True)
+            index.save(index_path)
+        semantic_engine.save_embeddings()
+        print(f"🔎 Vector index: {len(index)} candidates ({updated} re-indexed), scoring top {len(shortlist)}")
+    
     print("\n⚙️ Streaming candidates from disk using Python Generators...")
     
     with open(results_file, mode='w', newline='', encoding='utf-8') as file:
         writer = csv.writer(file)
         # Added Day 21 Eligibility Columns
-        writer.writerow(["Filename", "Final_Score", "Eligibility", "Reason", "Matched_Skills", "Missing_Skills"])
+        writer.writerow(RESULT_HEADER)
         
         count = 0
+        memo = {}
+        batch = []
+
+        def flush():
+            # Eligibility runs once per batch
+            for row in score_candidate_batch(memo, batch, jd_requirements, skill_matcher, scoring_engine,
+                                             eligibility_engine):
+                writer.writerow(row)
+                filename, final_score_percent, decision = row[0], row[1], row[2]
+                
+                # Terminal UI colors
+                if decision == "Eligible":
+                    status = "🟢 ELIGIBLE"
+                elif decision == "Review":
+                    status = "🟡 REVIEW"
+                else:
+                    status = "🔴 REJECTED"
+                    
+                print(f"✅ Scored {filename} -> {final_score_percent}% | {status}")
+            batch.clear()
+
         for filename, candidate_data in stream_candidates(processed_folder):
+            if shortlist is not None and filename not in shortlist:
+                continue
             count += 1
-            
-            # Extract skills safely for semantic gap analysis
-            raw_candidate_skills = candidate_data.get("skills", [])
-            
-            # Simulated scores for developer testing
-            candidate_exp_score = 0.85 
-            candidate_project_score = 0.78
-            edu_score = 0.5
-            
-            # SEMANTIC GAP ANALYSIS
-            skill_analysis = semantic_engine.analyze_skill_gap(raw_candidate_skills, jd_requirements["required_skills"])
-            
-            # PREPARE RAW SCORES
-            raw_scores = {
-                "skills": skill_analysis["score"],
-                "experience": candidate_exp_score,
-                "projects": candidate_project_score,
-                "education": edu_score
-            }
-            
-            # DYNAMIC SCORING
-            scoring_result = scoring_engine.calculate_final_score(jd_requirements["role_level"], raw_scores)
-            final_score_percent = round(scoring_result['final_score'] * 100, 1)
-            
-            # --- DAY 21 ELIGIBILITY ENGINE PLUG-IN ---
-            # 🧠 Semantic Bridge: Pass the Semantic AI's 'matched' skills to the Gatekeeper!
-            candidate_data["skills"] = skill_analysis["matched"] 
-            
-            eligibility_result = eligibility_engine.evaluate_candidate(
-                candidate_data=candidate_data, 
-                ats_score=final_score_percent, 
-                role_name=jd_requirements["role"]
-            )
-            
-            decision = eligibility_result["eligibility_status"]
-            # Convert the checks dictionary into a readable string for the CSV
-            reason = str(eligibility_result["checks"])
-            # -----------------------------------------
-            
-            # Write to CSV
-            writer.writerow([
-                filename, 
-                final_score_percent,
-                decision,
-                reason,
-                ", ".join(skill_analysis['matched']),
-                ", ".join(skill_analysis['missing'])
-            ])
-            
-            # Terminal UI colors
-            if decision == "Eligible":
-                status = "🟢 ELIGIBLE"
-            elif decision == "Review":
-                status = "🟡 REVIEW"
-            else:
-                status = "🔴 REJECTED"
-                
-            print(f"✅ Scored {filename} -> {final_score_percent}% | {status}")
+            batch.append((filename, candidate_data))
+            if len(batch) >= batch_size:
+                flush()
+        flush()
 
+    if use_cascade:
+        skill_matcher.print_report()
     print(f"\n🏁 Finished processing {count} candidates with 0% memory bloat!")
     print(f"📁 Developer Report saved to: {results_file}")
 
+def jd_output_name(jd_requirements, position):
+    """Stable per-JD file name, e.g. 'jd_003_data_scientist.csv'."""
+    label = jd_requirements.get("jd_id") or jd_requirements.get("role", "jd")
+    return f"jd_{position:03d}_{re.sub(r'[^a-z0-9]+', '_', str(label).lower()).strip('_')}.csv"
+
+def score_candidate_for_jds(filename, candidate_data, jds, skill_matcher, scoring_engine, eligibility_engine, memos):
+    """
+    One candidate against EVERY JD: [(jd position, row), ...]. The multi-JD gap analysis runs
+    once, and only if some JD has no reusable duplicate-group row (see reuse_duplicate_score).
+    """
+    rows = []
+    analyses = None
+    for position, jd_requirements in enumerate(jds):
+        try:
+            def score():
+                # Gap analysis for ALL JDs at once, only if some JD actually needs scoring
+                nonlocal analyses
+                if analyses is None:
+                    analyses = analyze_skill_gaps(skill_matcher, candidate_data.get("skills", []), jds)
+                return score_candidate_for_jd(filename, candidate_data, jd_requirements, skill_matcher,
+                                              scoring_engine, eligibility_engine, analyses[position])
+            rows.append((position, reuse_duplicate_score(memos[position], filename, candidate_data, score)))
+        except Exception as e:
+            print(f"⚠️ Could not score {filename} for JD {position}: {e}")
+    return rows
+
+# Engines of one scoring process (set once per worker by init_scoring_worker)
+_scoring_worker = {}
+
+def init_scoring_worker(jds, use_cascade, semantic_engine=None):
+    """
+    Pool initializer: every scoring process builds its engines ONCE. Without an injected
+    engine it loads its own model over the embedding store opened read_only (one writer).
+    """
+    if semantic_engine is None:
+        from parsers.semantic_engine import SemanticEngine
+        semantic_engine = SemanticEngine(read_only=True)
+    eligibility_engine = EligibilityEngine()
+    for jd_requirements in jds:
+        eligibility_engine.compile_plan(jd_requirements["role"])
+    _scoring_worker.update(
+        jds=jds,
+        skill_matcher=MatchingCascade(semantic_engine) if use_cascade else semantic_engine,
+        scoring_engine=ScoringEngine(),
+        eligibility_engine=eligibility_engine,
+        memos=[{} for _ in jds])  # Duplicate-group rows, per worker process
+
+def score_candidate_chunk(chunk):
+    """
+    Pool task: scores [(filename, candidate_data), ...] against every JD in this worker.
+    Returns (rows of each candidate, cascade stage counts since the last chunk).
+    """
+    worker = _scoring_worker
+    rows = [score_candidate_for_jds(filename, candidate_data, worker["jds"], worker["skill_matcher"],
+                                    worker["scoring_engine"], worker["eligibility_engine"], worker["memos"])
+            for filename, candidate_data in chunk]
+    stats = Counter(getattr(worker["skill_matcher"], "stats", {}))
+    if stats:
+        worker["skill_matcher"].stats.clear()
+    return rows, stats
+
+def run_pipelined_orchestrator(jds, processed_folder, output_folder, workers=4, queue_size=256,
+                               flush_every=500, use_cascade=False, semantic_engine=None, mode="process",
+                               chunksize=16):
+    """
+    PIPELINED MULTI-JD ORCHESTRATOR
+    reader -> [bounded queue] -> scoring workers -> [bounded queue] -> writer (this thread)
+    Each candidate is read ONCE and scored against every active JD in one pass.
+    Bounded queues give backpressure: a slow writer stalls the workers, and slow
+    workers stall the reader, so memory stays flat however large the pool is.
+    Writes one CSV per JD into output_folder and returns {jd position: rows written}.
+    'process' mode (default) scores in a pool of worker processes, each started once with
+    its own engines, so the pure-Python scoring/eligibility work runs on every core.
+    Chunks of 'chunksize' candidates go out, at most queue_size candidates in flight.
+    Workers open the embedding store read-only, so embeddings new to this run are not
+    persisted; an injected semantic_engine is handed to every worker as-is.
+    'thread' mode keeps thread workers over one shared engine: they overlap disk reads and
+    the model's native encode calls, but the rest of the scoring is GIL-bound.
+    """
+    print(f"🚀 Pipelined orchestrator: {len(jds)} JDs, {workers} scoring {mode} workers")
+    os.makedirs(output_folder, exist_ok=True)
+    files = [open(os.path.join(output_folder, jd_output_name(jd, position)), "w", newline="", encoding="utf-8")
+             for position, jd in enumerate(jds)]
+    writers = [csv.writer(f) for f in files]
+    buffers = [[] for _ in jds]
+    written = {position: 0 for position in range(len(jds))}
+    cascade_stats = Counter()
+
+    # WRITER: buffered, one CSV per JD
+    def write_rows(rows):
+        for position, row in rows:
+            buffers[position].append(row)
+            if len(buffers[position]) >= flush_every:
+                writers[position].writerows(buffers[position])
+                written[position] += len(buffers[position])
+                buffers[position] = []
+
+    try:
+        for writer in writers:
+            writer.writerow(RESULT_HEADER)
+        if mode == "process":
+            _score_in_processes(jds, processed_folder, workers, queue_size, chunksize, use_cascade,
+                                semantic_engine, write_rows, cascade_stats)
+        else:
+            semantic_engine = _score_in_threads(jds, processed_folder, workers, queue_size, use_cascade,
+                                                semantic_engine, write_rows, cascade_stats)
+            semantic_engine.save_embeddings()
+        for position, buffer in enumerate(buffers):
+            writers[position].writerows(buffer)
+            written[position] += len(buffer)
+    finally:
+        for f in files:
+            f.close()
+
+    if use_cascade:
+        report = MatchingCascade()
+        report.stats.update(cascade_stats)
+        report.print_report()
+    print(f"🏁 Wrote {sum(written.values())} rows across {len(jds)} JD reports in {output_folder}")
+    return written
+
+def _score_in_processes(jds, processed_folder, workers, queue_size, chunksize, use_cascade, semantic_engine,
+                        write_rows, cascade_stats):
+    """
+    Process mode: this thread reads candidates in chunks and writes results, a pool of
+    worker processes scores. Results are collected in submission order; once queue_size
+    candidates are in flight, the reader waits for the oldest chunk.
+    """
+    max_in_flight = max(workers, -(-queue_size // chunksize))
+    in_flight = deque()
+
+    def collect(result):
+        rows, stats = result.get()
+        for candidate_rows in rows:
+            write_rows(candidate_rows)
+        cascade_stats.update(stats)
+
+    with multiprocessing.Pool(processes=workers, initializer=init_scoring_worker,
+                              initargs=(jds, use_cascade, semantic_engine)) as pool:
+        chunk = []
+        for item in stream_candidates(processed_folder):
+            chunk.append(item)
+            if len(chunk) == chunksize:
+                in_flight.append(pool.apply_async(score_candidate_chunk, (chunk,)))
+                chunk = []
+                if len(in_flight) >= max_in_flight:
+                    collect(in_flight.popleft())
+        if chunk:
+            in_flight.append(pool.apply_async(score_candidate_chunk, (chunk,)))
+        while in_flight:
+            collect(in_flight.popleft())
+
+def _score_in_threads(jds, processed_folder, workers, queue_size, use_cascade, semantic_engine,
+                      write_rows, cascade_stats):
+    """Thread mode: reader thread -> [bounded queue] -> scoring threads -> [bounded queue] -> writer."""
+    if semantic_engine is None:
+        from parsers.semantic_engine import SemanticEngine
+        semantic_engine = SemanticEngine()
+    scoring_engine = ScoringEngine()
+    eligibility_engine = EligibilityEngine()
+    for jd_requirements in jds:
+        eligibility_engine.compile_plan(jd_requirements["role"])  # Compile before the threads start
+
+    candidate_queue = queue.Queue(maxsize=queue_size)
+    result_queue = queue.Queue(maxsize=queue_size)
+    done = object()  # End-of-stream marker
+    matchers = []
+    memos = [{} for _ in jds]  # Per-JD duplicate-group rows, shared by the workers
+
+    # 1. READER: streams candidate records off disk
+    def reader():
+        try:
+            for item in stream_candidates(processed_folder):
+                candidate_queue.put(item)
+        finally:
+            for _ in range(workers):
+                candidate_queue.put(done)
+
+    # 2. SCORING WORKERS: one candidate against ALL JDs per queue item
+    def scorer():
+        # Per-worker cascade: its hit counters are not shared between threads
+        skill_matcher = MatchingCascade(semantic_engine) if use_cascade else semantic_engine
+        matchers.append(skill_matcher)
+        try:
+            while True:
+                item = candidate_queue.get()
+                if item is done:
+                    break
+                filename, candidate_data = item
+                result_queue.put(score_candidate_for_jds(filename, candidate_data, jds, skill_matcher,
+                                                         scoring_engine, eligibility_engine, memos))
+        finally:
+            result_queue.put(done)
+
+    threads = [threading.Thread(target=reader, daemon=True)]
+    threads += [threading.Thread(target=scorer, daemon=True) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+
+    # 3. WRITER (this thread)
+    finished = 0
+    while finished < workers:
+        rows = result_queue.get()
+        if rows is done:
+            finished += 1
+            continue
+        write_rows(rows)
+
+    for thread in threads:
+        thread.join()
+    if use_cascade:
+        for skill_matcher in matchers:
+            cascade_stats.update(skill_matcher.stats)
+    return semantic_engine
+
 if __name__ == "__main__":
-    run_master_orchestrator()
\ No newline at end of file
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Score processed candidates against the JD.")
+    parser.add_argument("--top-k", type=int, default=None,
+                        help="Only fully score the K candidates closest to the JD in embedding space")
+    parser.add_argument("--index-mode", choices=["exact", "ivf"], default="exact",
+                        help="exact = blocked matmul over all candidates, ivf = approximate bucketed search")
+    parser.add_argument("--index-precision", choices=["float32", "float16", "int8"], default="float32",
+                        help="Storage precision of the candidate index (float16/int8 use 2x/4x less RAM)")
+    parser.add_argument("--cascade", action="store_true",
+                        help="Resolve exact/alias skill pairs lexically before the transformer")
+    parser.add_argument("--jds", default=None,
+                        help="JSON file with a list of JDs: scores them all in one pipelined pass")
+    parser.add_argument("--workers", type=int, default=4, help="Scoring workers (with --jds)")
+    parser.add_argument("--mode", choices=["process", "thread"], default="process",
+                        help="Scoring workers as processes (every core) or threads over one model (with --jds)")
+    parser.add_argument("--queue-size", type=int, default=256, help="Bounded queue capacity (with --jds)")
+    args = parser.parse_args()
+
+    if args.jds:
+        with open(args.jds, "r", encoding="utf-8") as f:
+            jds = json.load(f)
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        run_pipelined_orchestrator(jds, os.path.join(base_dir, "data", "processed"),
+                                   os.path.join(base_dir, "data", "jd_scores"), workers=args.workers,
+                                   queue_size=args.queue_size, use_cascade=args.cascade, mode=args.mode)
+    else:
+        run_master_orchestrator(top_k=args.top_k, index_mode=args.index_mode, precision=args.index_precision,
+                                use_cascade=args.cascade)
\ No newline at end of file
@@ -0,0 +1,301 @@
+import os
+import hashlib
+import numpy as np
+try:
+    from parsers.vector_codec import check_precision, quantize, dequantize, dot_scores
+except ImportError:  # Run from inside parsers/
+    from vector_codec import check_precision, quantize, dequantize, dot_scores
+
+# needs_training() asks for a retrain once the index has grown this much since train_ivf()
+RETRAIN_GROWTH = 2.0
+
+
+def profile_parts(candidate):
+    """
+    (skills, experience text) of a parsed candidate. The job titles of the ExperienceParser
+    output ('experience_entries') stand in for the experience.
+    """
+    skills = [skill for skill in candidate.get("skills") or [] if isinstance(skill, str)]
+    entries = candidate.get("experience_entries") or []
+    titles = []
+    for job in entries if isinstance(entries, list) else []:
+        title = job.get("job_title") if isinstance(job, dict) else None
+        if isinstance(title, str) and title.strip():
+            titles.append(title.strip())
+    return skills, "; ".join(titles)
+
+
+def profile_tag(skills, experience_text):
+    """Short content hash, so the index only re-embeds candidates whose profile changed."""
+    payload = "\x1f".join(skills) + "\x1e" + experience_text
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class CandidateVectorIndex:
+    """
+    Top-K retrieval of candidates for a JD over unit-normalized profile embeddings.
+    - 'exact' mode: blocked matmul over every candidate (bounded memory, exact answer).
+    - 'ivf' mode: vectors are bucketed under k-means centroids (an inverted file);
+      a query only scores the buckets of its nprobe closest centroids.
+    Candidates can be added or replaced at any time; new rows join their nearest bucket,
+    and needs_training() flags a retrain once the index outgrows its nlist.
+    precision='float16' or 'int8' keeps the rows compact (2x / ~4x less RAM) and
+    scores them in that form, block by block.
+    """
+
+    def __init__(self, dim, precision="float32"):
+        self.dim = dim
+        self.precision = precision
+        self._dtype = check_precision(precision)
+        self.ids = []          # row -> candidate id
+        self.tags = []         # row -> caller-defined version tag (e.g. hash of the profile text)
+        self._row_of = {}      # candidate id -> row
+        self._vectors = np.empty((0, dim), dtype=self._dtype)
+        self._scales = np.empty(0, dtype=np.float32) if precision == "int8" else None
+        self._size = 0
+        self.centroids = None  # (nlist, dim) once train_ivf() has run
+        self.trained_size = 0  # candidates in the index when train_ivf() last ran
+        self._assign = np.empty(0, dtype=np.int32)
+        self._lists = []       # bucket -> list of rows
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, candidate_id):
+        return candidate_id in self._row_of
+
+    def tag(self, candidate_id):
+        row = self._row_of.get(candidate_id)
+        return None if row is None else self.tags[row]
+
+    @staticmethod
+    def _normalize(vectors):
+        vectors = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        return vectors / np.where(norms == 0, 1.0, norms)
+
+    # ---------- building ----------
+    def add_many(self, candidate_ids, vectors, tags=None):
+        """Adds new candidates or replaces existing ones (same id -> same row)."""
+        vectors = self._normalize(np.asarray(vectors).reshape(len(candidate_ids), self.dim))
+        codes, scales = quantize(vectors, self.precision, unit=True)
+        tags = tags if tags is not None else [None] * len(candidate_ids)
+
+        for position, (candidate_id, tag) in enumerate(zip(candidate_ids, tags)):
+            row = self._row_of.get(candidate_id)
+            if row is None:
+                row = self._size
+                self._grow(row + 1)
+                self._row_of[candidate_id] = row
+                self.ids.append(candidate_id)
+                self.tags.append(tag)
+                self._size += 1
+            else:
+                self.tags[row] = tag
+            self._vectors[row] = codes[position]
+            if scales is not None:
+                self._scales[row] = scales[position]
+            if self.centroids is not None:
+                self._reassign(row)
+
+    def add(self, candidate_id, vector, tag=None):
+        self.add_many([candidate_id], [vector], [tag])
+
+    def remove(self, candidate_id):
+        """Drops a candidate (e.g. a deleted resume): the last row moves into its slot. False if unknown."""
+        row = self._row_of.pop(candidate_id, None)
+        if row is None:
+            return False
+        last = self._size - 1
+        if self.centroids is not None:
+            self._lists[self._assign[row]].remove(row)
+        if row != last:
+            moved_id = self.ids[last]
+            self._vectors[row] = self._vectors[last]
+            if self._scales is not None:
+                self._scales[row] = self._scales[last]
+            self.ids[row], self.tags[row] = moved_id, self.tags[last]
+            self._row_of[moved_id] = row
+            if self.centroids is not None:
+                bucket = self._assign[last]
+                rows = self._lists[bucket]
+                rows[rows.index(last)] = row
+            self._assign[row] = self._assign[last]
+        self.ids.pop()
+        self.tags.pop()
+        self._vectors[last] = 0
+        self._assign[last] = -1
+        self._size -= 1
+        return True
+
+    def _grow(self, needed):
+        """Amortized O(1) appends: double the backing arrays when full."""
+        if needed <= len(self._vectors):
+            return
+        capacity = max(needed, 2 * len(self._vectors), 1024)
+        vectors = np.zeros((capacity, self.dim), dtype=self._dtype)
+        vectors[:self._size] = self._vectors[:self._size]
+        self._vectors = vectors
+        if self._scales is not None:
+            scales = np.ones(capacity, dtype=np.float32)
+            scales[:self._size] = self._scales[:self._size]
+            self._scales = scales
+        assign = np.full(capacity, -1, dtype=np.int32)
+        assign[:self._size] = self._assign[:self._size]
+        self._assign = assign
+
+    def _rows(self, start, stop):
+        """Decoded float32 copy of rows [start, stop)."""
+        return dequantize(self._vectors[start:stop],
+                          None if self._scales is None else self._scales[start:stop])
+
+    def _score(self, rows, query):
+        """Cosine scores of the given rows (a slice or an index array), computed on the codes."""
+        return dot_scores(self._vectors[rows], None if self._scales is None else self._scales[rows], query)
+
+    def memory_bytes(self):
+        """Bytes held by the live vectors (plus int8 scales)."""
+        scale_bytes = 4 * self._size if self._scales is not None else 0
+        return self._size * self.dim * self._dtype.itemsize + scale_bytes
+
+    def _reassign(self, row):
+        bucket = int(np.argmax(self.centroids @ self._rows(row, row + 1)[0]))
+        old = self._assign[row]
+        if old == bucket:
+            return
+        if old >= 0:
+            self._lists[old].remove(row)
+        self._lists[bucket].append(row)
+        self._assign[row] = bucket
+
+    def needs_training(self, growth=RETRAIN_GROWTH):
+        """True when IVF was never trained, or the index grew 'growth'x since (nlist = sqrt(size) went stale)."""
+        return self._size > 0 and (self.centroids is None or self._size >= growth * max(self.trained_size, 1))
+
+    def _bucket_rows(self, assign=None):
+        """
+        Fills _assign and _lists for every row: nearest centroid in blocks of 65536 rows
+        (or a saved assignment), then one stable argsort splits the rows into buckets.
+        """
+        if assign is None:
+            assign = np.empty(self._size, dtype=np.int32)
+            for start in range(0, self._size, 65536):
+                stop = min(start + 65536, self._size)
+                assign[start:stop] = np.argmax(self._rows(start, stop) @ self.centroids.T, axis=1)
+        self._assign[:self._size] = assign
+        order = np.argsort(assign, kind="stable")
+        bounds = np.cumsum(np.bincount(assign, minlength=len(self.centroids)))[:-1]
+        self._lists = [bucket.tolist() for bucket in np.split(order, bounds)]
+
+    def train_ivf(self, nlist=None, iterations=10, sample_size=100000, seed=0):
+        """Spherical k-means on (a sample of) the vectors, then buckets every row."""
+        if self._size == 0:
+            return
+        nlist = nlist or max(1, int(np.sqrt(self._size)))
+        nlist = min(nlist, self._size)
+        rng = np.random.default_rng(seed)
+        picks = np.sort(rng.choice(self._size, min(sample_size, self._size), replace=False))
+        sample = dequantize(self._vectors[picks], None if self._scales is None else self._scales[picks])
+
+        centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+        for _ in range(iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            for bucket in range(nlist):
+                members = sample[labels == bucket]
+                if len(members):
+                    centroids[bucket] = members.sum(axis=0)
+            centroids = self._normalize(centroids)
+
+        self.centroids = centroids
+        self.trained_size = self._size
+        self._bucket_rows()
+
+    # ---------- searching ----------
+    @staticmethod
+    def _top_k(scores, rows, k):
+        if len(scores) > k:
+            keep = np.argpartition(-scores, k - 1)[:k]
+            scores, rows = scores[keep], rows[keep]
+        order = np.argsort(-scores, kind="stable")
+        return scores[order], rows[order]
+
+    def search(self, query, k=1000, mode="exact", nprobe=8, block_size=None):
+        """Returns [(candidate_id, cosine score), ...] for the k best candidates, best first."""
+        # Compact rows are widened to float32 per block: small blocks keep that copy in cache
+        block_size = block_size or (65536 if self.precision == "float32" else 4096)
+        if self._size == 0 or k <= 0:
+            return []
+        query = self._normalize(query).reshape(self.dim)
+
+        if mode == "ivf":
+            if self.centroids is None:
+                raise ValueError("IVF mode needs train_ivf() first")
+            probes = np.argsort(-(self.centroids @ query))[:nprobe]
+            rows = np.fromiter((row for bucket in probes for row in self._lists[bucket]), dtype=np.int64)
+            scores, rows = self._top_k(self._score(rows, query), rows, k)
+        else:
+            # Exact: score one block at a time and keep a running top-k
+            best_scores = np.empty(0, dtype=np.float32)
+            best_rows = np.empty(0, dtype=np.int64)
+            for start in range(0, self._size, block_size):
+                stop = min(start + block_size, self._size)
+                block_scores = self._score(slice(start, stop), query)
+                best_scores, best_rows = self._top_k(np.concatenate([best_scores, block_scores]),
+                                                     np.concatenate([best_rows, np.arange(start, stop)]), k)
+            scores, rows = best_scores, best_rows
+
+        return [(self.ids[row], float(score)) for row, score in zip(rows, scores)]
+
+    # ---------- persistence ----------
+    def save(self, path):
+        # Plain fixed-width string arrays (no pickled objects): load() never needs allow_pickle.
+        # Written aside and swapped in, so a reader never sees a half-written file
+        tmp_path = path + ".tmp.npz"
+        np.savez(tmp_path,
+                 precision=np.array(self.precision),
+                 vectors=self._vectors[:self._size],
+                 scales=self._scales[:self._size] if self._scales is not None else np.empty(0, np.float32),
+                 ids=np.array(self.ids, dtype=str),
+                 tags=np.array(["" if tag is None else tag for tag in self.tags], dtype=str),
+                 centroids=self.centroids if self.centroids is not None else np.empty((0, self.dim), np.float32),
+                 assign=self._assign[:self._size] if self.centroids is not None else np.empty(0, np.int32),
+                 trained_size=np.array(self.trained_size))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            vectors = data["vectors"]
+            precision = str(data["precision"]) if "precision" in data.files else "float32"
+            index = cls(vectors.shape[1], precision=precision)
+            # Rows were saved normalized: copy them as-is (re-normalizing would drift the last bit)
+            index.ids = [str(candidate_id) for candidate_id in data["ids"]]
+            index.tags = [str(tag) or None for tag in data["tags"]]
+            index._row_of = {candidate_id: row for row, candidate_id in enumerate(index.ids)}
+            index._grow(len(vectors))
+            index._vectors[:len(vectors)] = vectors
+            if index._scales is not None:
+                index._scales[:len(vectors)] = data["scales"]
+            index._size = len(vectors)
+            if len(data["centroids"]):
+                index.centroids = data["centroids"]
+                # Files from before these were saved: no growth recorded, buckets recomputed
+                index.trained_size = int(data["trained_size"]) if "trained_size" in data.files else index._size
+                assign = data["assign"] if "assign" in data.files else None
+                index._bucket_rows(assign if assign is not None and len(assign) == index._size else None)
+        return index
+
+    @classmethod
+    def load_or_create(cls, path, dim, precision="float32"):
+        """
+        Loads a saved index. One saved with another precision, or in the old pickled
+        format, is rebuilt from scratch.
+        """
+        if os.path.exists(path):
+            try:
+                index = cls.load(path)
+            except ValueError:  # Object arrays from before ids/tags were saved as strings
+                index = None
+            if index is not None and index.precision == precision:
+                return index
+        return cls(dim, precision=precision)
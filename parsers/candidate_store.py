@@ -0,0 +1,338 @@
+import os
+import json
+
+# Roll over to a new segment file once the active one reaches this size
+SEGMENT_MAX_BYTES = 64 * 1024 * 1024
+# compact_if_needed() rewrites the store once superseded lines and tombstones pass this share of it
+COMPACT_DEAD_RATIO = 0.5
+# Rows per record batch when exporting to Parquet
+EXPORT_CHUNK_ROWS = 10000
+STORE_DIRNAME = "candidate_store"
+
+
+class CandidateStore:
+    """
+    Consolidated candidate storage: append-only NDJSON segments plus a sidecar offset index.
+    Layout:  <root>/segment_00000.ndjson   one {"id": ..., "data": {...}} line per write
+             <root>/index.json             {"segments": {name: bytes indexed}, "records": {id: [segment, offset, length]}}
+    A newer line for the same id supersedes the old one; deletions append a tombstone line.
+    index.json also records "first_segment": segments numbered below it were retired by
+    compact() and are ignored (and removed) even if a crash left them on disk.
+    Lines past what index.json covers (e.g. after a crash) are re-read on open, so the
+    index can always be rebuilt from the segments alone. Only one process should write;
+    readers open with read_only=True, which never touches index.json or the segments.
+    """
+
+    def __init__(self, root_dir, segment_max_bytes=SEGMENT_MAX_BYTES, read_only=False):
+        self.root_dir = root_dir
+        self.segment_max_bytes = segment_max_bytes
+        self.read_only = read_only
+        self.index_path = os.path.join(root_dir, "index.json")
+        if not read_only:
+            os.makedirs(root_dir, exist_ok=True)
+
+        self.records = {}   # candidate id -> (segment number, offset, length)
+        self.segments = {}  # segment name -> bytes covered by the index
+        self.first_segment = 0
+        self._writer = None
+        self._readers = {}
+        self._dirty = False  # Index changed since index.json was last written
+        self._load_index()
+
+    # ---------- index ----------
+    @staticmethod
+    def exists(root_dir):
+        return os.path.exists(os.path.join(root_dir, "index.json")) or os.path.exists(
+            os.path.join(root_dir, "segment_00000.ndjson"))
+
+    @staticmethod
+    def segment_name(number):
+        return f"segment_{number:05d}.ndjson"
+
+    def _segment_path(self, number):
+        return os.path.join(self.root_dir, self.segment_name(number))
+
+    def _segment_files(self):
+        """Every segment number on disk, including ones retired by an interrupted compact()."""
+        if not os.path.isdir(self.root_dir):
+            return []
+        return sorted(int(name[len("segment_"):-len(".ndjson")]) for name in os.listdir(self.root_dir)
+                      if name.startswith("segment_") and name.endswith(".ndjson"))
+
+    def _segment_numbers(self):
+        return [number for number in self._segment_files() if number >= self.first_segment]
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            self.records = {cid: tuple(entry) for cid, entry in index["records"].items()}
+            self.segments = index["segments"]
+            self.first_segment = index.get("first_segment", 0)
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            self.records, self.segments, self.first_segment = {}, {}, 0
+
+        # Catch up on anything appended after the index was last saved
+        for number in self._segment_numbers():
+            name = self.segment_name(number)
+            size = os.path.getsize(self._segment_path(number))
+            covered = self.segments.get(name, 0)
+            if covered > size:
+                # Segment shrank under us: the index can't be trusted, rebuild from scratch
+                self.records, self.segments = {}, {}
+                return self._load_index_from_segments()
+            if size > covered:
+                self._scan_segment(number, covered)
+
+    def _load_index_from_segments(self):
+        for number in self._segment_numbers():
+            self._scan_segment(number, 0)
+
+    def _scan_segment(self, number, start):
+        name = self.segment_name(number)
+        with open(self._segment_path(number), "rb") as f:
+            f.seek(start)
+            offset = start
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # Torn final write: ignore it, the next append starts cleanly after it
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    offset += len(line)
+                    continue
+                if entry.get("deleted"):
+                    self.records.pop(entry["id"], None)
+                else:
+                    self.records[entry["id"]] = (number, offset, len(line))
+                offset += len(line)
+        self.segments[name] = offset
+        self._dirty = True
+
+    def save(self):
+        """
+        Flushes the active segment, then atomically publishes the index.
+        No-op when read_only or when nothing changed since the last save.
+        """
+        if self.read_only or not self._dirty:
+            return
+        if self._writer is not None:
+            self._writer.flush()
+        self._write_index()
+        self._dirty = False
+
+    def _write_index(self):
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"segments": self.segments, "records": self.records,
+                       "first_segment": self.first_segment}, f)
+        os.replace(tmp_path, self.index_path)
+
+    def close(self):
+        self.save()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        for reader in self._readers.values():
+            reader.close()
+        self._readers = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---------- writes ----------
+    @staticmethod
+    def _encode(entry):
+        return (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+
+    def _append(self, line):
+        if self.read_only:
+            raise PermissionError(f"CandidateStore at {self.root_dir} was opened read_only")
+        if self._writer is None:
+            numbers = self._segment_numbers()  # Resume appending to the newest segment
+            self._open_writer(numbers[-1] if numbers else self.first_segment)
+        if self._writer.tell() and self._writer.tell() + len(line) > self.segment_max_bytes:
+            self._open_writer(self._writer_number + 1)
+
+        offset = self._writer.tell()
+        self._writer.write(line)
+        self.segments[self.segment_name(self._writer_number)] = offset + len(line)
+        self._dirty = True
+        return self._writer_number, offset, len(line)
+
+    def _open_writer(self, number):
+        if self._writer is not None:
+            self._writer.close()
+        path = self._segment_path(number)
+        covered = self.segments.get(self.segment_name(number))
+        if covered is not None and os.path.exists(path) and os.path.getsize(path) > covered:
+            # Cut off a torn tail first, or the next line would be glued onto it
+            with open(path, "r+b") as f:
+                f.truncate(covered)
+        self._writer = open(path, "ab")
+        self._writer_number = number
+        self._readers.pop(number, None)
+
+    def put(self, candidate_id, record):
+        """
+        Appends (or supersedes) one candidate record. Re-putting a byte-identical record
+        (e.g. a cache hit on every run) is a no-op, so unchanged candidates add no dead lines.
+        """
+        line = self._encode({"id": candidate_id, "data": record})
+        entry = self.records.get(candidate_id)
+        if entry is not None and entry[2] == len(line) and self._read_line(entry) == line:
+            return
+        self.records[candidate_id] = self._append(line)
+
+    def delete(self, candidate_id):
+        if candidate_id in self.records:
+            self._append(self._encode({"id": candidate_id, "deleted": True}))
+            del self.records[candidate_id]
+
+    # ---------- reads ----------
+    def __len__(self):
+        return len(self.records)
+
+    def __contains__(self, candidate_id):
+        return candidate_id in self.records
+
+    def ids(self):
+        return list(self.records)
+
+    @staticmethod
+    def _project(record, columns):
+        return record if columns is None else {key: record.get(key) for key in columns}
+
+    def get(self, candidate_id, columns=None):
+        """Random access: one seek + one read. Returns None for unknown ids."""
+        entry = self.records.get(candidate_id)
+        if entry is None:
+            return None
+        return self._project(json.loads(self._read_line(entry))["data"], columns)
+
+    def _read_line(self, entry):
+        number, offset, length = entry
+        if self._writer is not None and number == self._writer_number:
+            self._writer.flush()
+        reader = self._readers.get(number)
+        if reader is None:
+            reader = self._readers[number] = open(self._segment_path(number), "rb")
+        reader.seek(offset)
+        return reader.read(length)
+
+    def stream(self, columns=None):
+        """
+        Sequential scan in file order, yielding (candidate_id, record) for live records only.
+        'columns' projects each record down to the requested keys.
+        """
+        if self._writer is not None:
+            self._writer.flush()
+        for number in self._segment_numbers():
+            with open(self._segment_path(number), "rb") as f:
+                offset = 0
+                for line in f:
+                    entry_offset, offset = offset, offset + len(line)
+                    if self.records.get(self._peek_id(line)) != (number, entry_offset, len(line)):
+                        continue  # Superseded, deleted, or torn
+                    entry = json.loads(line)
+                    yield entry["id"], self._project(entry["data"], columns)
+
+    @staticmethod
+    def _peek_id(line):
+        """Candidate id of a line without decoding the whole record ('id' is always written first)."""
+        try:
+            return json.JSONDecoder().raw_decode(line.decode("utf-8"), 7)[0]
+        except (ValueError, UnicodeDecodeError):
+            return None
+
+    # ---------- maintenance ----------
+    def compact(self):
+        """
+        Rewrites only live records into fresh segments, dropping superseded lines and tombstones.
+        The new segments are built in a side folder, moved in under numbers past every old
+        segment and published with an index whose first_segment retires the old ones; only
+        then are the old segments unlinked. A crash at any point leaves a readable store.
+        """
+        staging_dir = os.path.join(self.root_dir, ".compact")
+        if os.path.exists(staging_dir):
+            for name in os.listdir(staging_dir):
+                os.remove(os.path.join(staging_dir, name))
+        with CandidateStore(staging_dir, self.segment_max_bytes) as staging:
+            for candidate_id, record in self.stream():
+                staging.put(candidate_id, record)
+        self.close()
+
+        # 1. Move the staged segments in under new numbers (the old index never points at them)
+        first_segment = max(self._segment_files(), default=-1) + 1
+        segments = {}
+        for number in staging._segment_numbers():
+            os.replace(staging._segment_path(number), self._segment_path(first_segment + number))
+            segments[self.segment_name(first_segment + number)] = staging.segments[staging.segment_name(number)]
+
+        # 2. Publish the new index atomically
+        self.records = {candidate_id: (first_segment + number, offset, length)
+                        for candidate_id, (number, offset, length) in staging.records.items()}
+        self.segments = segments
+        self.first_segment = first_segment
+        self._dirty = True
+        self.save()
+
+        # 3. Only now drop the old segments (plus any left behind by an earlier interrupted compact)
+        for number in self._segment_files():
+            if number < first_segment:
+                os.remove(self._segment_path(number))
+        for name in os.listdir(staging_dir):
+            os.remove(os.path.join(staging_dir, name))
+        os.rmdir(staging_dir)
+
+    def dead_ratio(self):
+        """Share of the indexed segment bytes held by superseded lines and tombstones."""
+        total = sum(self.segments.values())
+        live = sum(length for _, _, length in self.records.values())
+        return 1.0 - live / total if total else 0.0
+
+    def compact_if_needed(self, max_dead_ratio=COMPACT_DEAD_RATIO):
+        """Runs compact() once dead lines pass max_dead_ratio of the store; returns whether it did."""
+        if self.read_only or self.dead_ratio() <= max_dead_ratio:
+            return False
+        self.compact()
+        return True
+
+    def export_parquet(self, path, columns=None, chunk_rows=EXPORT_CHUNK_ROWS):
+        """
+        Columnar export for analytics (needs pyarrow). stream() is written chunk_rows at a
+        time through a ParquetWriter, one row group per chunk, so memory stays flat.
+        The first chunk fixes the schema (all-null columns become strings); later records are
+        cast to it, so pass 'columns' to pin the exported fields. Returns the rows written.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        writer = None
+        count = 0
+
+        def write_chunk(rows):
+            nonlocal writer, count
+            if writer is None:
+                schema = pa.Table.from_pylist(rows).schema
+                writer = pq.ParquetWriter(path, pa.schema(
+                    [field.with_type(pa.string()) if pa.types.is_null(field.type) else field for field in schema]))
+            writer.write_table(pa.Table.from_pylist(rows, schema=writer.schema))
+            count += len(rows)
+
+        rows = []
+        try:
+            for candidate_id, record in self.stream(columns):
+                rows.append(dict(record, candidate_id=candidate_id))
+                if len(rows) == chunk_rows:
+                    write_chunk(rows)
+                    rows = []
+            if rows or writer is None:
+                write_chunk(rows)
+        finally:
+            if writer is not None:
+                writer.close()
+        return count
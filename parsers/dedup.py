@@ -0,0 +1,156 @@
+import os
+import re
+import zlib
+import numpy as np
+
+# Universal hashing modulo the largest 32-bit prime: a * x stays below 2**64, so uint64 never overflows
+PRIME = (1 << 32) - 5
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def shingles(text, size=5):
+    """Set of overlapping word n-grams ('w-shingles') of the lower-cased text."""
+    words = WORD_PATTERN.findall(text.lower())
+    if len(words) < size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def optimal_bands(num_perm, threshold):
+    """
+    Picks (bands, rows) with bands * rows == num_perm that minimizes false positives
+    plus false negatives around the Jaccard threshold. A pair lands in a shared bucket
+    with probability 1 - (1 - s**rows)**bands, an S-curve that steepens near the threshold.
+    """
+    grid = np.linspace(0.0, 1.0, 201)
+    best, best_error = (num_perm, 1), None
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        collide = 1.0 - (1.0 - grid ** rows) ** bands
+        error = np.mean(np.where(grid < threshold, collide, 1.0 - collide))
+        if best_error is None or error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+
+class MinHasher:
+    """num_perm independent hash functions h(x) = (a * x + b) mod PRIME over crc32 shingle ids."""
+
+    def __init__(self, num_perm=128, shingle_size=5, seed=1):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = np.random.RandomState(seed)
+        self.a = rng.randint(1, PRIME, size=num_perm, dtype=np.uint64)
+        self.b = rng.randint(0, PRIME, size=num_perm, dtype=np.uint64)
+
+    def signature(self, text):
+        """MinHash signature: per hash function, the smallest hash over all shingles."""
+        grams = shingles(text, self.shingle_size)
+        if not grams:
+            return np.full(self.num_perm, PRIME, dtype=np.uint64)
+        ids = np.fromiter((zlib.crc32(gram.encode("utf-8")) for gram in grams), dtype=np.uint64, count=len(grams))
+        hashes = (np.outer(ids, self.a) % PRIME + self.b) % PRIME
+        return hashes.min(axis=0)
+
+
+class NearDuplicateIndex:
+    """
+    Near-duplicate resume detection in sub-linear time (MinHash + LSH banding).
+    Each signature is cut into bands; resumes sharing any band bucket become candidates,
+    and only those few are verified against the threshold. No all-pairs comparison.
+    Keys are candidate ids; the first copy seen of a resume is its canonical copy.
+    """
+
+    def __init__(self, threshold=0.8, num_perm=128, shingle_size=5, seed=1):
+        self.threshold = threshold
+        self.seed = seed
+        self.hasher = MinHasher(num_perm, shingle_size, seed)
+        self.bands, self.rows = optimal_bands(num_perm, threshold)
+        self.buckets = [{} for _ in range(self.bands)]  # per band: band bytes -> [keys]
+        self.signatures = {}  # key -> signature
+
+    def __len__(self):
+        return len(self.signatures)
+
+    def _band_keys(self, signature):
+        return [signature[band * self.rows:(band + 1) * self.rows].tobytes() for band in range(self.bands)]
+
+    @staticmethod
+    def similarity(signature_a, signature_b):
+        """Estimated Jaccard similarity: share of hash functions whose minima agree."""
+        return float(np.mean(signature_a == signature_b))
+
+    def add(self, key, signature):
+        self.remove(key)
+        self.signatures[key] = signature
+        for buckets, band_key in zip(self.buckets, self._band_keys(signature)):
+            buckets.setdefault(band_key, []).append(key)
+
+    def remove(self, key):
+        signature = self.signatures.pop(key, None)
+        if signature is None:
+            return
+        for buckets, band_key in zip(self.buckets, self._band_keys(signature)):
+            keys = buckets.get(band_key, [])
+            if key in keys:
+                keys.remove(key)
+            if not keys:
+                buckets.pop(band_key, None)
+
+    def query(self, signature, exclude=None):
+        """Returns (best key, similarity) among bucket neighbours at or above the threshold, else (None, 0.0)."""
+        neighbours = set()
+        for buckets, band_key in zip(self.buckets, self._band_keys(signature)):
+            neighbours.update(buckets.get(band_key, ()))
+        neighbours.discard(exclude)
+
+        best, best_score = None, 0.0
+        for key in sorted(neighbours):
+            score = self.similarity(signature, self.signatures[key])
+            if score >= self.threshold and score > best_score:
+                best, best_score = key, score
+        return best, best_score
+
+    def check(self, key, text):
+        """
+        Returns the canonical key this text is a near-duplicate of, or None.
+        A new (non-duplicate) text is registered as canonical under 'key'.
+        """
+        return self.check_signature(key, self.hasher.signature(text))
+
+    def check_signature(self, key, signature):
+        """check() for a signature computed elsewhere (e.g. in a worker process)."""
+        canonical, _ = self.query(signature, exclude=key)
+        if canonical is None:
+            self.add(key, signature)
+        else:
+            # 'key' may have been canonical for an older version of its text: forget that text
+            self.remove(key)
+        return canonical
+
+    # ---------- persistence ----------
+    def save(self, path):
+        keys = list(self.signatures)
+        signatures = np.array([self.signatures[key] for key in keys], dtype=np.uint64).reshape(len(keys), self.hasher.num_perm)
+        tmp_path = path + ".tmp.npz"
+        np.savez(tmp_path, keys=np.array(keys, dtype=str), signatures=signatures,
+                 params=np.array([self.threshold, self.hasher.num_perm, self.hasher.shingle_size, self.seed]))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path, threshold=None):
+        """Signatures don't depend on the threshold: a different one just re-buckets them."""
+        data = np.load(path)
+        saved_threshold, num_perm, shingle_size, seed = data["params"]
+        index = cls(float(saved_threshold if threshold is None else threshold), int(num_perm), int(shingle_size), int(seed))
+        for key, signature in zip(data["keys"], data["signatures"]):
+            index.add(str(key), signature.copy())
+        return index
+
+    @classmethod
+    def load_or_create(cls, path, threshold=0.8):
+        if os.path.exists(path):
+            return cls.load(path, threshold)
+        return cls(threshold)
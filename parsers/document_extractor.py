@@ -0,0 +1,96 @@
+import io
+import fitz  # PyMuPDF for PDF
+import docx  # python-docx for Word
+
+# Hard limits so a 300-page "resume" can't eat the batch
+MAX_PAGES = 15
+MAX_CHARS = 60000
+# If this many leading pages have no text layer, treat the file as a flattened image
+IMAGE_ONLY_PROBE_PAGES = 3
+
+
+def _result(text="", status="ok", pages_read=0, page_count=0, truncated=False, error=None):
+    """Uniform extraction result, so callers can branch on 'status' instead of sniffing text."""
+    return {
+        "text": text,
+        "status": status,  # "ok" | "image_only" | "error"
+        "pages_read": pages_read,
+        "page_count": page_count,
+        "truncated": truncated,
+        "error": error
+    }
+
+
+def extract_pdf(source, max_pages=MAX_PAGES, max_chars=MAX_CHARS):
+    """
+    Reads a PDF from a path or from in-memory bytes.
+    Page texts are collected in a list and joined once; reading stops at the page
+    or character cap, or as soon as the first pages prove there is no text layer.
+    """
+    try:
+        if isinstance(source, (bytes, bytearray)):
+            doc = fitz.open(stream=bytes(source), filetype="pdf")
+        else:
+            doc = fitz.open(source)
+    except Exception as e:
+        return _result(status="error", error=str(e))
+
+    with doc:
+        page_count = doc.page_count
+        parts = []
+        chars = 0
+        pages_read = 0
+        truncated = page_count > max_pages
+
+        for page_number in range(min(page_count, max_pages)):
+            page_text = doc[page_number].get_text()
+            pages_read += 1
+            parts.append(page_text)
+            chars += len(page_text)
+
+            # Early exit: a Canva-style export has no text on its first pages
+            if pages_read == IMAGE_ONLY_PROBE_PAGES and not any(p.strip() for p in parts):
+                return _result(status="image_only", pages_read=pages_read, page_count=page_count)
+
+            if chars >= max_chars:
+                truncated = True
+                break
+
+    text = "".join(parts)[:max_chars]
+    if not text.strip():
+        return _result(status="image_only", pages_read=pages_read, page_count=page_count)
+    return _result(text=text, pages_read=pages_read, page_count=page_count, truncated=truncated)
+
+
+def extract_docx(source, max_chars=MAX_CHARS):
+    """Reads a DOCX from a path or from in-memory bytes, with the same character cap."""
+    try:
+        if isinstance(source, (bytes, bytearray)):
+            source = io.BytesIO(source)
+        doc = docx.Document(source)
+    except Exception as e:
+        return _result(status="error", error=str(e))
+
+    parts = []
+    chars = 0
+    truncated = False
+    for para in doc.paragraphs:
+        parts.append(para.text + "\n")
+        chars += len(para.text) + 1
+        if chars >= max_chars:
+            truncated = True
+            break
+
+    text = "".join(parts)[:max_chars]
+    if not text.strip():
+        return _result(status="image_only", pages_read=1, page_count=1)
+    return _result(text=text, pages_read=1, page_count=1, truncated=truncated)
+
+
+def extract_document(filename, source, max_pages=MAX_PAGES, max_chars=MAX_CHARS):
+    """Dispatches on the file extension. Returns None for unsupported file types."""
+    if filename.endswith(".pdf"):
+        return extract_pdf(source, max_pages=max_pages, max_chars=max_chars)
+    elif filename.endswith(".docx"):
+        return extract_docx(source, max_chars=max_chars)
+    return None
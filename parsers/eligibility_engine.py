@@ -1,11 +1,13 @@
 import os
 import json
+import numpy as np
 
 class EligibilityEngine:
     def __init__(self):
         base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         self.rules_path = os.path.join(base_dir, "data", "demo_dataset", "eligibility_rules.json")
         self.rules = self._load_rules()
+        self._plans = {}  # role_name -> compiled plan
 
     def _load_rules(self):
         try:
@@ -19,27 +21,46 @@ class EligibilityEngine:
         """Edge Case Handling from Company Spec"""
         return value if value is not None else default
 
+    def compile_plan(self, role_name):
+        """
+        Compiles a role's rules ONCE: lowercased frozensets for skills and locations
+        and plain numeric bounds. Later calls for the same role reuse the plan.
+        """
+        plan = self._plans.get(role_name)
+        if plan is None:
+            job_rules = self.rules.get(role_name, {})
+            plan = {
+                "min_ats_score": job_rules.get("min_ats_score", 70),
+                "mandatory_skills": frozenset(s.lower() for s in job_rules.get("mandatory_skills", [])),
+                "min_exp": job_rules.get("experience", {}).get("min_years", 0),
+                "max_exp": job_rules.get("experience", {}).get("max_years", 10),
+                "allowed_locations": frozenset(loc.lower() for loc in job_rules.get("allowed_locations", [])),
+                "availability_required": job_rules.get("availability_required", False)
+            }
+            self._plans[role_name] = plan
+        return plan
+
     def evaluate_candidate(self, candidate_data, ats_score, role_name):
         """Evaluates candidate and returns Company Spec JSON structure"""
-        job_rules = self.rules.get(role_name, {})
+        plan = self.compile_plan(role_name)
         
         # 1. Extract Candidate Data safely
         candidate_id = self.safe_value(candidate_data.get("filename"), "Unknown")
-        candidate_skills = [s.lower() for s in self.safe_value(candidate_data.get("skills", []), [])]
+        candidate_skills = {s.lower() for s in self.safe_value(candidate_data.get("skills", []), [])}
         candidate_exp = self.safe_value(candidate_data.get("experience_years"), 0)
         candidate_loc = self.safe_value(candidate_data.get("location", ""), "").lower()
         candidate_avail = self.safe_value(candidate_data.get("available", True), True)
 
-        # 2. Extract Rules safely (with defaults)
-        min_ats_score = job_rules.get("min_ats_score", 70)
-        mandatory_skills = [s.lower() for s in job_rules.get("mandatory_skills", [])]
-        min_exp = job_rules.get("experience", {}).get("min_years", 0)
-        max_exp = job_rules.get("experience", {}).get("max_years", 10)
-        allowed_locations = [loc.lower() for loc in job_rules.get("allowed_locations", [])]
-        req_availability = job_rules.get("availability_required", False)
+        # 2. Rules come pre-compiled (with defaults) from the role plan
+        min_ats_score = plan["min_ats_score"]
+        mandatory_skills = plan["mandatory_skills"]
+        min_exp = plan["min_exp"]
+        max_exp = plan["max_exp"]
+        allowed_locations = plan["allowed_locations"]
+        req_availability = plan["availability_required"]
 
         # 3. Perform Checks
-        skill_ok = all(skill in candidate_skills for skill in mandatory_skills) if mandatory_skills else True
+        skill_ok = mandatory_skills <= candidate_skills  # Subset test: O(len(mandatory_skills))
         exp_ok = min_exp <= candidate_exp <= max_exp
         loc_ok = (candidate_loc in allowed_locations) if allowed_locations else True
         avail_ok = candidate_avail if req_availability else True
@@ -63,4 +84,82 @@ class EligibilityEngine:
                 "location_match": loc_ok,
                 "availability_match": avail_ok
             }
-        }
\ No newline at end of file
+        }
+
+    @staticmethod
+    def _column(candidates, key, count, default):
+        """One column of a columnar table (pandas DataFrame or dict of lists); missing -> default."""
+        if hasattr(candidates, "columns"):
+            return candidates[key].tolist() if key in candidates.columns else [default] * count
+        return list(candidates.get(key, [default] * count))
+
+    @staticmethod
+    def _typed_column(values, types, default):
+        """
+        Replaces missing cells with the default: None, NaN, pd.NA (pandas' string NA), or any
+        value of the wrong type (e.g. a float NaN where a string or list was expected).
+        """
+        return [v if isinstance(v, types) and not (isinstance(v, float) and v != v) else default for v in values]
+
+    def evaluate_batch(self, candidates, ats_scores, role_name, skill_index=None):
+        """
+        Columnar evaluate_candidate: 'candidates' is a DataFrame or dict of columns
+        (filename, skills, experience_years, location, available), 'ats_scores' one score per row.
+        Returns status and per-check arrays; row for row the same decisions as evaluate_candidate.
+        With a SkillBitsetIndex holding every filename, the skill check is a bitset AND + popcount
+        instead of lowercasing each skill list (the 'skills' column is then not needed).
+        """
+        plan = self.compile_plan(role_name)
+        ats_scores = np.asarray(ats_scores, dtype=float)
+        count = len(ats_scores)
+
+        # 1. Numeric checks: one vectorized comparison each
+        exp = np.array(self._typed_column(self._column(candidates, "experience_years", count, None),
+                                          (int, float, np.number), 0), dtype=float)
+        exp = np.nan_to_num(exp, nan=0.0)
+        exp_ok = (plan["min_exp"] <= exp) & (exp <= plan["max_exp"])
+
+        # 2. Set checks against the compiled frozensets
+        mandatory = plan["mandatory_skills"]
+        filenames = self._typed_column(self._column(candidates, "filename", count, None), str, None)
+        if mandatory and skill_index is not None and all(name in skill_index for name in filenames):
+            skill_ok = skill_index.has_all(mandatory, skill_index.rows_for(filenames))
+        elif mandatory:
+            skill_ok = np.fromiter(
+                (mandatory.issubset(s.lower() for s in skills if isinstance(s, str)) for skills in
+                 self._typed_column(self._column(candidates, "skills", count, []), (list, tuple, set, np.ndarray), [])),
+                dtype=bool, count=count)
+        else:
+            skill_ok = np.ones(count, dtype=bool)
+
+        allowed = plan["allowed_locations"]
+        if allowed:
+            loc_ok = np.fromiter((loc.lower() in allowed for loc in
+                                  self._typed_column(self._column(candidates, "location", count, ""), str, "")),
+                                 dtype=bool, count=count)
+        else:
+            loc_ok = np.ones(count, dtype=bool)
+
+        if plan["availability_required"]:
+            avail_ok = np.array([bool(v) for v in self._typed_column(
+                self._column(candidates, "available", count, True), (bool, np.bool_, int, float, np.number), True)],
+                dtype=bool)
+        else:
+            avail_ok = np.ones(count, dtype=bool)
+
+        # 3. Company Decision Logic, as masks
+        eligible = (ats_scores >= plan["min_ats_score"]) & skill_ok & exp_ok & loc_ok & avail_ok
+        review = ~eligible & (ats_scores >= plan["min_ats_score"] - 15)
+        status = np.where(eligible, "Eligible", np.where(review, "Review", "Rejected"))
+
+        return {
+            "candidate_id": [self.safe_value(v, "Unknown") for v in filenames],
+            "eligibility_status": status,
+            "checks": {
+                "ats_score": ats_scores,
+                "skill_match": skill_ok,
+                "experience_match": exp_ok,
+                "location_match": loc_ok,
+                "availability_match": avail_ok
+            }
+        }
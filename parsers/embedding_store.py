@@ -0,0 +1,215 @@
+import os
+import re
+import json
+import atexit
+import hashlib
+import functools
+import threading
+import numpy as np
+from parsers.vector_codec import check_precision, quantize, dequantize
+
+# File suffix per storage precision
+_SUFFIXES = {"float32": "f32", "float16": "f16", "int8": "i8"}
+
+
+def _locked(method):
+    """Serializes a store method: scoring threads share one store."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class EmbeddingStore:
+    """
+    Persistent on-disk embedding cache shared by every process.
+    Layout per model:  <root>/<model>/vectors.f32  (raw float32 rows, append-only)
+                       <root>/<model>/index.json   ({text hash: row number})
+    Readers memory-map the vectors file read-only, so lookups are zero-copy and the
+    page cache is shared between worker processes. Only one process should write.
+    Compact stores (precision='float16' or 'int8') live in <model>-<precision>/;
+    int8 rows keep a per-vector float32 scale in scales.f32.
+    """
+
+    def __init__(self, root_dir, model_name, dim, read_only=False, flush_every=256, precision="float32"):
+        self.model_name = model_name
+        self.dim = dim
+        self.precision = precision
+        self.dtype = check_precision(precision)
+        self.read_only = read_only
+        self.flush_every = flush_every
+        self._lock = threading.RLock()
+
+        folder = re.sub(r"[^A-Za-z0-9_.-]", "_", model_name)
+        if precision != "float32":
+            folder += "-" + precision
+        self.store_dir = os.path.join(root_dir, folder)
+        self.vectors_path = os.path.join(self.store_dir, "vectors." + _SUFFIXES[precision])
+        self.scales_path = os.path.join(self.store_dir, "scales.f32") if precision == "int8" else None
+        self.index_path = os.path.join(self.store_dir, "index.json")
+        if not read_only:
+            os.makedirs(self.store_dir, exist_ok=True)
+            atexit.register(self.flush)
+
+        self._pending = {}  # key -> (codes, scale), not yet on disk (or a private overlay when read-only)
+        self.refresh()
+
+    # ---------- keys ----------
+    @staticmethod
+    def normalize(text):
+        """MiniLM is uncased and whitespace-insensitive, so 'Python ' and 'python' share a vector."""
+        return " ".join(str(text).lower().split())
+
+    def key(self, text):
+        return hashlib.sha1(self.normalize(text).encode("utf-8")).hexdigest()
+
+    # ---------- loading ----------
+    @_locked
+    def refresh(self):
+        """(Re)loads the index and re-maps the vectors file, picking up rows other processes appended."""
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                self.index = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.index = {}
+
+        row_bytes = self.dim * self.dtype.itemsize
+        size = os.path.getsize(self.vectors_path) if os.path.exists(self.vectors_path) else 0
+        self._rows_on_disk = size // row_bytes
+        if self.scales_path:
+            scale_size = os.path.getsize(self.scales_path) if os.path.exists(self.scales_path) else 0
+            self._rows_on_disk = min(self._rows_on_disk, scale_size // 4)
+        if self._rows_on_disk:
+            self._vectors = np.memmap(self.vectors_path, dtype=self.dtype, mode="r",
+                                      shape=(self._rows_on_disk, self.dim))
+        else:
+            self._vectors = np.empty((0, self.dim), dtype=self.dtype)
+        self._scales = None
+        if self.scales_path:
+            self._scales = (np.memmap(self.scales_path, dtype=np.float32, mode="r", shape=(self._rows_on_disk,))
+                            if self._rows_on_disk else np.empty(0, dtype=np.float32))
+
+    def _decode(self, rows):
+        """float32 rows from the memory map (a view, no copy, when stored as float32)."""
+        if self.precision == "float32":
+            return self._vectors[rows]
+        return dequantize(self._vectors[rows], None if self._scales is None else self._scales[rows])
+
+    def _decode_pending(self, key):
+        codes, scale = self._pending[key]
+        return dequantize(codes, scale)
+
+    def __len__(self):
+        return len(self.index) + len(self._pending)
+
+    def __contains__(self, text):
+        key = self.key(text)
+        return key in self._pending or key in self.index
+
+    # ---------- lookups ----------
+    @_locked
+    def get(self, text):
+        """Returns the stored vector (a read-only view, no copy, for float32 stores) or None."""
+        key = self.key(text)
+        if key in self._pending:
+            return self._decode_pending(key)
+        row = self.index.get(key)
+        if row is None or row >= self._rows_on_disk:
+            return None
+        return self._decode(row)
+
+    @_locked
+    def get_many(self, texts):
+        """
+        Returns (matrix, missing): a float32 (len(texts), dim) matrix filled with every
+        stored vector, plus the positions in 'texts' that still need encoding.
+        """
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        missing = []
+        rows, positions = [], []
+        for position, text in enumerate(texts):
+            key = self.key(text)
+            if key in self._pending:
+                matrix[position] = self._decode_pending(key)
+                continue
+            row = self.index.get(key)
+            if row is None or row >= self._rows_on_disk:
+                missing.append(position)
+            else:
+                rows.append(row)
+                positions.append(position)
+        if rows:
+            # One fancy-indexed gather from the memory map
+            matrix[positions] = self._decode(rows)
+        return matrix, missing
+
+    # ---------- writes ----------
+    @_locked
+    def add_many(self, texts, vectors):
+        """Encodes new embeddings at the store's precision and queues them; flushed in batches of flush_every."""
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(len(texts), self.dim)
+        codes, scales = quantize(vectors, self.precision)
+        for position, text in enumerate(texts):
+            key = self.key(text)
+            if key not in self.index:
+                self._pending[key] = (codes[position], None if scales is None else scales[position])
+        if not self.read_only and len(self._pending) >= self.flush_every:
+            self.flush()
+
+    @_locked
+    def flush(self):
+        """Appends queued vectors to the file, then atomically publishes the new index."""
+        if self.read_only or not self._pending:
+            return
+        keys = list(self._pending)
+        block = np.stack([self._pending[key][0] for key in keys]).astype(self.dtype, copy=False)
+
+        # Vectors first, index second: a crash in between only leaves orphan rows,
+        # which compact() reclaims, never an index entry pointing at missing data
+        with open(self.vectors_path, "ab") as f:
+            f.write(block.tobytes())
+        if self.scales_path:
+            with open(self.scales_path, "ab") as f:
+                f.write(np.array([self._pending[key][1] for key in keys], dtype=np.float32).tobytes())
+        first_row = self._rows_on_disk
+        for offset, key in enumerate(keys):
+            self.index[key] = first_row + offset
+        self._write_index()
+
+        self._pending = {}
+        self.refresh()
+
+    def _write_index(self):
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.index, f)
+        os.replace(tmp_path, self.index_path)
+
+    @_locked
+    def compact(self):
+        """Rewrites the vectors file with only the rows the index references (drops orphans)."""
+        if self.read_only:
+            raise PermissionError("Cannot compact a read-only EmbeddingStore")
+        self.flush()
+        live = sorted((row, key) for key, row in self.index.items() if row < self._rows_on_disk)
+        rows = [row for row, _ in live]
+        block = np.asarray(self._vectors[rows], dtype=self.dtype) if rows else np.empty((0, self.dim), self.dtype)
+        scales = np.asarray(self._scales[rows], dtype=np.float32) if self.scales_path and rows else np.empty(0, np.float32)
+
+        tmp_path = self.vectors_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(block.tobytes())
+        if self.scales_path:
+            with open(self.scales_path + ".tmp", "wb") as f:
+                f.write(scales.tobytes())
+        # Release the old mappings before replacing the files
+        self._vectors = None
+        self._scales = None
+        os.replace(tmp_path, self.vectors_path)
+        if self.scales_path:
+            os.replace(self.scales_path + ".tmp", self.scales_path)
+
+        self.index = {key: new_row for new_row, (_, key) in enumerate(live)}
+        self._write_index()
+        self.refresh()
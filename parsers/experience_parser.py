@@ -1,5 +1,45 @@
 import re
 from datetime import datetime
+from functools import lru_cache
+
+_YEAR_ONLY = re.compile(r"\d{4}")
+_MONTH_YEAR = re.compile(r"(\d{2})/(\d{4})")
+
+@lru_cache(maxsize=4096)
+def _parse_date_token(date_str):
+    """
+    Memoized core of parse_date, keyed on the raw token ("Jan 2020", "03/2021", ...).
+    Returns (year, month), or None for 'Present'/'Current' and unparseable tokens,
+    which callers resolve to today's month (never cached, since today moves).
+    """
+    date_str = date_str.strip().lower()
+    if date_str in ["present", "current"]:
+        return None
+
+    if _YEAR_ONLY.fullmatch(date_str):
+        return int(date_str), 1
+
+    mm_match = _MONTH_YEAR.fullmatch(date_str)
+    if mm_match:
+        parsed = datetime(int(mm_match.group(2)), int(mm_match.group(1)), 1)  # Validates the month
+        return parsed.year, parsed.month
+
+    for fmt in ("%b %Y", "%B %Y"):
+        try:
+            parsed = datetime.strptime(date_str.title(), fmt)
+            return parsed.year, parsed.month
+        except ValueError:
+            continue
+
+    return None # Fallback safety
+
+def _month_index(year, month):
+    """Months since year 0, so durations and overlaps are plain integer math."""
+    return year * 12 + (month - 1)
+
+def _today_index():
+    today = datetime.today()
+    return _month_index(today.year, today.month)
 
 class ExperienceParser:
     def __init__(self):
@@ -15,29 +55,37 @@ class ExperienceParser:
             "Investment Banker", "Portfolio Manager", "Software Engineer",
             "Business Analyst", "Quantitative Equity Analyst"
         ]
+        # Title matcher: lowercase every title once instead of once per dated line
+        self._title_keys = [(title, title.lower()) for title in self.common_titles]
 
     def parse_date(self, date_str):
         """Converts strings into exact datetime objects."""
-        date_str = date_str.strip().lower()
-        if date_str in ["present", "current"]:
+        parsed = _parse_date_token(date_str)
+        if parsed is None:
             return datetime.today()
-        
-        if re.fullmatch(r"\d{4}", date_str):
-            return datetime(int(date_str), 1, 1)
-            
-        mm_match = re.fullmatch(r"(\d{2})/(\d{4})", date_str)
-        if mm_match:
-            return datetime(int(mm_match.group(2)), int(mm_match.group(1)), 1)
-            
-        for fmt in ("%b %Y", "%B %Y"):
-            try:
-                return datetime.strptime(date_str.title(), fmt)
-            except ValueError:
-                continue
-                
-        return datetime.today() # Fallback safety
+        return datetime(parsed[0], parsed[1], 1)
+
+    def _date_index(self, date_str, today_index):
+        """Same rules as parse_date, but as an integer month index."""
+        parsed = _parse_date_token(date_str)
+        return today_index if parsed is None else _month_index(*parsed)
+
+    def _match_title(self, previous_line, line):
+        previous_lower = previous_line.lower()
+        line_lower = line.lower()
+        for title, title_lower in self._title_keys:
+            if title_lower in previous_lower or title_lower in line_lower:
+                return title
+        return "Unknown Title"
+
+    def parse_experience_many(self, experience_texts):
+        """Batch API: parses many resumes' experience sections against one shared 'today'."""
+        today_index = _today_index()
+        return [self.parse_experience(text, today_index) for text in experience_texts]
 
-    def parse_experience(self, experience_text):
+    def parse_experience(self, experience_text, today_index=None):
+        if today_index is None:
+            today_index = _today_index()
         jobs = []
         lines = experience_text.split('\n')
         previous_line = ""
@@ -51,18 +99,13 @@ class ExperienceParser:
                 start_raw = date_match.group(1)
                 end_raw = date_match.group(2)
                 
-                start_date = self.parse_date(start_raw)
-                end_date = self.parse_date(end_raw)
+                start_index = self._date_index(start_raw, today_index)
+                end_index = self._date_index(end_raw, today_index)
                 
                 # Calculate duration in months
-                duration_months = (end_date.year - start_date.year) * 12 + (end_date.month - start_date.month)
-                duration_months = max(duration_months, 1)
+                duration_months = max(end_index - start_index, 1)
                 
-                found_title = "Unknown Title"
-                for title in self.common_titles:
-                    if title.lower() in previous_line.lower() or title.lower() in line.lower():
-                        found_title = title
-                        break
+                found_title = self._match_title(previous_line, line)
                 
                 company = "Unknown Company"
                 if " at " in previous_line.lower():
@@ -76,8 +119,8 @@ class ExperienceParser:
                     "job_title": found_title,
                     "company": company,
                     "duration": f"{start_raw} - {end_raw}",
-                    "start_date": start_date,  # Kept temporarily for timeline math
-                    "end_date": end_date,      # Kept temporarily for timeline math
+                    "start_index": start_index,  # Kept temporarily for timeline math
+                    "end_index": end_index,      # Kept temporarily for timeline math
                     "duration_months": duration_months
                 })
             previous_line = line 
@@ -86,10 +129,10 @@ class ExperienceParser:
         total_months = self._calculate_merged_months(jobs)
         gaps = self._detect_gaps(jobs)
 
-        # Clean up datetime objects before saving to JSON
+        # Clean up timeline fields before saving to JSON
         for job in jobs:
-            del job["start_date"]
-            del job["end_date"]
+            del job["start_index"]
+            del job["end_index"]
 
         return {
             "experience_entries": jobs,
@@ -100,7 +143,7 @@ class ExperienceParser:
     def _calculate_merged_months(self, jobs):
         """Prevents double-counting overlapping jobs."""
         if not jobs: return 0
-        periods = [(job["start_date"], job["end_date"]) for job in jobs]
+        periods = [(job["start_index"], job["end_index"]) for job in jobs]
         periods.sort(key=lambda x: x[0])
         
         merged = [periods[0]]
@@ -111,7 +154,7 @@ class ExperienceParser:
             else:
                 merged.append(current)
                 
-        total_months = sum((end.year - start.year) * 12 + (end.month - start.month) for start, end in merged)
+        total_months = sum(end - start for start, end in merged)
         return max(total_months, 1)
 
     def _detect_gaps(self, jobs):
@@ -119,12 +162,12 @@ class ExperienceParser:
         gaps = []
         if len(jobs) < 2: return gaps
         
-        sorted_jobs = sorted(jobs, key=lambda x: x["start_date"])
+        sorted_jobs = sorted(jobs, key=lambda x: x["start_index"])
         for i in range(1, len(sorted_jobs)):
-            prev_end = sorted_jobs[i-1]["end_date"]
-            curr_start = sorted_jobs[i]["start_date"]
+            prev_end = sorted_jobs[i-1]["end_index"]
+            curr_start = sorted_jobs[i]["start_index"]
             
-            gap_months = (curr_start.year - prev_end.year) * 12 + (curr_start.month - prev_end.month)
+            gap_months = curr_start - prev_end
             if gap_months >= 6:
                 gaps.append({
                     "gap_duration_months": gap_months,
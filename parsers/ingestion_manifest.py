@@ -0,0 +1,90 @@
+import os
+import json
+import hashlib
+
+
+class IngestionManifest:
+    """
+    Remembers (path, mtime, size, hash) for every resume already ingested,
+    so each watch tick only has to parse what is new or modified.
+    """
+
+    def __init__(self, manifest_path, extensions=(".pdf", ".docx")):
+        self.manifest_path = manifest_path
+        self.extensions = extensions
+        self.entries = self._load()  # path -> {"mtime", "size", "hash", "output"}
+        self._pending = {}           # path -> stat/hash seen by the last scan, not yet processed
+
+    def _load(self):
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    @staticmethod
+    def hash_file(path):
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def scan(self, input_folder):
+        """
+        Returns (changed_paths, deleted_paths).
+        mtime + size is the cheap first check; files only get hashed when those moved,
+        so a 'touch' without a content change is not re-parsed.
+        """
+        changed = []
+        seen = set()
+
+        if os.path.exists(input_folder):
+            for entry in os.scandir(input_folder):
+                # Skip hidden system files like .DS_Store and anything we can't parse
+                if not entry.is_file() or entry.name.startswith('.') or not entry.name.endswith(self.extensions):
+                    continue
+                path = entry.path
+                seen.add(path)
+                stat = entry.stat()
+                known = self.entries.get(path)
+
+                if known and known["mtime"] == stat.st_mtime and known["size"] == stat.st_size:
+                    continue
+
+                digest = self.hash_file(path)
+                if known and known["hash"] == digest:
+                    # Same content, new timestamp: refresh the stat and move on
+                    known["mtime"], known["size"] = stat.st_mtime, stat.st_size
+                    continue
+
+                self._pending[path] = {"mtime": stat.st_mtime, "size": stat.st_size, "hash": digest}
+                changed.append(path)
+
+        deleted = [path for path in self.entries if path not in seen]
+        return changed, deleted
+
+    def mark_processed(self, path, output_name):
+        """
+        Commits the stat recorded by scan() once the file has been parsed.
+        Returns the output an earlier version of the file produced that this parse no longer
+        does (e.g. it used to parse and now FAILED), so the caller can clean it up; else None.
+        """
+        entry = self._pending.pop(path, None)
+        if entry is None:
+            return None
+        previous = (self.entries.get(path) or {}).get("output")
+        entry["output"] = output_name
+        self.entries[path] = entry
+        return previous if previous != output_name else None
+
+    def remove(self, path):
+        """Forgets a deleted file and returns the name of the output it had produced (if any)."""
+        entry = self.entries.pop(path, None)
+        return entry.get("output") if entry else None
+
+    def save(self):
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
@@ -1,8 +1,13 @@
 import os
 import re
 import json
+import textwrap
+import multiprocessing
+from functools import lru_cache
 from text_cleaner import clean_text
+from skill_matcher import SkillMatcher
 
+@lru_cache(maxsize=1)
 def load_skill_synonyms():
     path = os.path.join(os.path.dirname(__file__), '..', 'data', 'synonyms_db.json')
     try:
@@ -12,6 +17,17 @@ def load_skill_synonyms():
         print("⚠️ synonyms_db.json missing!")
         return {}
 
+def build_synonym_index(synonym_dict):
+    """One automaton over every synonym; each hit maps straight to its official skill."""
+    return SkillMatcher([(synonym, official_skill)
+                         for official_skill, synonyms in synonym_dict.items()
+                         for synonym in synonyms])
+
+@lru_cache(maxsize=1)
+def get_synonym_index():
+    """Built once per process from synonyms_db.json, then reused for every JD."""
+    return build_synonym_index(load_skill_synonyms())
+
 def extract_experience(text):
     match = re.search(r'(\d+)(?:\s*-\s*(\d+))?\s*(?:\+)?\s*years?', text, re.IGNORECASE)
     if match:
@@ -36,22 +52,16 @@ def extract_education(text):
         
     return ", ".join(degrees) if degrees else "Not Specified"
 
-def extract_skills(text, synonym_dict):
-    found_skills = set()
-    for official_skill, synonyms in synonym_dict.items():
-        for synonym in synonyms:
-            pattern = r'\b' + re.escape(synonym) + r'\b'
-            if re.search(pattern, text, re.IGNORECASE):
-                found_skills.add(official_skill)
-                break 
-    return list(found_skills)
+def extract_skills(text, synonym_dict=None):
+    # Default: the shared compiled index. A custom dict gets its own (one-off) index.
+    index = get_synonym_index() if synonym_dict is None else build_synonym_index(synonym_dict)
+    return list(index.find_all(text))
 
 def parse_jd(file_path):
     with open(file_path, 'r', encoding='utf-8') as f:
         raw_text = f.read()
     
     cleaned_text = clean_text(raw_text)
-    synonym_dict = load_skill_synonyms()
     
     jd_data = {
         "job_title": None,
@@ -76,18 +86,48 @@ def parse_jd(file_path):
         mandatory_text = cleaned_text
         nice_to_have_text = ""
         
-    jd_data["requirements"]["mandatory_skills"] = extract_skills(mandatory_text, synonym_dict)
-    jd_data["requirements"]["nice_to_have_skills"] = extract_skills(nice_to_have_text, synonym_dict)
+    jd_data["requirements"]["mandatory_skills"] = extract_skills(mandatory_text)
+    jd_data["requirements"]["nice_to_have_skills"] = extract_skills(nice_to_have_text)
     
     return jd_data
 
+def parse_jds(paths, output_path, workers=None, chunksize=16):
+    """
+    Batch entry point: parses JDs across a process pool and streams each result
+    into output_path as a JSON array, so the full database is never held in memory.
+    The array goes to output_path + ".tmp" first and replaces output_path only once
+    complete, so readers never see a half-written database (and a crash keeps the old one).
+    Results keep the order of 'paths'. Returns the number of JDs written.
+    """
+    workers = workers or os.cpu_count() or 1
+    count = 0
+    tmp_path = output_path + ".tmp"
+
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f, \
+                multiprocessing.Pool(processes=workers) as pool:
+            f.write("[")
+            for jd_data in pool.imap(parse_jd, paths, chunksize=chunksize):
+                # Same layout json.dump(..., indent=4) gives the whole list
+                f.write(",\n" if count else "\n")
+                f.write(textwrap.indent(json.dumps(jd_data, indent=4), " " * 4))
+                count += 1
+                print(f"✅ Processed: {os.path.basename(paths[count - 1])}")
+            f.write("\n]" if count else "]")
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    return count
+
 if __name__ == "__main__":
     base_dir = os.path.dirname(os.path.dirname(__file__))
     raw_dir = os.path.join(base_dir, "data", "raw_jds")
     processed_dir = os.path.join(base_dir, "data", "processed")    
     
     print("🚀 Starting Batch Job Description Parsing...\n")
-    master_database = []
     
     # --- THE CLEANING CREW ---
     for filename in os.listdir(processed_dir):
@@ -104,16 +144,9 @@ if __name__ == "__main__":
         
     files.sort(key=get_role_number)
             
-    # --- PROCESS ALL FILES IN EXACT NUMERICAL ORDER ---
-    for filename in files:
-        jd_path = os.path.join(raw_dir, filename)
-        result = parse_jd(jd_path)
-        master_database.append(result)
-        print(f"✅ Processed: {filename}")        
-            
-    # --- SAVE MASTER DATABASE ---
+    # --- PROCESS ALL FILES IN EXACT NUMERICAL ORDER (written incrementally) ---
     output_path = os.path.join(processed_dir, "master_jobs_db.json")
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(master_database, f, indent=4)      
+    jd_paths = [os.path.join(raw_dir, filename) for filename in files]
+    job_count = parse_jds(jd_paths, output_path)
           
-    print(f"\n🎉 Success! Compiling {len(master_database)} jobs in perfect numerical order!")
\ No newline at end of file
+    print(f"\n🎉 Success! Compiling {job_count} jobs in perfect numerical order!")
\ No newline at end of file
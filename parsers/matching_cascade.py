@@ -0,0 +1,180 @@
+import os
+import json
+from collections import Counter
+from functools import lru_cache
+import numpy as np
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
+# Stage names, in cascade order
+STAGES = ("exact", "alias", "pruned", "semantic")
+# Trigram sets memoized for the prune stage (skill texts repeat across candidates), LRU-bounded
+NGRAM_CACHE_SIZE = 65536
+
+
+def normalize(text):
+    return " ".join(str(text).lower().split())
+
+
+def char_ngrams(text, n=3):
+    """Padded character n-grams of the normalized text ('sql' -> ' sq', 'sql', 'ql ')."""
+    padded = f" {normalize(text)} "
+    return frozenset(padded[i:i + n] for i in range(max(1, len(padded) - n + 1)))
+
+
+@lru_cache(maxsize=NGRAM_CACHE_SIZE)
+def cached_trigrams(text):
+    return char_ngrams(text)
+
+
+class MatchingCascade:
+    """
+    Cheap-first skill matching in front of the sentence-transformer:
+      1. exact  - same text after normalization                   -> 1.0
+      2. alias  - both sides map to the same canonical skill
+                  (synonyms_db.json + skills_db.json aliases)      -> 1.0
+      3. pruned - character-trigram Jaccard below prune_threshold -> 0.0
+      4. semantic - everything still ambiguous goes to SemanticEngine
+    The SemanticEngine is only loaded the first time a pair reaches stage 4.
+    Pruning is off by default (prune_threshold=0.0): synonyms the dictionaries miss often
+    share no trigram at all ('Excel' / 'spreadsheets'), so any positive threshold drops
+    real matches. See performance_tuning/prune_threshold_benchmark.py before raising it.
+    """
+
+    def __init__(self, semantic_engine=None, prune_threshold=0.0,
+                 synonyms_path=None, skills_path=None):
+        self._semantic_engine = semantic_engine
+        self.threshold = semantic_engine.threshold if semantic_engine else 0.50
+        self.prune_threshold = prune_threshold
+        self.stats = Counter()
+
+        self.canonical = {}  # normalized term -> set of canonical skill names
+        self._load_synonyms(synonyms_path or os.path.join(DATA_DIR, "synonyms_db.json"))
+        self._load_skills(skills_path or os.path.join(DATA_DIR, "skills_db.json"))
+
+    # ---------- dictionaries ----------
+    def _add_terms(self, canonical_name, terms):
+        for term in [canonical_name] + list(terms):
+            if isinstance(term, str) and term.strip():
+                self.canonical.setdefault(normalize(term), set()).add(canonical_name)
+
+    def _load_synonyms(self, path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                synonyms = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            print(f"⚠️ Synonyms not loaded: {path}")
+            return
+        for canonical_name, aliases in synonyms.items():
+            self._add_terms(canonical_name, aliases)
+
+    def _load_skills(self, path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                skills = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            print(f"⚠️ Skills DB not loaded: {path}")
+            return
+        for entry in skills:
+            self._add_terms(entry["name"], entry.get("aliases", []))
+
+    @property
+    def semantic_engine(self):
+        if self._semantic_engine is None:
+            from parsers.semantic_engine import SemanticEngine
+            self._semantic_engine = SemanticEngine()
+        return self._semantic_engine
+
+    # ---------- lexical stages ----------
+    def ngram_similarity(self, text1, text2):
+        a, b = cached_trigrams(text1), cached_trigrams(text2)
+        return len(a & b) / len(a | b)
+
+    def lexical_match(self, text1, text2):
+        """Returns (score, stage) when the lexical stages settle the pair, else (None, 'semantic')."""
+        left, right = normalize(text1), normalize(text2)
+        if left == right:
+            return 1.0, "exact"
+        if self.canonical.get(left, set()) & self.canonical.get(right, set()):
+            return 1.0, "alias"
+        if self.ngram_similarity(left, right) < self.prune_threshold:
+            return 0.0, "pruned"
+        return None, "semantic"
+
+    def prune_recall(self, matching_pairs, thresholds):
+        """
+        Recall of the prune stage: per threshold, the share of (text1, text2) pairs that
+        SHOULD match and whose trigram Jaccard keeps them out of the 0.0 shortcut.
+        Pairs the exact/alias stages settle never reach pruning, so leave those out.
+        """
+        similarities = np.array([self.ngram_similarity(normalize(a), normalize(b)) for a, b in matching_pairs])
+        return {threshold: float(np.mean(similarities >= threshold)) if len(similarities) else 1.0
+                for threshold in thresholds}
+
+    # ---------- public API (mirrors SemanticEngine) ----------
+    def calculate_similarity(self, text1, text2):
+        if not text1 or not text2:
+            return 0.0
+        score, stage = self.lexical_match(text1, text2)
+        self.stats[stage] += 1
+        if score is None:
+            score = self.semantic_engine.calculate_similarity(text1, text2)
+        return score
+
+    def similarity_matrix(self, texts_a, texts_b):
+        """
+        Same shape and meaning as SemanticEngine.similarity_matrix, but only the
+        ambiguous rows/columns are sent to the transformer (in one batched call).
+        """
+        matrix = np.zeros((len(texts_a), len(texts_b)), dtype=np.float32)
+        ambiguous = []
+        for i, text1 in enumerate(texts_a):
+            for j, text2 in enumerate(texts_b):
+                if not text1 or not text2:
+                    continue
+                score, stage = self.lexical_match(text1, text2)
+                self.stats[stage] += 1
+                if score is None:
+                    ambiguous.append((i, j))
+                else:
+                    matrix[i, j] = score
+
+        if ambiguous:
+            rows = sorted({i for i, _ in ambiguous})
+            cols = sorted({j for _, j in ambiguous})
+            sub = self.semantic_engine.similarity_matrix([texts_a[i] for i in rows], [texts_b[j] for j in cols])
+            row_pos = {i: pos for pos, i in enumerate(rows)}
+            col_pos = {j: pos for pos, j in enumerate(cols)}
+            for i, j in ambiguous:
+                matrix[i, j] = sub[row_pos[i], col_pos[j]]
+        return matrix
+
+    def analyze_skill_gap(self, candidate_skills, jd_skills):
+        """Drop-in for SemanticEngine.analyze_skill_gap, scored through the cascade."""
+        if not jd_skills:
+            return {"score": 0.0, "matched": [], "missing": []}
+
+        if not candidate_skills:
+            return {"score": 0.0, "matched": [], "missing": list(jd_skills)}
+
+        similarity = self.similarity_matrix(jd_skills, candidate_skills)
+        best_match_scores = [round(float(score), 3) for score in similarity.max(axis=1)]
+
+        is_match = np.array(best_match_scores) >= self.threshold
+        return {
+            "score": round(sum(best_match_scores) / len(jd_skills), 3),
+            "matched": [skill for skill, hit in zip(jd_skills, is_match) if hit],
+            "missing": [skill for skill, hit in zip(jd_skills, is_match) if not hit]
+        }
+
+    # ---------- tuning report ----------
+    def hit_rates(self):
+        """Share of pairs settled by each stage (0.0 for stages that never fired)."""
+        total = sum(self.stats.values())
+        return {stage: (self.stats[stage] / total if total else 0.0) for stage in STAGES}
+
+    def print_report(self):
+        total = sum(self.stats.values())
+        print(f"\n📊 Matching cascade: {total} pairs")
+        for stage, rate in self.hit_rates().items():
+            print(f"   {stage:<9} {self.stats[stage]:>8}  ({rate:.1%})")
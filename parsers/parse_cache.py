@@ -0,0 +1,129 @@
+import os
+import json
+import time
+import hashlib
+from collections import OrderedDict
+
+
+def fingerprint(version, *paths):
+    """
+    Hashes the parser version plus the contents of every config file it depends on
+    (e.g. skill_patterns.json). Any change produces new cache keys, so stale parses are never served.
+    """
+    digest = hashlib.sha256(str(version).encode("utf-8"))
+    for path in paths:
+        digest.update(b"\0")
+        try:
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        except FileNotFoundError:
+            digest.update(b"<missing>")
+    return digest.hexdigest()[:16]
+
+
+class ParseCache:
+    """
+    Content-addressed cache of parse results.
+    Key = sha256(file bytes) + parser fingerprint, so renamed or re-uploaded copies still hit,
+    and any edit to the file (or to the parser / skill DB) is a guaranteed miss.
+    """
+
+    def __init__(self, cache_dir, parser_fingerprint, max_bytes=512 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.objects_dir = os.path.join(cache_dir, "objects")
+        self.index_path = os.path.join(cache_dir, "index.json")
+        self.parser_fingerprint = parser_fingerprint
+        self.max_bytes = max_bytes
+        os.makedirs(self.objects_dir, exist_ok=True)
+
+        # key -> {"size": bytes on disk, "last_used": unix time}, least recently used first
+        self.index = self._load_index()
+        self.total_bytes = sum(entry["size"] for entry in self.index.values())
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return OrderedDict()
+        # Saved in LRU order already; sorting once here also orders index files written before that
+        return OrderedDict(sorted(index.items(), key=lambda item: item[1]["last_used"]))
+
+    def _object_path(self, key):
+        return os.path.join(self.objects_dir, key + ".json")
+
+    def key_for(self, file_bytes):
+        """Builds the cache key for a file's raw bytes."""
+        return hashlib.sha256(file_bytes).hexdigest() + "-" + self.parser_fingerprint
+
+    def get(self, key):
+        """Returns the cached parse result, or None on a miss."""
+        entry = self.index.get(key)
+        if entry is not None:
+            try:
+                with open(self._object_path(key), "r", encoding="utf-8") as f:
+                    result = json.load(f)
+                entry["last_used"] = time.time()
+                self.index.move_to_end(key)
+                self.hits += 1
+                return result
+            except (FileNotFoundError, json.JSONDecodeError):
+                # The object vanished or is corrupt: forget it and treat as a miss
+                self._remove(key)
+        self.misses += 1
+        return None
+
+    def put(self, key, result):
+        """Stores a parse result, then evicts least-recently-used entries over the size budget."""
+        payload = json.dumps(result).encode("utf-8")
+        with open(self._object_path(key), "wb") as f:
+            f.write(payload)
+
+        if key in self.index:
+            self.total_bytes -= self.index[key]["size"]
+        self.index[key] = {"size": len(payload), "last_used": time.time()}
+        self.index.move_to_end(key)
+        self.total_bytes += len(payload)
+        self._evict()
+
+    def _remove(self, key):
+        entry = self.index.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry["size"]
+        self._delete_object(key)
+
+    def _delete_object(self, key):
+        try:
+            os.remove(self._object_path(key))
+        except FileNotFoundError:
+            pass
+
+    def _evict(self):
+        """Drops entries from the cold end of the LRU order until the cache fits its budget."""
+        while self.total_bytes > self.max_bytes and self.index:
+            key, entry = self.index.popitem(last=False)
+            self.total_bytes -= entry["size"]
+            self._delete_object(key)
+            self.evictions += 1
+
+    def save(self):
+        """Persists the index (write-then-rename so a crash never leaves a half-written file)."""
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.index, f)
+        os.replace(tmp_path, self.index_path)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self.index),
+            "bytes": self.total_bytes
+        }
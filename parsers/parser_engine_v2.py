@@ -1,22 +1,52 @@
-import fitz  # PyMuPDF for PDF
-import docx  # python-docx for Word
 import re
 import spacy
 import json
 import os
 import csv
+import time
+import argparse
+import functools
+import multiprocessing
 import concurrent.futures  # <-- NEW: Added for parallel processing
 from text_cleaner import clean_text  # Import your new helper
+from document_extractor import extract_document, extract_pdf, extract_docx
+from skill_matcher import SkillMatcher
+from resume_segmenter import ResumeSegmenter
+from parse_cache import ParseCache, fingerprint
+from ingestion_manifest import IngestionManifest
+from candidate_store import CandidateStore, STORE_DIRNAME
+from collections import deque
+from dedup import NearDuplicateIndex, MinHasher
+from skill_bitset import SkillBitsetIndex, SKILL_INDEX_FILENAME
 
-# Load AI Model
-nlp = spacy.load("en_core_web_sm")
+# Bump whenever parse logic changes: it invalidates every cached parse
+PARSER_VERSION = "2.4"
+SKILL_PATTERNS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'skill_patterns.json')
+
+# NER only needs the tokenizer and the 'ner' component to find PERSON entities
+NER_DISABLED_PIPES = ["parser", "lemmatizer", "attribute_ruler"]
+NER_BATCH_SIZE = 64
+NAME_WINDOW_CHARS = 1000
+
+# AI Model: loaded lazily, once per process (see get_nlp / init_worker)
+nlp = None
+
+def get_nlp():
+    """Loads the spaCy model the first time it is needed in this process."""
+    global nlp
+    if nlp is None:
+        nlp = spacy.load("en_core_web_sm")
+    return nlp
+
+def init_worker():
+    """Process-pool initializer: every worker loads its own copy of the model once."""
+    get_nlp()
 
 def load_skills():
     """Loads skill database from JSON"""
     try:
         # Go up one level to find data/skill_patterns.json
-        path = os.path.join(os.path.dirname(__file__), '..', 'data', 'skill_patterns.json')
-        with open(path, 'r') as f:
+        with open(SKILL_PATTERNS_PATH, 'r') as f:
             data = json.load(f)
         
         # Flatten the list (we just want a big list of words to search for)
@@ -31,65 +61,42 @@ def load_skills():
 # Load skills ONCE when the script starts
 SKILLS_DB = load_skills()
 
+# Compile every skill into one automaton so each resume is scanned in a single pass
+SKILL_MATCHER = SkillMatcher(SKILLS_DB)
+
+SEGMENTER = ResumeSegmenter()
+
 def extract_text_from_pdf(path):
-    try:
-        doc = fitz.open(path)
-        text = ""
-        for page in doc:
-            text += page.get_text()
-        return text
-    except Exception as e:
-        print(f"Error reading PDF {path}: {e}")
-        return ""
+    extraction = extract_pdf(path)
+    if extraction["status"] == "error":
+        print(f"Error reading PDF {path}: {extraction['error']}")
+    return extraction["text"]
 
 def extract_text_from_docx(path):
-    try:
-        doc = docx.Document(path)
-        text = ""
-        for para in doc.paragraphs:
-            text += para.text + "\n"
-        return text
-    except Exception as e:
-        print(f"Error reading DOCX {path}: {e}")
-        return ""
+    extraction = extract_docx(path)
+    if extraction["status"] == "error":
+        print(f"Error reading DOCX {path}: {extraction['error']}")
+    return extraction["text"]
 
-def parse_resume(file_path):
+def read_resume(file_path):
     """
-    Main Logic: Detect Type -> Extract -> Clean -> Analyze
+    Detects the file type and runs the bounded extractor (page/char caps, image-only detection).
+    Returns None for unsupported files.
     """
-    filename = os.path.basename(file_path)
-    
-    # 1. Detect File Type & Extract Raw Text
-    if filename.endswith(".pdf"):
-        raw_text = extract_text_from_pdf(file_path)
-    elif filename.endswith(".docx"):
-        raw_text = extract_text_from_docx(file_path)
-    else:
-        return None  # Skip images or other files
-
-    # 2. Clean the Text (Using your text_cleaner.py)
-    cleaned_text = clean_text(raw_text)
+    return extract_document(os.path.basename(file_path), file_path)  # Skip images or other files
 
-    # 3. Initialize Data Structure
-    data = {
-        "filename": filename,
-        "email": None,
-        "phone": None,
-        "name": None,
-        "skills": []
-    }
-
-    # 4. Extract Contact Info (Regex)
-    email_match = re.search(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', cleaned_text)
-    if email_match:
-        data["email"] = email_match.group(0)
-
-    phone_match = re.search(r'(\+?\d{1,3}[-.\s]?)?(\d{10})', cleaned_text)
-    if phone_match:
-        data["phone"] = phone_match.group(0).strip()
+def name_window(cleaned_text):
+    """
+    Only the top of a resume holds the candidate's name, so NER reads the
+    SUMMARY/CONTACT lines (capped at NAME_WINDOW_CHARS) instead of the whole document.
+    """
+    sections = SEGMENTER.segment(cleaned_text)
+    header_lines = sections["SUMMARY"] + sections["CONTACT"]
+    window = "\n".join(header_lines) if header_lines else cleaned_text
+    return window[:NAME_WINDOW_CHARS]
 
-    # 5. Extract Name (AI with Filter)
-    doc = nlp(cleaned_text)
+def pick_person_name(doc):
+    """Returns the first PERSON entity that survives the name filters, or None."""
     for ent in doc.ents:
         if ent.label_ == "PERSON":
             # FILTER 1: Clean the text and remove anything after a newline
@@ -110,54 +117,547 @@ def parse_resume(file_path):
                 continue
                 
             # If it passes checks, accept it as the name
-            data["name"] = name_candidate
-            break
-    # Fallback: If AI fails, take the very first line of the file (usually the name)
-    if not data["name"]:
-        first_line = cleaned_text.split('\n')[0].strip()
-        # Ensure it's not an email or phone
-        if "@" not in first_line and len(first_line) < 50:
-             data["name"] = first_line
-
-    # 6. Extract Skills (Keyword Matching against DB)
-    # We use 'set' to avoid duplicates (e.g. finding "Python" twice)
-    found_skills = set()
-    for skill in SKILLS_DB:
-        # \b ensures we match "Java" but not "JavaScript" when looking for Java
-        pattern = r'\b' + re.escape(skill) + r'\b'
-        if re.search(pattern, cleaned_text, re.IGNORECASE):
-            found_skills.add(skill)
+            return name_candidate
+    return None
+
+def extract_names_batch(cleaned_texts, batch_size=NER_BATCH_SIZE):
+    """
+    Batched name extraction: one nlp.pipe call over many resumes, with the
+    components NER does not need switched off.
+    """
+    windows = [name_window(text) for text in cleaned_texts]
+    docs = get_nlp().pipe(windows, batch_size=batch_size, disable=NER_DISABLED_PIPES)
+    return [pick_person_name(doc) for doc in docs]
+
+def extract_fields(filename, cleaned_text):
+    """Everything except the name: contact details (regex) and skills (keyword matcher)."""
+    # 3. Initialize Data Structure
+    data = {
+        "filename": filename,
+        "email": None,
+        "phone": None,
+        "name": None,
+        "skills": []
+    }
+
+    # 4. Extract Contact Info (Regex)
+    email_match = re.search(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', cleaned_text)
+    if email_match:
+        data["email"] = email_match.group(0)
+
+    phone_match = re.search(r'(\+?\d{1,3}[-.\s]?)?(\d{10})', cleaned_text)
+    if phone_match:
+        data["phone"] = phone_match.group(0).strip()
+
+    # 6. Extract Skills (Single-pass keyword matching against DB)
+    # The matcher returns a 'set', so duplicates (e.g. finding "Python" twice) are dropped.
+    # Whole-word rules still apply: we match "Java" but not "JavaScript" when looking for Java
+    found_skills = SKILL_MATCHER.find_all(cleaned_text)
             
     data["skills"] = list(found_skills)
 
     return data
 
+def parse_resumes_batch(file_paths):
+    """
+    Main Logic: Detect Type -> Extract -> Clean -> Analyze, for many resumes at once.
+    Returns one result per path (None for unsupported files), in the same order.
+    """
+    results = [None] * len(file_paths)
+    pending = []  # (index, cleaned_text) of resumes that still need a name
+
+    for index, file_path in enumerate(file_paths):
+        filename = os.path.basename(file_path)
+
+        # 1. Detect File Type & Extract Raw Text
+        extraction = read_resume(file_path)
+        if extraction is None:
+            continue
+        if extraction["status"] == "error":
+            print(f"Error reading {filename}: {extraction['error']}")
+            continue
+        if extraction["status"] == "image_only":
+            # No text layer (e.g. a Canva export): record it and skip cleaning + NER entirely
+            results[index] = extract_fields(filename, "")
+            results[index]["extraction_status"] = "image_only"
+            continue
+
+        # 2. Clean the Text (Using your text_cleaner.py)
+        cleaned_text = clean_text(extraction["text"])
+        results[index] = extract_fields(filename, cleaned_text)
+        pending.append((index, cleaned_text))
+
+    fill_names(results, pending)
+    return results
+
+def parse_cleaned_batch(items):
+    """parse_resumes_batch for text that was already extracted and cleaned: [(filename, cleaned_text)]."""
+    results = [extract_fields(filename, cleaned_text) for filename, cleaned_text in items]
+    fill_names(results, [(index, cleaned_text) for index, (_, cleaned_text) in enumerate(items)])
+    return results
+
+def fill_names(results, pending):
+    """Step 5 of the pipeline for (index, cleaned_text) pairs: NER names, written into results[index]."""
+    # 5. Extract Name (AI with Filter), batched across every resume in this call
+    names = extract_names_batch([cleaned_text for _, cleaned_text in pending])
+    for (index, cleaned_text), name in zip(pending, names):
+        data = results[index]
+        data["name"] = name
+        # Fallback: If AI fails, take the very first line of the file (usually the name)
+        if not data["name"]:
+            first_line = cleaned_text.split('\n')[0].strip()
+            # Ensure it's not an email or phone
+            if "@" not in first_line and len(first_line) < 50:
+                 data["name"] = first_line
+
+def parse_resume(file_path):
+    """
+    Main Logic: Detect Type -> Extract -> Clean -> Analyze
+    """
+    return parse_resumes_batch([file_path])[0]
+
+def candidate_id_for(filename):
+    """The name a resume's JSON output gets; also its id in the consolidated candidate store."""
+    return filename.rsplit('.', 1)[0] + ".json"
+
+def save_result(filename, result, output_folder):
+    """
+    Saves one parsed resume as JSON and returns the row data for the CSV.
+    With output_folder=None no file is written (the caller keeps results in a CandidateStore).
+    """
+    if result and result.get("extraction_status") == "image_only":
+        # Nothing to score downstream, so no JSON: just flag it in the report
+        return [filename, "IMAGE_ONLY", "", "", 0]
+    elif result:
+        # Save JSON
+        if output_folder is not None:
+            with open(os.path.join(output_folder, candidate_id_for(filename)), 'w') as jf:
+                json.dump(result, jf, indent=4)
+        
+        # Return data for the CSV logger
+        return [filename, "SUCCESS", result['name'], result['email'], len(result['skills'])]
+    else:
+        return [filename, "FAILED", "", "", 0]
+
 def process_single_file(file_path, output_folder):
     """
     Helper function designed to be run in parallel.
     Processes one file, saves the JSON, and returns the row data for the CSV.
     """
-    filename = os.path.basename(file_path)
+    row_data, _ = process_file_batch([file_path], output_folder)[0]
+    return row_data
+
+def process_file_batch(file_paths, output_folder):
+    """
+    Processes a chunk of files with one batched NER pass.
+    Returns (row_data, result) per file so the caller can log the row and cache the result.
+    If the chunk crashes, falls back to one-by-one so a bad file only fails itself.
+    """
     try:
-        result = parse_resume(file_path)
-        if result:
-            # Save JSON
-            json_name = filename.rsplit('.', 1)[0] + ".json"
-            with open(os.path.join(output_folder, json_name), 'w') as jf:
-                json.dump(result, jf, indent=4)
-            
-            # Return data for the CSV logger
-            return [filename, "SUCCESS", result['name'], result['email'], len(result['skills'])]
+        results = parse_resumes_batch(file_paths)
+        return [(save_result(os.path.basename(path), result, output_folder), result)
+                for path, result in zip(file_paths, results)]
+    except Exception:
+        pass
+
+    pairs = []
+    for path in file_paths:
+        filename = os.path.basename(path)
+        try:
+            result = parse_resume(path)
+            pairs.append((save_result(filename, result, output_folder), result))
+        except Exception as e:
+            print(f"⚠️ Crash processing {filename}: {str(e)}")
+            # Fail gracefully without crashing the whole batch
+            pairs.append(([filename, "ERROR", "", "", 0], None))
+    return pairs
+
+def process_text_batch(items, output_folder):
+    """process_file_batch for pre-cleaned (filename, cleaned_text) items (dedup stage 2)."""
+    try:
+        results = parse_cleaned_batch(items)
+        return [(save_result(filename, result, output_folder), result)
+                for (filename, _), result in zip(items, results)]
+    except Exception:
+        pass
+
+    pairs = []
+    for item in items:
+        try:
+            result = parse_cleaned_batch([item])[0]
+            pairs.append((save_result(item[0], result, output_folder), result))
+        except Exception as e:
+            print(f"⚠️ Crash processing {item[0]}: {str(e)}")
+            pairs.append(([item[0], "ERROR", "", "", 0], None))
+    return pairs
+
+def extract_signature_batch(file_paths, num_perm, shingle_size, seed):
+    """
+    Dedup stage 1, run in the workers: extract + clean each file ONCE and MinHash it.
+    Returns (path, cleaned_text, signature); cleaned_text is None when the file has no
+    usable text layer (error / image-only / unsupported), so it takes the normal path.
+    """
+    hasher = MinHasher(num_perm, shingle_size, seed)
+    rows = []
+    for path in file_paths:
+        try:
+            extraction = read_resume(path)
+        except Exception:
+            extraction = None
+        if extraction is None or extraction["status"] != "ok":
+            rows.append((path, None, None))
+            continue
+        cleaned_text = clean_text(extraction["text"])
+        rows.append((path, cleaned_text, hasher.signature(cleaned_text)))
+    return rows
+
+class _TaskQueue:
+    """
+    Submits chunks to the thread or process pool and hands back their results oldest first,
+    including tasks submitted while results are being consumed (dedup stage 2 feeds on stage 1).
+    """
+
+    def __init__(self, mode, workers, pool=None):
+        self.mode = mode
+        self.handles = deque()
+        self._own_pool = None
+        if mode == "thread":
+            get_nlp()  # Load once up-front, shared by all threads
+            self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+        else:
+            if pool is None:
+                pool = self._own_pool = multiprocessing.Pool(processes=workers, initializer=init_worker)
+            self._pool = pool
+
+    def submit(self, tag, func, *args):
+        if self.mode == "thread":
+            self.handles.append((tag, self._executor.submit(func, *args).result))
+        else:
+            self.handles.append((tag, self._pool.apply_async(func, args).get))
+
+    def results(self):
+        while self.handles:
+            tag, get = self.handles.popleft()
+            yield tag, get()
+
+    def close(self):
+        if self.mode == "thread":
+            self._executor.shutdown()
+        elif self._own_pool is not None:
+            self._own_pool.close()
+            self._own_pool.join()
+
+def _run_pool(file_paths, output_folder, mode, workers, chunksize, pool=None):
+    """
+    Yields (row_data, result) pairs from the thread or process pool as chunks finish.
+    A long-lived process pool can be passed in so its workers keep their loaded model.
+    """
+    if not file_paths:
+        return
+
+    if mode == "thread":
+        get_nlp()  # Load once up-front, shared by all threads
+        chunksize = chunksize or 1
+        chunks = [file_paths[i:i + chunksize] for i in range(0, len(file_paths), chunksize)]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(process_file_batch, chunk, output_folder) for chunk in chunks]
+            for future in concurrent.futures.as_completed(futures):
+                yield from future.result()
+        return
+
+    # Send work in chunks: the IPC cost is paid once per chunk, and each
+    # chunk's names come out of a single nlp.pipe pass inside the worker
+    if not chunksize:
+        chunksize = min(NER_BATCH_SIZE, max(1, len(file_paths) // (workers * 4)))
+    chunks = [file_paths[i:i + chunksize] for i in range(0, len(file_paths), chunksize)]
+    task = functools.partial(process_file_batch, output_folder=output_folder)
+
+    if pool is not None:
+        for pairs in pool.imap_unordered(task, chunks):
+            yield from pairs
+        return
+
+    with multiprocessing.Pool(processes=workers, initializer=init_worker) as pool:
+        for pairs in pool.imap_unordered(task, chunks):
+            yield from pairs
+
+def _store_result(store, filename, result, skill_index=None):
+    """
+    Appends a parse to the consolidated store and (re-)indexes its skills in the skill
+    bitset index, under the same rule save_result uses for JSON files.
+    """
+    if result and result.get("extraction_status") != "image_only":
+        if store is not None:
+            store.put(candidate_id_for(filename), result)
+        if skill_index is not None:
+            skill_index.add(candidate_id_for(filename), result.get("skills") or [])
+
+def _load_previous_result(canonical_id, store, json_folder):
+    """A canonical copy's parse from an earlier run: from the store, else from its JSON file."""
+    if store is not None:
+        return store.get(canonical_id)
+    try:
+        with open(os.path.join(json_folder, canonical_id), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError, TypeError):
+        return None
+
+def _reuse_result(result, filename, canonical_id):
+    """Copy of the canonical parse for a near-duplicate resume, tagged with where it came from."""
+    result = json.loads(json.dumps(result))
+    result["filename"] = filename
+    result["duplicate_of"] = canonical_id
+    return result
+
+def iter_batch_results(valid_files, output_folder, mode="process", workers=None, chunksize=None, cache=None,
+                       pool=None, store=None, dedup=None, skill_index=None):
+    """
+    Runs the batch and yields one CSV row per resume as soon as its chunk finishes.
+    'process' mode spreads the CPU-bound NLP over every core (one model per worker);
+    'thread' mode keeps the old single-process thread pool.
+    With a ParseCache, unchanged files are served from the cache and never reach the pool.
+    With a CandidateStore, results are appended to it (from this process only)
+    instead of being written as one JSON file per candidate.
+    With a NearDuplicateIndex, resumes whose cleaned text is a near-duplicate of an
+    already parsed one reuse that canonical parse (row status 'DUPLICATE') and skip the pool.
+    With a SkillBitsetIndex, every written candidate's skills are (re-)indexed in it.
+    """
+    workers = workers or os.cpu_count() or 1
+    json_folder = output_folder
+    if store is not None:
+        output_folder = None  # Workers skip the per-file JSON
+
+    pending = valid_files
+    keys = {}  # filename -> cache key of the files we actually have to parse
+    if cache is not None:
+        pending = []
+        for path in valid_files:
+            filename = os.path.basename(path)
+            with open(path, "rb") as f:
+                key = cache.key_for(f.read())
+            result = cache.get(key)
+            if result is None:
+                keys[filename] = key
+                pending.append(path)
+            else:
+                # Same bytes seen before (possibly under another name): reuse the stored parse
+                result["filename"] = filename
+                _store_result(store, filename, result, skill_index)
+                yield save_result(filename, result, output_folder)
+
+    if dedup is not None:
+        yield from _iter_dedup_results(pending, dedup, output_folder, json_folder, mode, workers, chunksize,
+                                       cache, keys, pool, store, skill_index)
+        return
+
+    for row_data, result in _run_pool(pending, output_folder, mode, workers, chunksize, pool):
+        if cache is not None and result is not None:
+            cache.put(keys[row_data[0]], result)
+        _store_result(store, row_data[0], result, skill_index)
+        yield row_data
+
+def _iter_dedup_results(pending, dedup, output_folder, json_folder, mode, workers, chunksize, cache, keys,
+                        pool, store, skill_index=None):
+    """
+    NEAR-DUPLICATE PIPELINE: MinHash/LSH over the cleaned text, sub-linear per resume.
+    Stage 1 (workers): extract + clean + signature, once per file.
+    Main process: LSH lookup; near-duplicates reuse their canonical parse right away.
+    Stage 2 (workers): extract_fields + NER on the cleaned text of the unique resumes only.
+    """
+    chunksize = chunksize or min(NER_BATCH_SIZE, max(1, len(pending) // (workers * 4)))
+    hasher = dedup.hasher
+
+    def emit_duplicate(path, result, canonical_id):
+        # Never cached: the cache key is this file's bytes, but the parse belongs to another resume
+        filename = os.path.basename(path)
+        result = _reuse_result(result, filename, canonical_id)
+        _store_result(store, filename, result, skill_index)
+        row_data = save_result(filename, result, output_folder)
+        row_data[1] = "DUPLICATE"
+        return row_data
+
+    tasks = _TaskQueue(mode, workers, pool)
+    try:
+        extract_chunks = [pending[i:i + chunksize] for i in range(0, len(pending), chunksize)]
+        for chunk in extract_chunks:
+            tasks.submit("extracted", extract_signature_batch, chunk,
+                         hasher.num_perm, hasher.shingle_size, dedup.seed)
+        extracting = len(extract_chunks)
+
+        texts, files = [], []  # Waiting for a stage-2 chunk: (filename, cleaned_text) / raw paths
+        unique_ids = set()
+        duplicates = {}  # canonical id parsed in this batch -> paths of its near-duplicates
+
+        def submit_parses(flush=False):
+            while texts and (flush or len(texts) >= chunksize):
+                tasks.submit("parsed", process_text_batch, texts[:chunksize], output_folder)
+                del texts[:chunksize]
+            while files and (flush or len(files) >= chunksize):
+                tasks.submit("parsed", process_file_batch, files[:chunksize], output_folder)
+                del files[:chunksize]
+
+        for tag, rows in tasks.results():
+            if tag == "extracted":
+                extracting -= 1
+                for path, cleaned_text, signature in rows:
+                    filename = os.path.basename(path)
+                    candidate_id = candidate_id_for(filename)
+                    if cleaned_text is None:
+                        files.append(path)  # No text layer: the normal path reports it
+                        continue
+                    canonical_id = dedup.check_signature(candidate_id, signature)
+                    if canonical_id is None:
+                        unique_ids.add(candidate_id)
+                        texts.append((filename, cleaned_text))
+                    elif canonical_id in unique_ids:
+                        duplicates.setdefault(canonical_id, []).append(path)
+                    else:
+                        result = _load_previous_result(canonical_id, store, json_folder)
+                        if result is None:
+                            # The canonical parse is gone: this copy becomes the canonical one
+                            dedup.add(candidate_id, signature)
+                            unique_ids.add(candidate_id)
+                            texts.append((filename, cleaned_text))
+                        else:
+                            yield emit_duplicate(path, result, canonical_id)
+                submit_parses(flush=extracting == 0)
+                continue
+
+            for row_data, result in rows:
+                if cache is not None and result is not None:
+                    cache.put(keys[row_data[0]], result)
+                _store_result(store, row_data[0], result, skill_index)
+                yield row_data
+
+                copies = duplicates.pop(candidate_id_for(row_data[0]), [])
+                if result and result.get("extraction_status") != "image_only":
+                    for path in copies:
+                        yield emit_duplicate(path, result, candidate_id_for(row_data[0]))
+                elif copies:
+                    # The canonical copy failed to parse: parse its duplicates themselves
+                    tasks.submit("parsed", process_file_batch, copies, output_folder)
+    finally:
+        tasks.close()
+
+def run_watch_mode(input_folder, output_folder, log_file, mode="process", workers=None,
+                   chunksize=None, cache=None, interval=2.0, store=None, dedup=None, dedup_path=None,
+                   skill_index=None, skill_index_path=None):
+    """
+    Long-running incremental ingestion: every tick parses only new or modified
+    resumes, removes outputs of deleted ones, and appends to the CSV report.
+    A deleted resume is also dropped from the skill bitset index, which new parses
+    keep up to date. The candidate vector index is left to the orchestrator, its only
+    writer: update_candidate_index prunes resumes whose output is gone.
+    """
+    workers = workers or os.cpu_count() or 1
+    manifest = IngestionManifest(os.path.join(output_folder, ".ingest_manifest.json"))
+
+    # One pool for the whole session, so workers load spaCy once instead of once per tick
+    pool = None
+    if mode == "process":
+        pool = multiprocessing.Pool(processes=workers, initializer=init_worker)
+
+    def drop_output(output_name):
+        """Removes everything a resume's earlier parse left behind (JSON or store record, index entries)."""
+        if not output_name:
+            return
+        if dedup is not None:
+            dedup.remove(output_name)
+        if skill_index is not None:
+            skill_index.remove(output_name)
+        if store is not None:
+            store.delete(output_name)
         else:
-            return [filename, "FAILED", "", "", 0]
-    except Exception as e:
-        print(f"⚠️ Crash processing {filename}: {str(e)}")
-        # Fail gracefully without crashing the whole batch
-        return [filename, "ERROR", "", "", 0]
+            try:
+                os.remove(os.path.join(output_folder, output_name))
+            except FileNotFoundError:
+                pass
+
+    write_header = not os.path.exists(log_file)
+    print(f"👀 Watching {input_folder} every {interval}s (Ctrl+C to stop)...")
+
+    try:
+        with open(log_file, 'a', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            if write_header:
+                writer.writerow(["Filename", "Status", "Name", "Email", "Skill Count"])
+
+            while True:
+                changed, deleted = manifest.scan(input_folder)
+
+                # 1. Deleted resumes: drop their JSON output and log it
+                for path in deleted:
+                    drop_output(manifest.remove(path))
+                    writer.writerow([os.path.basename(path), "DELETED", "", "", 0])
+                    print(f"🗑️ Removed: {os.path.basename(path)}")
+
+                # 2. New / modified resumes: parse just those
+                paths_by_name = {os.path.basename(path): path for path in changed}
+                for row_data in iter_batch_results(changed, output_folder, mode, workers,
+                                                   chunksize or 1, cache=cache, pool=pool, store=store,
+                                                   dedup=dedup, skill_index=skill_index):
+                    filename = row_data[0]
+                    output_name = candidate_id_for(filename) if row_data[1] in ("SUCCESS", "DUPLICATE") else None
+                    # A resume that parsed before and now FAILED / is IMAGE_ONLY: its old profile must go too
+                    drop_output(manifest.mark_processed(paths_by_name[filename], output_name))
+                    writer.writerow(row_data)
+                    print(f"✅ Ingested: {filename}")
+
+                if changed or deleted:
+                    f.flush()
+                    manifest.save()
+                    if cache is not None:
+                        cache.save()
+                    if store is not None:
+                        store.save()
+                        store.compact_if_needed()
+                    if dedup is not None:
+                        dedup.save(dedup_path)
+                    if skill_index is not None:
+                        skill_index.save(skill_index_path)
+
+                time.sleep(interval)
+    except KeyboardInterrupt:
+        print("\n🛑 Watch mode stopped.")
+    finally:
+        manifest.save()
+        if cache is not None:
+            cache.save()
+        if store is not None:
+            store.save()
+        if dedup is not None:
+            dedup.save(dedup_path)
+        if skill_index is not None:
+            skill_index.save(skill_index_path)
+        if pool is not None:
+            pool.terminate()
 
 if __name__ == "__main__":
+    cli = argparse.ArgumentParser(description="Zecpath batch resume parser")
+    cli.add_argument("--mode", choices=["process", "thread"], default="process",
+                     help="'process' uses every CPU core; 'thread' is the legacy thread pool")
+    cli.add_argument("--workers", type=int, default=os.cpu_count(),
+                     help="Number of workers (default: CPU count)")
+    cli.add_argument("--chunksize", type=int, default=None,
+                     help="Resumes sent to a worker at a time (default: auto)")
+    cli.add_argument("--no-cache", action="store_true",
+                     help="Re-parse every file, ignoring the content-addressed parse cache")
+    cli.add_argument("--cache-budget-mb", type=int, default=512,
+                     help="Disk budget for cached parses before LRU eviction (default: 512)")
+    cli.add_argument("--watch", action="store_true",
+                     help="Keep running and ingest new/modified resumes incrementally")
+    cli.add_argument("--interval", type=float, default=2.0,
+                     help="Seconds between directory scans in --watch mode (default: 2.0)")
+    cli.add_argument("--store", action="store_true",
+                     help="Append results to the consolidated NDJSON candidate store instead of one JSON per file")
+    cli.add_argument("--dedup", action="store_true",
+                     help="Reuse the parse of near-duplicate resumes (MinHash/LSH over the cleaned text)")
+    cli.add_argument("--dedup-threshold", type=float, default=0.8,
+                     help="Estimated Jaccard similarity above which a resume counts as a duplicate (default: 0.8)")
+    args = cli.parse_args()
+
     # Define Paths
-    base_dir = os.path.dirname(os.path.dirname(__file__)) # Go up to project root
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) # Go up to project root
     input_folder = os.path.join(base_dir, "data", "raw_resumes")
     output_folder = os.path.join(base_dir, "data", "processed")
     
@@ -167,33 +667,65 @@ if __name__ == "__main__":
     # CSV Log File for Reporting
     log_file = os.path.join(output_folder, "parsing_report.csv")
     
-    print(f"🚀 Zecpath Parser V2.1 (Optimized Multi-threading) Starting...")
+    cache = None
+    if not args.no_cache:
+        cache = ParseCache(os.path.join(output_folder, ".parse_cache"),
+                           fingerprint(PARSER_VERSION, SKILL_PATTERNS_PATH),
+                           max_bytes=args.cache_budget_mb * 1024 * 1024)
+
+    store = CandidateStore(os.path.join(output_folder, STORE_DIRNAME)) if args.store else None
+
+    dedup_path = os.path.join(output_folder, ".dedup_index.npz")
+    dedup = NearDuplicateIndex.load_or_create(dedup_path, args.dedup_threshold) if args.dedup else None
+
+    # Parsed skills as bitsets for skill queries (SkillBitsetIndex.has_all, evaluate_batch on parsed skills)
+    skill_index_path = os.path.join(output_folder, SKILL_INDEX_FILENAME)
+    skill_index = SkillBitsetIndex.load_or_create(skill_index_path)
+
+    print(f"🚀 Zecpath Parser V2.3 ({args.mode} pool, {args.workers} workers) Starting...")
     print(f"📂 Reading from: {input_folder}")
+
+    if args.watch:
+        run_watch_mode(input_folder, output_folder, log_file, args.mode, args.workers,
+                       args.chunksize, cache=cache, interval=args.interval, store=store,
+                       dedup=dedup, dedup_path=dedup_path,
+                       skill_index=skill_index, skill_index_path=skill_index_path)
+    else:
+        # Pre-filter files to avoid hidden system files like .DS_Store
+        valid_files = []
+        if os.path.exists(input_folder):
+            for filename in os.listdir(input_folder):
+                if filename.endswith((".pdf", ".docx")) and not filename.startswith('.'):
+                    valid_files.append(os.path.join(input_folder, filename))
     
-    # Pre-filter files to avoid hidden system files like .DS_Store
-    valid_files = []
-    if os.path.exists(input_folder):
-        for filename in os.listdir(input_folder):
-            if filename.endswith((".pdf", ".docx")) and not filename.startswith('.'):
-                valid_files.append(os.path.join(input_folder, filename))
-    
-    print(f"⚙️ Found {len(valid_files)} valid resumes. Commencing batch extraction...")
-
-    with open(log_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        # Header Row
-        writer.writerow(["Filename", "Status", "Name", "Email", "Skill Count"])
-
-        # THE ENTERPRISE UPGRADE: Parallel Processing
-        # max_workers=10 means processing 10 resumes simultaneously
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-            # Schedule all files to be processed
-            futures = {executor.submit(process_single_file, path, output_folder): path for path in valid_files}
-            
-            # As each file finishes processing, log its result to the CSV
-            for future in concurrent.futures.as_completed(futures):
-                row_data = future.result()
-                writer.writerow(row_data)
-                print(f"✅ Finished: {row_data[0]}")
+        print(f"⚙️ Found {len(valid_files)} valid resumes. Commencing batch extraction...")
+
+        start_time = time.perf_counter()
+        with open(log_file, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            # Header Row
+            writer.writerow(["Filename", "Status", "Name", "Email", "Skill Count"])
+
+            # As each file finishes processing (in any worker), log its result to the CSV
+            try:
+                for row_data in iter_batch_results(valid_files, output_folder, args.mode, args.workers,
+                                                   args.chunksize, cache=cache, store=store, dedup=dedup,
+                                                   skill_index=skill_index):
+                    writer.writerow(row_data)
+                    print(f"✅ Finished: {row_data[0]}")
+                if store is not None and store.compact_if_needed():
+                    print("🧹 Compacted the candidate store (superseded records outweighed live ones)")
+            finally:
+                if cache is not None:
+                    cache.save()
+                if store is not None:
+                    store.close()
+                if dedup is not None:
+                    dedup.save(dedup_path)
+                skill_index.save(skill_index_path)
 
-    print(f"\n🏁 Done! Processed {len(valid_files)} resumes at maximum speed. Check 'data/processed' for results.")
\ No newline at end of file
+        elapsed = time.perf_counter() - start_time
+        rate = len(valid_files) / elapsed if elapsed > 0 else 0.0
+        print(f"\n🏁 Done! Processed {len(valid_files)} resumes in {elapsed:.2f}s ({rate:.1f} resumes/sec). Check 'data/processed' for results.")
+        if cache is not None:
+            print(f"🗃️ Parse cache: {cache.stats()}")
@@ -1,23 +1,133 @@
+import os
+import json
+import numpy as np
+
+DEFAULT_FALLBACK_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                     "data", "embeddings", "role_similarity.json")
+
 class RelevanceEngine:
-    def __init__(self):
+    def __init__(self, verbose=True, semantic_fallback=False, semantic_engine=None, fallback_path=None):
         # The Hybrid Finance/Tech Matrix (0.0 to 1.0 scale)
         self.role_similarity_matrix = {
             "Quantitative Equity Analyst": {
                 "Quantitative Equity Analyst": 1.0,
-                "Data Scientist": 0.9,      
-                "Data Analyst": 0.8,        
-                "Equity Research Analyst": 0.8, 
+                "Data Scientist": 0.9,
+                "Data Analyst": 0.8,
+                "Equity Research Analyst": 0.8,
                 "Quantitative Analyst": 0.9,
                 "Financial Analyst": 0.6,
                 "Software Engineer": 0.5
             },
             "Data Analyst": {
-                "Data Analyst": 1.0, 
-                "Data Scientist": 0.7, 
+                "Data Analyst": 1.0,
+                "Data Scientist": 0.7,
                 "Quantitative Equity Analyst": 0.8,
                 "Software Engineer": 0.2
             }
         }
+        # Console output per job is optional: printing dominates runtime on large batches
+        self.verbose = verbose
+        # Score for pairs the matrix doesn't know (and no semantic fallback resolves)
+        self.default_similarity = 0.1
+
+        # --- INDEXED REPRESENTATION ---
+        # title -> id vocabulary + dense (past x target) matrix; NaN marks an unknown pair
+        self.title_ids = {}
+        self.similarity = np.full((0, 0), np.nan)
+        self._size = 0
+        for past_title, targets in self.role_similarity_matrix.items():
+            for target_title, score in targets.items():
+                past_id, target_id = self.title_id(past_title), self.title_id(target_title)
+                self.similarity[past_id, target_id] = score
+
+        # --- SEMANTIC FALLBACK (opt-in) ---
+        # Unknown pairs are scored once with embeddings, memoized, and persisted to disk
+        self.semantic_fallback = semantic_fallback or semantic_engine is not None
+        self._semantic_engine = semantic_engine
+        self.fallback_path = fallback_path or DEFAULT_FALLBACK_PATH
+        self.fallback_cache = {}
+        self._fallback_dirty = False
+        if self.semantic_fallback:
+            self._load_fallback_cache()
+
+    # ---------- vocabulary ----------
+    def title_id(self, title):
+        """Returns the title's id, growing the vocabulary (and matrix) for a new title."""
+        title_id = self.title_ids.get(title)
+        if title_id is None:
+            title_id = self.title_ids[title] = self._size
+            self._size += 1
+            if self._size > len(self.similarity):
+                capacity = max(16, 2 * len(self.similarity))
+                grown = np.full((capacity, capacity), np.nan)
+                grown[:len(self.similarity), :len(self.similarity)] = self.similarity
+                self.similarity = grown
+        return title_id
+
+    # ---------- semantic fallback ----------
+    @property
+    def semantic_engine(self):
+        if self._semantic_engine is None:
+            from parsers.semantic_engine import SemanticEngine
+            self._semantic_engine = SemanticEngine()
+        return self._semantic_engine
+
+    @staticmethod
+    def _pair_key(past_title, target_title):
+        return f"{past_title} || {target_title}"
+
+    def _load_fallback_cache(self):
+        try:
+            with open(self.fallback_path, "r", encoding="utf-8") as f:
+                self.fallback_cache = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.fallback_cache = {}
+
+    def save_fallback_cache(self):
+        """Persists newly scored pairs (atomic replace, so readers never see half a file)."""
+        if not self._fallback_dirty:
+            return
+        os.makedirs(os.path.dirname(self.fallback_path), exist_ok=True)
+        tmp_path = self.fallback_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.fallback_cache, f, indent=2)
+        os.replace(tmp_path, self.fallback_path)
+        self._fallback_dirty = False
+
+    def _resolve_unknown(self, past_title, target_title):
+        """Fills one unknown matrix cell: memoized embedding similarity, or the 0.1 default."""
+        if not self.semantic_fallback:
+            return self.default_similarity
+        key = self._pair_key(past_title, target_title)
+        score = self.fallback_cache.get(key)
+        if score is None:
+            score = max(0.0, min(1.0, self.semantic_engine.calculate_similarity(past_title, target_title)))
+            self.fallback_cache[key] = score
+            self._fallback_dirty = True
+        past_id, target_id = self.title_id(past_title), self.title_id(target_title)
+        self.similarity[past_id, target_id] = score
+        return score
+
+    def similarity_for(self, past_title, target_title):
+        past_id, target_id = self.title_id(past_title), self.title_id(target_title)
+        score = self.similarity[past_id, target_id]
+        if np.isnan(score):
+            return self._resolve_unknown(past_title, target_title)
+        return float(score)
+
+    # ---------- scoring ----------
+    def _summary(self, extracted_experience, target_job_title, required_years, total_effective_months):
+        effective_years = round(total_effective_months / 12.0, 1)
+        raw_years = extracted_experience.get("total_experience_years", 0.0)
+
+        match_percentage = min(100, int((effective_years / required_years) * 100)) if required_years > 0 else 100
+
+        return {
+            "raw_total_years": raw_years,
+            "effective_relevant_years": effective_years,
+            "target_job": target_job_title,
+            "relevance_match_percentage": match_percentage
+        }
 
     def calculate_relevance(self, extracted_experience, target_job_title, required_years):
         """
@@ -26,17 +136,16 @@ class RelevanceEngine:
         jobs = extracted_experience.get("experience_entries", [])
         total_effective_months = 0
 
-        print(f"\n🎯 Target Role: {target_job_title} (Requires {required_years} years)")
-        print("-" * 50)
+        if self.verbose:
+            print(f"\n🎯 Target Role: {target_job_title} (Requires {required_years} years)")
+            print("-" * 50)
 
         for job in jobs:
             past_title = job.get("job_title", "Unknown")
             duration_months = job.get("duration_months", 0)
 
             # Look up similarity (Default to 0.1 if completely unknown)
-            similarity_score = 0.1 
-            if past_title in self.role_similarity_matrix:
-                similarity_score = self.role_similarity_matrix[past_title].get(target_job_title, 0.1)
+            similarity_score = self.similarity_for(past_title, target_job_title)
 
             # Inject the score back into the job dictionary
             job["relevance_score"] = similarity_score
@@ -45,19 +154,49 @@ class RelevanceEngine:
             effective_months = duration_months * similarity_score
             total_effective_months += effective_months
 
-            print(f"🔹 Past Role: {past_title} ({duration_months} months)")
-            print(f"   Similarity to Target: {similarity_score * 100}%")
-            print(f"   Effective Experience Granted: {round(effective_months, 1)} months")
+            if self.verbose:
+                print(f"🔹 Past Role: {past_title} ({duration_months} months)")
+                print(f"   Similarity to Target: {similarity_score * 100}%")
+                print(f"   Effective Experience Granted: {round(effective_months, 1)} months")
 
-        effective_years = round(total_effective_months / 12.0, 1)
-        raw_years = extracted_experience.get("total_experience_years", 0.0)
-        
-        match_percentage = min(100, int((effective_years / required_years) * 100)) if required_years > 0 else 100
+        if self.verbose:
+            print("-" * 50)
+        return self._summary(extracted_experience, target_job_title, required_years, total_effective_months)
 
-        print("-" * 50)
-        return {
-            "raw_total_years": raw_years,
-            "effective_relevant_years": effective_years,
-            "target_job": target_job_title,
-            "relevance_match_percentage": match_percentage
-        }
\ No newline at end of file
+    def effective_months_batch(self, experiences, target_job_title):
+        """
+        Effective months for many candidates at once. Every job is flattened into
+        (title id, months, owner) arrays; one gather from the matrix column of the
+        target scores all jobs, and np.bincount sums them back per candidate.
+        Returns (effective months per candidate, similarity per flattened job).
+        """
+        target_id = self.title_id(target_job_title)
+        title_ids, months, owners = [], [], []
+        for owner, extracted_experience in enumerate(experiences):
+            for job in extracted_experience.get("experience_entries", []):
+                title_ids.append(self.title_id(job.get("job_title", "Unknown")))
+                months.append(job.get("duration_months", 0))
+                owners.append(owner)
+        title_ids = np.array(title_ids, dtype=np.int64)
+
+        # Unknown pairs are resolved once per distinct past title, not once per job
+        column = self.similarity[:self._size, target_id]
+        titles = list(self.title_ids)
+        for unknown_id in np.unique(title_ids[np.isnan(column[title_ids])]):
+            self._resolve_unknown(titles[unknown_id], target_job_title)
+
+        scores = self.similarity[title_ids, target_id]
+        scores = np.where(np.isnan(scores), self.default_similarity, scores)
+        effective = np.array(months, dtype=float) * scores
+        return np.bincount(np.array(owners, dtype=np.int64), weights=effective, minlength=len(experiences)), scores
+
+    def calculate_relevance_batch(self, experiences, target_job_title, required_years):
+        """Batch calculate_relevance: same result dicts (and injected relevance_score), no console output."""
+        totals, scores = self.effective_months_batch(experiences, target_job_title)
+        position = 0
+        for extracted_experience in experiences:
+            for job in extracted_experience.get("experience_entries", []):
+                job["relevance_score"] = float(scores[position])
+                position += 1
+        return [self._summary(extracted_experience, target_job_title, required_years, float(total))
+                for extracted_experience, total in zip(experiences, totals)]
@@ -1,8 +1,8 @@
-import fitz  # PyMuPDF
 import re
 import spacy
 import os
 import json
+from parsers.document_extractor import extract_pdf
 
 class ResumeParser:
     def __init__(self):
@@ -15,15 +15,11 @@ class ResumeParser:
             self.nlp = None
 
     def extract_text(self, pdf_path):
-        """Reads a PDF file and returns the raw text string."""
-        try:
-            doc = fitz.open(pdf_path)
-            text = ""
-            for page in doc:
-                text += page.get_text()
-            return text
-        except Exception as e:
-            return f"Error reading PDF: {str(e)}"
+        """Reads a PDF file (path or bytes) and returns the raw text string."""
+        extraction = extract_pdf(pdf_path)
+        if extraction["status"] == "error":
+            return f"Error reading PDF: {extraction['error']}"
+        return extraction["text"]
 
     def extract_details(self, text):
         """
@@ -1,7 +1,13 @@
 import re
+import difflib
+
+# clean_header() keeps only letters and whitespace, so a pattern made of just
+# those can be matched with a plain dictionary lookup instead of a regex
+_NON_ALPHA = re.compile(r"[^a-zA-Z\s]")
+_LITERAL_HEADER = re.compile(r"[a-z ]+")
 
 class ResumeSegmenter:
-    def __init__(self):
+    def __init__(self, fuzzy=False, fuzzy_cutoff=0.85):
         # The Master Dictionary of Section Headers
         self.HEADER_PATTERNS = {
             "EXPERIENCE": [
@@ -32,9 +38,37 @@ class ResumeSegmenter:
             ]
         }
 
+        # Optional fuzzy tier for near-miss headers ("Experiance", "Educaton")
+        self.fuzzy = fuzzy
+        self.fuzzy_cutoff = fuzzy_cutoff
+        self.build_header_index()
+
+    def build_header_index(self):
+        """
+        Compiles HEADER_PATTERNS once into:
+        - an exact-match dict {normalized header: section} for the literal patterns, and
+        - one compiled alternation with named groups for any real regex patterns.
+        Call again if HEADER_PATTERNS is changed after construction.
+        """
+        self._exact_headers = {}
+        regex_groups = []
+        for section, patterns in self.HEADER_PATTERNS.items():
+            regex_patterns = []
+            for pattern in patterns:
+                if _LITERAL_HEADER.fullmatch(pattern):
+                    # First section wins, exactly like the old ordered loop
+                    self._exact_headers.setdefault(pattern, section)
+                else:
+                    regex_patterns.append(pattern)
+            if regex_patterns:
+                regex_groups.append(f"(?P<{section}>{'|'.join(regex_patterns)})")
+        self._header_regex = re.compile("|".join(regex_groups)) if regex_groups else None
+        self._fuzzy_keys = list(self._exact_headers)
+        self._fuzzy_memo = {}
+
     def clean_header(self, text):
         """Removes special characters to see if a line is a header."""
-        return re.sub(r"[^a-zA-Z\s]", "", text).strip().lower()
+        return _NON_ALPHA.sub("", text).strip().lower()
 
     def detect_header(self, line):
         """Checks if a single line of text looks like a known header."""
@@ -44,15 +78,30 @@ class ResumeSegmenter:
         if len(clean_line.split()) > 5: 
             return None
 
-        # Rule 2: Check our dictionary
-        for section, patterns in self.HEADER_PATTERNS.items():
-            for pattern in patterns:
-                # We use fullmatch because headers usually take up the whole line
-                if re.fullmatch(pattern, clean_line):
-                    return section
-        
+        # Rule 2: Check our dictionary (one lookup on the whole normalized line)
+        section = self._exact_headers.get(clean_line)
+        if section:
+            return section
+
+        # We use fullmatch because headers usually take up the whole line
+        if self._header_regex is not None:
+            match = self._header_regex.fullmatch(clean_line)
+            if match:
+                return match.lastgroup
+
+        # Rule 3 (optional): Near-miss headers, e.g. OCR/typo damage
+        if self.fuzzy and clean_line:
+            return self._fuzzy_header(clean_line)
+
         return None
 
+    def _fuzzy_header(self, clean_line):
+        """Closest known header above the cutoff (memoized, since headers repeat across resumes)."""
+        if clean_line not in self._fuzzy_memo:
+            close = difflib.get_close_matches(clean_line, self._fuzzy_keys, n=1, cutoff=self.fuzzy_cutoff)
+            self._fuzzy_memo[clean_line] = self._exact_headers[close[0]] if close else None
+        return self._fuzzy_memo[clean_line]
+
     def segment(self, text):
         """The Main Function: Slices the resume text into sections."""
         
@@ -89,6 +138,10 @@ class ResumeSegmenter:
         
         return sections
 
+    def segment_many(self, texts):
+        """Batch helper: segments many resumes with the same compiled header index."""
+        return [self.segment(text) for text in texts]
+
 # --- Test Block ---
 if __name__ == "__main__":
     # A fake resume text to test our logic
@@ -1,5 +1,39 @@
 import json
 import os
+import numpy as np
+
+# Column order of the batch API (matrix inputs and effective_weights)
+SCORE_COLUMNS = ["skills", "experience", "projects", "education"]
+
+
+class LazyAuditNotes:
+    """
+    Audit notes for a batch, built on demand. Only rows that triggered a fallback
+    have notes; every other row is [] without ever creating a list.
+    """
+
+    def __init__(self, missing):
+        self._missing = missing  # (n, 4) bool matrix in SCORE_COLUMNS order
+        self.rows = np.flatnonzero(missing.any(axis=1))
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __getitem__(self, row):
+        # Same notes, in the same order, as calculate_final_score
+        missing = self._missing[row]
+        notes = []
+        if missing[3]:
+            notes.append("⚠️ Missing Education Data. Redistributing weight evenly to Skills and Experience.")
+        for column, key in enumerate(["skills", "experience", "projects"]):
+            if missing[column]:
+                notes.append(f"⚠️ Missing {key.capitalize()} Data. Defaulting to 0.0.")
+        return notes
+
+    def items(self):
+        """Yields (row, notes) for the rows that have notes."""
+        for row in self.rows:
+            yield int(row), self[row]
 
 class ScoringEngine:
     def __init__(self):
@@ -62,4 +96,53 @@ class ScoringEngine:
             "effective_weights": weights,
             "raw_scores": scores,
             "audit_notes": audit_notes
-        }
\ No newline at end of file
+        }
+
+    @staticmethod
+    def _score_columns(scores_matrix):
+        """pandas DataFrame, dict of columns, or (n, 4) array -> (n, 4) float matrix (NaN = missing)."""
+        if hasattr(scores_matrix, "columns"):
+            return np.column_stack([scores_matrix[key].to_numpy(dtype=float) for key in SCORE_COLUMNS])
+        if isinstance(scores_matrix, dict):
+            return np.column_stack([np.asarray(scores_matrix[key], dtype=float) for key in SCORE_COLUMNS])
+        matrix = np.asarray(scores_matrix, dtype=float)
+        if matrix.ndim != 2 or matrix.shape[1] != len(SCORE_COLUMNS):
+            raise ValueError(f"Expected an (n, {len(SCORE_COLUMNS)}) matrix with columns {SCORE_COLUMNS}")
+        return matrix
+
+    def calculate_final_scores_batch(self, role_level, scores_matrix):
+        """
+        Columnar calculate_final_score for many candidates at once.
+        The education fallback is applied with masks instead of per-row dict edits;
+        final scores match the single-candidate path row for row.
+        """
+        # 1. Validate the role level
+        if role_level not in self.config["roles"]:
+            raise ValueError(f"Invalid role_level '{role_level}'. Must be: {list(self.config['roles'].keys())}")
+        base = self.config["roles"][role_level]["weights"]
+
+        # 2. Missing-data masks, then zero-fill the raw scores
+        scores = self._score_columns(scores_matrix)
+        missing = np.isnan(scores)
+        scores = np.where(missing, 0.0, scores)
+
+        # 3. Effective weights: education fallback rows move half the weight to Skills and Experience each
+        weights = np.tile(np.array([base[key] for key in SCORE_COLUMNS], dtype=float), (len(scores), 1))
+        no_education = missing[:, 3]
+        weights[no_education, 0] += base["education"] / 2
+        weights[no_education, 1] += base["education"] / 2
+        weights[no_education, 3] = 0.0
+
+        # 4. Weighted sum, accumulated in the same order as the single-candidate formula
+        final_scores = scores[:, 0] * weights[:, 0]
+        for column in range(1, len(SCORE_COLUMNS)):
+            final_scores = final_scores + scores[:, column] * weights[:, column]
+
+        return {
+            "role_level": role_level,
+            "columns": SCORE_COLUMNS,
+            "final_scores": np.round(final_scores, 3),
+            "effective_weights": weights,
+            "raw_scores": scores,
+            "audit_notes": LazyAuditNotes(missing)
+        }
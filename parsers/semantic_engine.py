@@ -1,21 +1,32 @@
+import os
+import numpy as np
 from sentence_transformers import SentenceTransformer, util
-from functools import lru_cache  # <-- NEW: Import the memory cache tool
+from parsers.embedding_store import EmbeddingStore
+
+MODEL_NAME = 'all-MiniLM-L6-v2'
+DEFAULT_STORE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "embeddings")
 
 class SemanticEngine:
-    def __init__(self):
+    def __init__(self, store_dir=None, read_only=False, precision="float32"):
         print("🧠 Loading AI Embedding Model (This takes a few seconds)...")
-        self.model = SentenceTransformer('all-MiniLM-L6-v2')
+        self.model = SentenceTransformer(MODEL_NAME)
         # We set a threshold: If semantic distance is > 0.50, we consider it a match
         self.threshold = 0.50 
 
-    # --- THE ENTERPRISE UPGRADE ---
-    @lru_cache(maxsize=10000)
+        # --- THE ENTERPRISE UPGRADE (V2) ---
+        # Persistent embedding store instead of an in-process lru_cache: it survives restarts,
+        # and worker processes can open it read_only to share one memory-mapped copy.
+        # precision="float16"/"int8" stores the vectors 2x/4x smaller (decoded on lookup).
+        self.store = EmbeddingStore(store_dir or DEFAULT_STORE_DIR, MODEL_NAME,
+                                    self.model.get_sentence_embedding_dimension(), read_only=read_only,
+                                    precision=precision)
+
     def get_embedding(self, text):
         """
-        Calculates the AI vector once, then memorizes it. 
-        maxsize=10000 means it can memorize up to 10,000 unique skills/words.
+        Calculates the AI vector once, then memorizes it on disk.
+        Later calls (in this process or any other) read it back from the store.
         """
-        return self.model.encode(text, convert_to_tensor=True)
+        return self.get_embeddings([text])[0]
 
     def calculate_similarity(self, text1, text2):
         if not text1 or not text2:
@@ -26,31 +37,95 @@ class SemanticEngine:
         embedding2 = self.get_embedding(text2)
         
         return round(util.cos_sim(embedding1, embedding2).item(), 3)
+
+    def get_embeddings(self, texts):
+        """
+        Returns one row per text: stored vectors come from the embedding store,
+        and everything new is encoded in ONE batched model call, then persisted.
+        """
+        # Empty/None entries are encoded as "" and zeroed out by similarity_matrix
+        texts = [text or "" for text in texts]
+        matrix, missing = self.store.get_many(texts)
+        if missing:
+            new_texts = list(dict.fromkeys(texts[i] for i in missing))  # De-duplicate, keep order
+            new_vectors = self.model.encode(new_texts, convert_to_numpy=True)
+            lookup = dict(zip(new_texts, new_vectors))
+            for i in missing:
+                matrix[i] = lookup[texts[i]]
+            self.store.add_many(new_texts, new_vectors)
+            if self.store.precision != "float32":
+                # Hand back the stored (quantized) form, so a text scores the same on every call
+                for i in missing:
+                    matrix[i] = self.store.get(texts[i])
+        return matrix
+
+    def embed_profiles(self, skill_lists, experience_texts=None):
+        """
+        One unit vector per profile (candidate or JD): the mean of its skill embeddings,
+        averaged with its experience text when there is one. Empty profiles get a zero row.
+        All texts of all profiles go through ONE get_embeddings call.
+        """
+        experience_texts = experience_texts or [""] * len(skill_lists)
+        texts = list(dict.fromkeys(
+            [skill for skills in skill_lists for skill in skills if skill] + [t for t in experience_texts if t]))
+        dim = self.store.dim
+        if not texts:
+            return np.zeros((len(skill_lists), dim), dtype=np.float32)
+        row_of = {text: row for row, text in enumerate(texts)}
+        matrix = self.get_embeddings(texts)
+
+        profiles = np.zeros((len(skill_lists), dim), dtype=np.float32)
+        for i, (skills, experience) in enumerate(zip(skill_lists, experience_texts)):
+            rows = [row_of[skill] for skill in skills if skill]
+            parts = [matrix[rows].mean(axis=0)] if rows else []
+            if experience:
+                parts.append(matrix[row_of[experience]])
+            if parts:
+                vector = np.mean(parts, axis=0)
+                norm = np.linalg.norm(vector)
+                profiles[i] = vector / norm if norm else vector
+        return profiles
+
+    def save_embeddings(self):
+        """Flushes any embeddings still queued for the on-disk store."""
+        self.store.flush()
+
+    def similarity_matrix(self, texts_a, texts_b):
+        """
+        Cosine similarity of every (a, b) pair: two batched encodes + one normalized matmul.
+        Returns a NumPy array of shape (len(texts_a), len(texts_b)).
+        """
+        matrix = util.cos_sim(self.get_embeddings(texts_a), self.get_embeddings(texts_b)).cpu().numpy()
+        # Same rule as calculate_similarity: an empty text scores 0.0 against anything
+        matrix[[not text for text in texts_a], :] = 0.0
+        matrix[:, [not text for text in texts_b]] = 0.0
+        return matrix
         
     def analyze_skill_gap(self, candidate_skills, jd_skills):
         """Performs a semantic skill gap analysis (Matched vs Missing)."""
         if not jd_skills:
             return {"score": 0.0, "matched": [], "missing": []}
             
-        matched_skills = []
-        missing_skills = []
-        total_score = 0.0
-        
-        for jd_skill in jd_skills:
-            if not candidate_skills:
-                missing_skills.append(jd_skill)
-                continue
-                
-            # Find the closest semantic match in the candidate's list
-            best_match_score = max([self.calculate_similarity(jd_skill, c_skill) for c_skill in candidate_skills])
-            
-            # If the score is higher than our threshold, it's a match!
-            if best_match_score >= self.threshold:
-                matched_skills.append(jd_skill)
-                total_score += best_match_score
-            else:
-                missing_skills.append(jd_skill)
-                total_score += best_match_score # We still keep partial credit for the score
+        if not candidate_skills:
+            return {"score": 0.0, "matched": [], "missing": list(jd_skills)}
+
+        # --- VECTORIZED PATH ---
+        # One (jd x candidate) similarity matrix replaces the pair-by-pair double loop.
+        similarity = self.similarity_matrix(jd_skills, candidate_skills)
+
+        # Find the closest semantic match in the candidate's list (one max per JD skill).
+        # round() is monotonic, so rounding the row max equals the max of the rounded pair
+        # scores calculate_similarity used to return.
+        best_match_scores = [round(float(score), 3) for score in similarity.max(axis=1)]
+
+        # If the score is higher than our threshold, it's a match!
+        is_match = np.array(best_match_scores) >= self.threshold
+        matched_skills = [skill for skill, hit in zip(jd_skills, is_match) if hit]
+        missing_skills = [skill for skill, hit in zip(jd_skills, is_match) if not hit]
+
+        # We still keep partial credit for missing skills. Summed in JD order so the
+        # float total is bit-for-bit what the old loop accumulated.
+        total_score = sum(best_match_scores)
                 
         avg_score = round(total_score / len(jd_skills), 3)
         
@@ -0,0 +1,275 @@
+import os
+import json
+from bisect import insort
+import numpy as np
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+# Written by the parser next to its outputs (data/processed)
+SKILL_INDEX_FILENAME = ".skill_index.npz"
+
+# Bits set per byte value: popcount fallback for numpy < 2.0 (no np.bitwise_count)
+_BYTE_POPCOUNT = np.array([bin(value).count("1") for value in range(256)], dtype=np.uint8)
+
+
+def popcount(words):
+    """Set bits per row of a (rows, words) uint64 array."""
+    words = np.ascontiguousarray(words, dtype=np.uint64)
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words).sum(axis=-1, dtype=np.int64)
+    return _BYTE_POPCOUNT[words.view(np.uint8)].reshape(words.shape[:-1] + (-1,)).sum(axis=-1, dtype=np.int64)
+
+
+class SkillVocabulary:
+    """
+    Global skill vocabulary: every lowercased skill term gets a stable integer id.
+    Seeded from skills_db.json (names, aliases, related skills), skill_patterns.json and
+    synonyms_db.json; skills seen later on candidates are appended. Aliases and synonym
+    variants keep their own ids (exact-match semantics, like the string comparisons they
+    replace) and 'canonical' maps them to the id of the skill they stand for.
+    """
+
+    def __init__(self, terms=None):
+        self.ids = {}        # lowercased term -> id
+        self.names = []      # id -> term as first seen
+        self.canonical = {}  # alias id -> canonical skill id
+        for term in terms or []:
+            self.id_for(term)
+
+    @classmethod
+    def from_data_files(cls, data_dir=DATA_DIR):
+        vocabulary = cls()
+
+        def load(name, default):
+            try:
+                with open(os.path.join(data_dir, name), "r", encoding="utf-8") as f:
+                    return json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                return default
+
+        for skill in load("skills_db.json", []):
+            canonical_id = vocabulary.id_for(skill["name"])
+            for alias in skill.get("aliases", []):
+                vocabulary.add_alias(alias, canonical_id)
+            for related in skill.get("related_skills", []):
+                vocabulary.id_for(related)
+        for skills in load("skill_patterns.json", {}).values():
+            for skill in skills:
+                vocabulary.id_for(skill)
+        for name, variants in load("synonyms_db.json", {}).items():
+            canonical_id = vocabulary.id_for(name)
+            for variant in variants:
+                vocabulary.add_alias(variant, canonical_id)
+        return vocabulary
+
+    def __len__(self):
+        return len(self.names)
+
+    @property
+    def words(self):
+        """uint64 words per bitset at the current vocabulary size."""
+        return max(1, (len(self.names) + 63) // 64)
+
+    def id_for(self, skill, add=True):
+        """Id of a skill (case-insensitive); unknown skills are appended unless add=False (then None)."""
+        key = skill.lower()
+        skill_id = self.ids.get(key)
+        if skill_id is None and add:
+            skill_id = self.ids[key] = len(self.names)
+            self.names.append(skill)
+        return skill_id
+
+    def add_alias(self, alias, canonical_id):
+        alias_id = self.id_for(alias)
+        if alias_id != canonical_id:
+            self.canonical.setdefault(alias_id, canonical_id)
+        return alias_id
+
+    def resolve(self, skill):
+        """Canonical id for a skill or alias ('py' -> Python); None if unknown."""
+        skill_id = self.id_for(skill, add=False)
+        return self.canonical.get(skill_id, skill_id)
+
+    def encode(self, skills, words=None, add=True):
+        """
+        Packed bitset (uint64 words) of a skill list; bit i set <=> skill id i present.
+        add=False leaves unknown skills out instead of growing the vocabulary.
+        """
+        ids = [self.id_for(skill, add) for skill in skills or []]
+        bits = np.zeros(max(words or 0, self.words), dtype=np.uint64)
+        for skill_id in ids:
+            if skill_id is None:
+                continue
+            bits[skill_id >> 6] |= np.uint64(1) << np.uint64(skill_id & 63)
+        return bits
+
+    def decode(self, bits):
+        return [self.names[word * 64 + bit] for word, value in enumerate(bits.tolist())
+                for bit in range(64) if value >> bit & 1]
+
+
+class SkillBitsetIndex:
+    """
+    Per-candidate skills as packed bitsets plus an inverted index (skill id -> sorted rows).
+    'All mandatory skills present' is AND + popcount over the bitset matrix;
+    'who knows Kubernetes and SQL' is a posting-list intersection, smallest list first.
+    """
+
+    def __init__(self, vocabulary=None):
+        self.vocabulary = vocabulary or SkillVocabulary.from_data_files()
+        self.ids = []          # row -> candidate id
+        self._row_of = {}      # candidate id -> row
+        self.bitsets = np.zeros((0, self.vocabulary.words), dtype=np.uint64)
+        self.postings = {}     # skill id -> sorted rows
+        self._masks = {}       # frozenset of skills -> (vocabulary size, encoded mask)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, candidate_id):
+        return candidate_id in self._row_of
+
+    def _fit_words(self, words):
+        """Widens the bitset matrix when the vocabulary has outgrown it (new bits start cleared)."""
+        if words > self.bitsets.shape[1]:
+            grown = np.zeros((len(self.bitsets), words), dtype=np.uint64)
+            grown[:, :self.bitsets.shape[1]] = self.bitsets
+            self.bitsets = grown
+
+    def add(self, candidate_id, skills):
+        """Indexes (or re-indexes) one candidate's skill list."""
+        bits = self.vocabulary.encode(skills)
+        self._fit_words(len(bits))
+        row = self._row_of.get(candidate_id)
+        if row is None:
+            row = self._row_of[candidate_id] = len(self.ids)
+            self.ids.append(candidate_id)
+            if row == len(self.bitsets):
+                grown = np.zeros((max(16, 2 * len(self.bitsets)), self.bitsets.shape[1]), dtype=np.uint64)
+                grown[:len(self.bitsets)] = self.bitsets
+                self.bitsets = grown
+        else:
+            for skill_id in self._skill_ids(self.bitsets[row]):
+                self.postings[skill_id].remove(row)
+
+        self.bitsets[row] = 0
+        self.bitsets[row, :len(bits)] = bits
+        for skill_id in self._skill_ids(bits):
+            insort(self.postings.setdefault(skill_id, []), row)
+
+    def remove(self, candidate_id):
+        """Drops a candidate (e.g. a deleted resume): the last row moves into its slot. False if unknown."""
+        row = self._row_of.pop(candidate_id, None)
+        if row is None:
+            return False
+        last = len(self.ids) - 1
+        for skill_id in self._skill_ids(self.bitsets[row]):
+            postings = self.postings[skill_id]
+            postings.remove(row)
+            if not postings:
+                del self.postings[skill_id]
+        if row != last:
+            moved_id = self.ids[last]
+            for skill_id in self._skill_ids(self.bitsets[last]):
+                postings = self.postings[skill_id]
+                postings.remove(last)
+                insort(postings, row)
+            self.bitsets[row] = self.bitsets[last]
+            self.ids[row] = moved_id
+            self._row_of[moved_id] = row
+        self.bitsets[last] = 0
+        self.ids.pop()
+        return True
+
+    def add_many(self, candidates):
+        """candidates: iterable of (candidate id, skill list)."""
+        for candidate_id, skills in candidates:
+            self.add(candidate_id, skills)
+        return self
+
+    @staticmethod
+    def _skill_ids(bits):
+        return [word * 64 + bit for word, value in enumerate(bits.tolist()) if value
+                for bit in range(64) if value >> bit & 1]
+
+    def rows_for(self, candidate_ids):
+        return np.array([self._row_of[candidate_id] for candidate_id in candidate_ids], dtype=np.int64)
+
+    def mask(self, skills):
+        """
+        Encoded bitset of a skill set (cached, e.g. a role's mandatory skills).
+        A skill no candidate has ever listed gets no bit and does not grow the vocabulary.
+        """
+        key = frozenset(skill.lower() for skill in skills)
+        cached = self._masks.get(key)
+        if cached is None or cached[0] != len(self.vocabulary):
+            cached = self._masks[key] = (len(self.vocabulary), self.vocabulary.encode(sorted(key), add=False))
+        return cached[1]
+
+    def matched_counts(self, skills, rows=None):
+        """How many of 'skills' each candidate has: popcount(bitset AND mask)."""
+        mask = self.mask(skills)
+        self._fit_words(len(mask))
+        bitsets = self.bitsets[:len(self.ids)] if rows is None else self.bitsets[rows]
+        return popcount(bitsets[:, :len(mask)] & mask)
+
+    def has_all(self, skills, rows=None):
+        """
+        Boolean per candidate: every skill in 'skills' present (case-insensitive exact match).
+        Compared against the number of distinct skills asked for, so an unknown skill is never matched.
+        """
+        required = len({skill.lower() for skill in skills})
+        return self.matched_counts(skills, rows) == required
+
+    def query(self, skills, canonical=False):
+        """
+        Candidate ids with ALL the given skills, via posting-list intersection.
+        canonical=True also accepts any alias of each skill ('k8s' for Kubernetes).
+        """
+        groups = []
+        for skill in skills:
+            skill_id = self.vocabulary.id_for(skill, add=False)
+            if canonical and skill_id is not None:
+                root = self.vocabulary.canonical.get(skill_id, skill_id)
+                members = [root] + [alias for alias, target in self.vocabulary.canonical.items() if target == root]
+                rows = sorted({row for member in members for row in self.postings.get(member, [])})
+            else:
+                rows = self.postings.get(skill_id, [])
+            groups.append(rows)
+        if not groups:
+            return []
+
+        groups.sort(key=len)
+        result = np.array(groups[0], dtype=np.int64)
+        for rows in groups[1:]:
+            if not len(result):
+                break
+            result = result[np.isin(result, rows, assume_unique=True)]
+        return [self.ids[row] for row in result]
+
+    # ---------- persistence ----------
+    def save(self, path):
+        tmp_path = path + ".tmp.npz"
+        np.savez(tmp_path, ids=np.array(self.ids, dtype=str), bitsets=self.bitsets[:len(self.ids)],
+                 terms=np.array(self.vocabulary.names, dtype=str),
+                 aliases=np.array(list(self.vocabulary.canonical.items()), dtype=np.int64).reshape(-1, 2))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load_or_create(cls, path):
+        if os.path.exists(path):
+            return cls.load(path)
+        return cls()
+
+    @classmethod
+    def load(cls, path):
+        data = np.load(path)
+        vocabulary = SkillVocabulary(str(term) for term in data["terms"])
+        vocabulary.canonical = {int(alias): int(target) for alias, target in data["aliases"]}
+        index = cls(vocabulary)
+        index.ids = [str(candidate_id) for candidate_id in data["ids"]]
+        index._row_of = {candidate_id: row for row, candidate_id in enumerate(index.ids)}
+        index.bitsets = data["bitsets"].copy()
+        for row, bits in enumerate(index.bitsets):
+            for skill_id in cls._skill_ids(bits):
+                index.postings.setdefault(skill_id, []).append(row)
+        return index
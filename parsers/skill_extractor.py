@@ -1,9 +1,12 @@
 import json
 import os
-import re
+try:
+    from parsers.skill_matcher import SkillMatcher
+except ImportError:  # Run as a script: python parsers/skill_extractor.py
+    from skill_matcher import SkillMatcher
 
 class SkillExtractor:
-    def __init__(self):
+    def __init__(self, related_depth=1, inferred_confidence=50, confidence_decay=0.5):
         # 1. Load the Skill Database
         base_dir = os.path.dirname(os.path.abspath(__file__))
         db_path = os.path.join(base_dir, "..", "data", "skills_db.json")
@@ -16,53 +19,87 @@ class SkillExtractor:
             print("❌ Error: skills_db.json not found. Please create it in 'data' folder.")
             self.skill_db = []
 
+        # 2. Compile ONCE: one Aho-Corasick matcher over every official name (100) and alias (90),
+        # labelled with the skill's position in the DB, instead of a fresh regex per keyword per call
+        keywords = []
+        for position, skill in enumerate(self.skill_db):
+            keywords.append((skill["name"], (position, 100)))
+            keywords.extend((alias, (position, 90)) for alias in skill.get("aliases", []))
+        self.matcher = SkillMatcher(keywords)
+
+        # 3. Related-skill closure as an adjacency table (see build_related_closure)
+        self.related_depth = related_depth
+        self.inferred_confidence = inferred_confidence
+        self.confidence_decay = confidence_decay
+        self.related_closure = self.build_related_closure()
+
+    def build_related_closure(self):
+        """
+        Precomputes, per DB skill, every skill reachable through 'related_skills' within
+        related_depth hops (breadth-first, so the order matches the DB lists at depth 1).
+        Hop 1 gets inferred_confidence; every further hop is multiplied by confidence_decay.
+        """
+        by_name = {}
+        for skill in self.skill_db:
+            by_name.setdefault(skill["name"], skill)
+
+        closure = []
+        for skill in self.skill_db:
+            inferred = []
+            seen = {skill["name"]}
+            frontier = [skill]
+            confidence = self.inferred_confidence
+            for _ in range(self.related_depth):
+                next_frontier = []
+                for current in frontier:
+                    for related in current.get("related_skills", []):
+                        if related in seen:
+                            continue
+                        seen.add(related)
+                        inferred.append((related, round(confidence)))
+                        if related in by_name:
+                            next_frontier.append(by_name[related])
+                frontier = next_frontier
+                confidence *= self.confidence_decay
+            closure.append(inferred)
+        return closure
+
     def extract_skills(self, text):
         """
         Scans text for skills and returns a dictionary with confidence scores.
         Output format: {'Python': 100, 'Machine Learning': 90, 'NumPy': 50}
         """
         found_skills = {} # Dictionary to store Skill + Score
-        text_lower = text.lower()
 
-        # 2. Direct Extraction Loop
-        for skill in self.skill_db:
-            official_name = skill["name"]
-            score = 0
-            
-            # Check A: Exact Match (High Confidence)
-            if self._is_match(official_name, text_lower):
-                score = 100 
-            
-            # Check B: Alias Match (Medium Confidence)
-            else:
-                for alias in skill.get("aliases", []):
-                    if self._is_match(alias, text_lower):
-                        score = 90
-                        break # Stop checking aliases if one matches
-            
-            # If we found the skill, save it!
-            if score > 0:
-                # Only update if we found a higher score (e.g., don't downgrade 100 to 90)
-                if found_skills.get(official_name, 0) < score:
-                    found_skills[official_name] = score
+        # 2. Direct Extraction: one pass over the text; best score per DB skill
+        # (Exact Match = High Confidence 100, Alias Match = Medium Confidence 90)
+        best = {}
+        for position, score in self.matcher.find_all(text):
+            if best.get(position, 0) < score:
+                best[position] = score
+
+        # Visit matched skills in DB order, so the dictionary order stays the same as before
+        for position in sorted(best):
+            official_name = self.skill_db[position]["name"]
+            score = best[position]
 
-                # --- NEW: SKILL STACK INFERENCE (The "Magic" Part) ---
-                # If they know "Pandas", they probably know "NumPy" too.
-                # We add these as "Inferred Skills" with Low Confidence (50%).
-                for related in skill.get("related_skills", []):
-                    # Only add if we haven't found this skill explicitly yet
-                    if related not in found_skills:
-                        found_skills[related] = 50 
+            # Only update if we found a higher score (e.g., don't downgrade 100 to 90)
+            if found_skills.get(official_name, 0) < score:
+                found_skills[official_name] = score
+
+            # --- SKILL STACK INFERENCE (The "Magic" Part) ---
+            # If they know "Pandas", they probably know "NumPy" too.
+            # Inferred skills come from the precomputed closure with Low Confidence (50% by default).
+            for related, confidence in self.related_closure[position]:
+                # Never downgrade a skill found explicitly (or inferred more strongly)
+                if found_skills.get(related, 0) < confidence:
+                    found_skills[related] = confidence
 
         return found_skills
 
-    def _is_match(self, keyword, text):
-        """
-        Helper: Returns True if the keyword exists as a whole word.
-        """
-        # \b ensures we match "Java" but not "JavaScript" by accident
-        pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
-        return re.search(pattern, text) is not None
+    def extract_skills_batch(self, texts):
+        """extract_skills for many texts (e.g. every section of every resume), same matcher and closure."""
+        return [self.extract_skills(text) for text in texts]
 
 # --- Test Block ---
 if __name__ == "__main__":
@@ -0,0 +1,86 @@
+from collections import deque
+
+
+class SkillMatcher:
+    r"""
+    Single-pass multi-keyword matcher (Aho-Corasick automaton).
+    Finds every keyword in one walk over the text, with the same whole-word
+    rules as re.search(r'\b' + re.escape(keyword) + r'\b', text, re.IGNORECASE).
+    """
+
+    def __init__(self, keywords):
+        # keywords: a list of strings, a dict of {keyword: label}, or (keyword, label) pairs.
+        # Several keywords may share one label (e.g. synonyms -> official skill),
+        # and with pairs one keyword may carry several labels.
+        if isinstance(keywords, dict):
+            keywords = keywords.items()
+        else:
+            keywords = [item if isinstance(item, tuple) else (item, item) for item in keywords]
+
+        # 1. Build the keyword trie (goto table) on lowercased keywords
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]  # node -> list of (keyword_length, label)
+
+        for keyword, label in keywords:
+            key = keyword.lower()
+            if not key:
+                continue
+            node = 0
+            for char in key:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                node = next_node
+            self._output[node].append((len(key), label))
+
+        # 2. Breadth-first pass to wire up the failure links
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                # Inherit the matches of the longest proper suffix
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    @staticmethod
+    def _is_word_char(char):
+        return char.isalnum() or char == "_"
+
+    def _at_boundary(self, text, index):
+        """Mirrors regex \\b: word-ness of the chars on each side must differ."""
+        before = index > 0 and self._is_word_char(text[index - 1])
+        after = index < len(text) and self._is_word_char(text[index])
+        return before != after
+
+    def iter_matches(self, text):
+        """Yields (start, end, label) for every whole-word keyword hit."""
+        if not text:
+            return
+        lowered = text.lower()
+        goto, fail, output = self._goto, self._fail, self._output
+        node = 0
+
+        for index, char in enumerate(lowered):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if not output[node]:
+                continue
+            end = index + 1
+            for length, label in output[node]:
+                start = end - length
+                if self._at_boundary(lowered, start) and self._at_boundary(lowered, end):
+                    yield start, end, label
+
+    def find_all(self, text):
+        """Returns the set of labels found anywhere in the text."""
+        return {label for _, _, label in self.iter_matches(text)}
@@ -1,5 +1,9 @@
 import re
 
+BULLETS = "•●▪■➤"
+# Compiled once; \s covers \r, \f, \v (and \x1c-\x1f) exactly like the original pattern
+BLANK_LINES = re.compile(r'\n\s*\n')
+
 def clean_text(text):
     """
     Standardizes text while preserving line structure.
@@ -8,17 +12,24 @@ def clean_text(text):
         return ""
 
     # 1. Normalize bullet points
-    text = re.sub(r"[•●▪■➤]", "-", text)
-    
     # 2. Remove weird non-ascii characters
-    text = text.encode("ascii", "ignore").decode()
+    # Bullets are non-ascii themselves, so pure-ASCII text (most resumes) skips both steps.
+    if not text.isascii():
+        for bullet in BULLETS:
+            if bullet in text:
+                text = text.replace(bullet, "-")
+        text = text.encode("ascii", "ignore").decode()
     
     # 3. Fix multiple spaces but KEEP newlines (Critical Fix)
     # The old code 're.sub(r'\s+', ' ', text)' destroyed newlines.
-    # This new code only fixes horizontal spaces (tabs/spaces).
-    text = re.sub(r'[ \t]+', ' ', text)
+    # This only fixes horizontal spaces (tabs/spaces): tabs become spaces, then
+    # double spaces are halved until none are left. Same result as
+    # re.sub(r'[ \t]+', ' ', text), but every pass is a C-speed str.replace.
+    text = text.replace("\t", " ")
+    while "  " in text:
+        text = text.replace("  ", " ")
     
     # 4. Fix excessive newlines (max 2)
-    text = re.sub(r'\n\s*\n', '\n\n', text)
+    text = BLANK_LINES.sub('\n\n', text)
     
-    return text.strip()
\ No newline at end of file
+    return text.strip()
@@ -0,0 +1,52 @@
+import numpy as np
+
+# Storage precisions for embeddings. Bytes per 384-dim MiniLM vector:
+# float32 = 1536, float16 = 768, int8 = 384 + 4 (per-vector scale)
+PRECISIONS = {"float32": np.float32, "float16": np.float16, "int8": np.int8}
+
+
+def check_precision(precision):
+    if precision not in PRECISIONS:
+        raise ValueError(f"Unknown precision '{precision}', expected one of {sorted(PRECISIONS)}")
+    return np.dtype(PRECISIONS[precision])
+
+
+def quantize(vectors, precision, unit=False):
+    """
+    Encodes float vectors as (codes, scales).
+    float32/float16: codes are the cast vectors, scales is None.
+    int8: symmetric per-vector quantization to [-127, 127]; the float32 scale maps codes back.
+    unit=True (int8): the scale is picked so each decoded vector has norm 1, so a dot
+    product with a unit query is exactly the cosine of the quantized direction.
+    """
+    dtype = check_precision(precision)
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if precision != "int8":
+        return vectors.astype(dtype), None
+    peak = np.abs(vectors).max(axis=-1, keepdims=True)
+    scales = np.where(peak == 0, 1.0, peak / 127.0).astype(np.float32)
+    codes = np.clip(np.rint(vectors / scales), -127, 127).astype(np.int8)
+    if unit:
+        norms = np.linalg.norm(codes.astype(np.float32), axis=-1, keepdims=True)
+        scales = np.where(norms == 0, 1.0, 1.0 / norms).astype(np.float32)
+    return codes, scales.reshape(vectors.shape[:-1])
+
+
+def dequantize(codes, scales=None):
+    """Back to float32 (only ever done on small batches or blocks)."""
+    matrix = np.asarray(codes, dtype=np.float32)
+    if scales is not None:
+        matrix = matrix * np.asarray(scales, dtype=np.float32)[..., None]
+    return matrix
+
+
+def dot_scores(codes, scales, query):
+    """
+    Scores one block of compact codes against a float32 query. Callers pass blocks,
+    so only one block is ever widened to float32; int8 rows are rescaled after the
+    matmul (one multiply per row instead of one per element).
+    """
+    scores = np.asarray(codes, dtype=np.float32) @ np.asarray(query, dtype=np.float32)
+    if scales is not None:
+        scores *= scales
+    return scores
@@ -0,0 +1,66 @@
+# performance_tuning/precision_benchmark.py
+import os
+import sys
+import time
+import numpy as np
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if base_dir not in sys.path:
+    sys.path.append(base_dir)
+
+from parsers.candidate_index import CandidateVectorIndex
+
+def generate_mock_embeddings(count: int, dim: int = 384, clusters: int = 200, seed: int = 7):
+    """Clustered unit vectors: closer to real MiniLM profiles than pure noise (many near-ties)."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dim)).astype(np.float32)
+    vectors = centers[rng.integers(0, clusters, count)] + 0.6 * rng.normal(size=(count, dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+def precision_report(vectors, queries, k: int = 100, precisions=("float32", "float16", "int8")):
+    """
+    Builds one index per precision and compares each against float32:
+    memory, query time, recall@k of the top-k ids, and drift of the returned scores.
+    """
+    reference = None
+    report = {}
+    for precision in precisions:
+        index = CandidateVectorIndex(vectors.shape[1], precision=precision)
+        index.add_many(list(range(len(vectors))), vectors)
+
+        start = time.perf_counter()
+        results = [index.search(query, k=k) for query in queries]
+        elapsed = time.perf_counter() - start
+
+        if reference is None:
+            reference = results
+        recalls, drifts = [], []
+        for got, truth in zip(results, reference):
+            truth_scores = dict(truth)
+            recalls.append(len(truth_scores.keys() & dict(got).keys()) / k)
+            # Drift of the score each precision gives the SAME candidate
+            drifts.extend(abs(score - truth_scores[cid]) for cid, score in got if cid in truth_scores)
+
+        report[precision] = {
+            "memory_mb": index.memory_bytes() / 1e6,
+            "ms_per_query": 1000 * elapsed / len(queries),
+            "recall_at_k": float(np.mean(recalls)),
+            "mean_drift": float(np.mean(drifts)),
+            "max_drift": float(np.max(drifts)),
+        }
+    return report
+
+def run_benchmark(candidate_count: int = 200000, query_count: int = 50, k: int = 100):
+    vectors = generate_mock_embeddings(candidate_count)
+    queries = generate_mock_embeddings(query_count, seed=11)
+
+    print("\n📊 EMBEDDING PRECISION BENCHMARK (vs float32)")
+    print("=" * 78)
+    print(f"{'precision':<10}{'memory MB':>12}{'ms/query':>12}{f'recall@{k}':>12}{'mean drift':>14}{'max drift':>14}")
+    for precision, row in precision_report(vectors, queries, k=k).items():
+        print(f"{precision:<10}{row['memory_mb']:>12.1f}{row['ms_per_query']:>12.2f}"
+              f"{row['recall_at_k']:>12.3f}{row['mean_drift']:>14.5f}{row['max_drift']:>14.5f}")
+    print("=" * 78 + "\n")
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,107 @@
+# performance_tuning/prune_threshold_benchmark.py
+import os
+import sys
+import json
+import numpy as np
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if base_dir not in sys.path:
+    sys.path.append(base_dir)
+
+from parsers.matching_cascade import MatchingCascade, normalize
+
+DATA_DIR = os.path.join(base_dir, "data")
+THRESHOLDS = (0.0, 0.02, 0.05, 0.1, 0.15, 0.2, 0.3)
+
+def _load(name, default):
+    try:
+        with open(os.path.join(DATA_DIR, name), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return default
+
+def real_skill_lists():
+    """
+    (JD skills, resume skills) the cascade actually compares in production:
+    JD side from the parsed JD database, the default JD and the eligibility rules;
+    resume side from the parsed candidates plus the parser's skill vocabulary.
+    """
+    from master_orchestrator import DEFAULT_JD, stream_candidates
+
+    jd_skills = list(DEFAULT_JD["required_skills"])
+    for jd in _load(os.path.join("processed", "master_jobs_db.json"), []):
+        requirements = jd.get("requirements", {})
+        jd_skills += requirements.get("mandatory_skills", []) + requirements.get("nice_to_have_skills", [])
+    for rules in _load(os.path.join("demo_dataset", "eligibility_rules.json"), {}).values():
+        jd_skills += rules.get("mandatory_skills", [])
+
+    resume_skills = [skill for skills in _load("skill_patterns.json", {}).values() for skill in skills]
+    for _, candidate in stream_candidates(os.path.join(DATA_DIR, "processed"), columns=["skills"]):
+        skills = candidate.get("skills")
+        if isinstance(skills, list):
+            resume_skills += [skill for skill in skills if isinstance(skill, str)]
+
+    def unique(skills):
+        return list(dict.fromkeys(skill for skill in skills if isinstance(skill, str) and skill.strip()))
+    return unique(jd_skills), unique(resume_skills)
+
+def dictionary_matching_pairs():
+    """
+    Known matches without a model: every (skill, synonym/alias) pair of synonyms_db.json
+    and skills_db.json. In production the alias stage catches these, so they stand in
+    for the synonyms the dictionaries do NOT list, which only the transformer can match.
+    """
+    pairs = [(name, variant) for name, variants in _load("synonyms_db.json", {}).items() for variant in variants]
+    pairs += [(skill["name"], alias) for skill in _load("skills_db.json", []) for alias in skill.get("aliases", [])]
+    return [(a, b) for a, b in dict.fromkeys(pairs) if normalize(a) != normalize(b)]
+
+def semantic_matching_pairs(cascade, jd_skills, resume_skills, semantic_engine):
+    """
+    Ground truth from the full semantic matrix: every (JD, resume) skill pair the transformer
+    scores at or above its threshold and that reaches the prune stage (not exact/alias).
+    """
+    matrix = semantic_engine.similarity_matrix(jd_skills, resume_skills)
+    return [(jd_skill, resume_skill)
+            for i, jd_skill in enumerate(jd_skills) for j, resume_skill in enumerate(resume_skills)
+            if matrix[i, j] >= semantic_engine.threshold
+            and cascade.lexical_match(jd_skill, resume_skill)[1] not in ("exact", "alias")]
+
+def pruned_share(cascade, jd_skills, resume_skills, thresholds=THRESHOLDS):
+    """Per threshold, the share of (JD, resume) pairs the prune stage keeps away from the transformer."""
+    similarities = np.array([cascade.ngram_similarity(normalize(a), normalize(b))
+                             for a in jd_skills for b in resume_skills
+                             if cascade.lexical_match(a, b)[1] not in ("exact", "alias")])
+    total = len(jd_skills) * len(resume_skills)
+    return {threshold: (float(np.sum(similarities < threshold)) / total if total else 0.0)
+            for threshold in thresholds}
+
+def pick_threshold(recall, target=1.0):
+    """Largest threshold whose recall still meets the target (0.0 = pruning off)."""
+    return max([threshold for threshold, value in recall.items() if value >= target] + [0.0])
+
+def run_benchmark(target=1.0):
+    cascade = MatchingCascade()
+    jd_skills, resume_skills = real_skill_lists()
+    reports = {"dictionary synonyms": cascade.prune_recall(dictionary_matching_pairs(), THRESHOLDS)}
+    try:
+        from parsers.semantic_engine import SemanticEngine
+        engine = SemanticEngine()
+        reports["semantic matrix"] = cascade.prune_recall(
+            semantic_matching_pairs(cascade, jd_skills, resume_skills, engine), THRESHOLDS)
+    except ImportError:
+        print("⚠️ sentence_transformers not installed: recall is measured on dictionary synonyms only")
+    saved = pruned_share(cascade, jd_skills, resume_skills)
+
+    print(f"\n📊 PRUNE THRESHOLD BENCHMARK ({len(jd_skills)} JD x {len(resume_skills)} resume skills)")
+    print("=" * 78)
+    print(f"{'threshold':<12}" + "".join(f"{f'recall ({name})':>26}" for name in reports) + f"{'pairs pruned':>16}")
+    for threshold in THRESHOLDS:
+        print(f"{threshold:<12}" + "".join(f"{report[threshold]:>26.3f}" for report in reports.values())
+              + f"{saved[threshold]:>16.1%}")
+    print("=" * 78)
+    chosen = min(pick_threshold(report, target) for report in reports.values())
+    print(f"✅ Largest threshold with recall >= {target:.0%}: {chosen}\n")
+    return chosen
+
+if __name__ == "__main__":
+    run_benchmark()
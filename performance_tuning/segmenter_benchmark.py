@@ -0,0 +1,63 @@
+# performance_tuning/segmenter_benchmark.py
+import os
+import re
+import sys
+import time
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if base_dir not in sys.path:
+    sys.path.append(base_dir)
+
+from parsers.resume_segmenter import ResumeSegmenter
+
+def legacy_detect_header(segmenter, line):
+    """The pre-index implementation: uncompiled re.fullmatch over every pattern of every section."""
+    clean_line = re.sub(r"[^a-zA-Z\s]", "", line).strip().lower()
+    if len(clean_line.split()) > 5:
+        return None
+    for section, patterns in segmenter.HEADER_PATTERNS.items():
+        for pattern in patterns:
+            if re.fullmatch(pattern, clean_line):
+                return section
+    return None
+
+def generate_mock_lines(count: int) -> list:
+    body = [
+        "Data Analyst Intern at TechCorp",
+        "- Built statistical models using R and Python for churn prediction",
+        "Jan 2021 - Present",
+        "MSc in Statistics, Pondicherry University",
+        "Python, R, SQL, Pandas, Tableau",
+    ]
+    headers = ["*** Professional Experience ***", "EDUCATION", "Technical Skills", "Certifications:"]
+    lines = []
+    for i in range(count):
+        lines.append(headers[i % len(headers)] if i % 12 == 0 else body[i % len(body)])
+    return lines
+
+def run_benchmark(line_count: int = 200000):
+    segmenter = ResumeSegmenter()
+    lines = generate_mock_lines(line_count)
+
+    print("\n📊 RESUME SEGMENTER HEADER DETECTION BENCHMARK")
+    print("=" * 48)
+
+    # --- TEST 1: The Old Way (regex loop per line) ---
+    start = time.perf_counter()
+    legacy = [legacy_detect_header(segmenter, line) for line in lines]
+    legacy_time = time.perf_counter() - start
+    print(f"Legacy loop:     {line_count / legacy_time:>12,.0f} lines/sec")
+
+    # --- TEST 2: The New Way (precompiled header index) ---
+    start = time.perf_counter()
+    indexed = [segmenter.detect_header(line) for line in lines]
+    indexed_time = time.perf_counter() - start
+    print(f"Header index:    {line_count / indexed_time:>12,.0f} lines/sec")
+
+    assert legacy == indexed, "Header index disagrees with the legacy loop!"
+
+    print("=" * 48)
+    print(f"🚀 Speed-up: {legacy_time / indexed_time:.1f}x (identical output)\n")
+
+if __name__ == "__main__":
+    run_benchmark()
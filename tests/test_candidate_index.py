@@ -0,0 +1,191 @@
+import os
+import sys
+import numpy as np
+import pytest
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if base_dir not in sys.path:
+    sys.path.append(base_dir)
+
+from parsers.candidate_index import CandidateVectorIndex, profile_parts, profile_tag
+
+
+def _random_index(count=2000, dim=32, seed=0):
+    rng = np.random.default_rng(seed)
+    vectors = rng.normal(size=(count, dim)).astype(np.float32)
+    index = CandidateVectorIndex(dim)
+    index.add_many([f"cand_{i}.json" for i in range(count)], vectors)
+    return index, vectors, rng
+
+
+def _brute_force(vectors, query, k):
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    scores = unit @ (query / np.linalg.norm(query))
+    return [f"cand_{i}.json" for i in np.argsort(-scores)[:k]]
+
+
+def test_exact_search_matches_brute_force_across_blocks():
+    index, vectors, rng = _random_index()
+    query = rng.normal(size=32)
+    results = index.search(query, k=25, block_size=300)
+    assert [candidate_id for candidate_id, _ in results] == _brute_force(vectors, query, 25)
+    scores = [score for _, score in results]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_ivf_search_has_high_recall():
+    index, vectors, rng = _random_index()
+    index.train_ivf(nlist=20)
+    recalls = []
+    for _ in range(20):
+        query = rng.normal(size=32)
+        truth = set(_brute_force(vectors, query, 50))
+        found = {candidate_id for candidate_id, _ in index.search(query, k=50, mode="ivf", nprobe=10)}
+        recalls.append(len(truth & found) / 50)
+    assert np.mean(recalls) >= 0.8
+
+
+def test_incremental_add_and_replace():
+    index, _, rng = _random_index(count=200)
+    index.train_ivf(nlist=8)
+    target = rng.normal(size=32)
+
+    index.add("new.json", target, tag="v1")
+    assert len(index) == 201
+    assert index.search(target, k=1, mode="ivf", nprobe=1)[0][0] == "new.json"
+
+    # Replacing keeps one row per id and moves it to its new bucket
+    index.add("new.json", -target, tag="v2")
+    assert len(index) == 201
+    assert index.tag("new.json") == "v2"
+    assert index.search(-target, k=1, mode="ivf", nprobe=1)[0][0] == "new.json"
+    assert sum(len(bucket) for bucket in index._lists) == 201
+
+
+def test_save_and_load_round_trip(tmp_path):
+    index, _, rng = _random_index(count=300)
+    index.train_ivf(nlist=10)
+    path = str(tmp_path / "candidate_index.npz")
+    index.save(path)
+
+    loaded = CandidateVectorIndex.load(path)
+    query = rng.normal(size=32)
+    assert loaded.search(query, k=10) == index.search(query, k=10)
+    assert loaded.search(query, k=10, mode="ivf", nprobe=3) == index.search(query, k=10, mode="ivf", nprobe=3)
+
+
+def test_ivf_retrains_once_the_index_doubles_and_loads_its_buckets(tmp_path):
+    index, _, rng = _random_index(count=400)
+    assert index.needs_training()
+    index.train_ivf()
+    assert (index.trained_size, len(index.centroids)) == (400, 20) and not index.needs_training()
+
+    index.add_many([f"new_{i}.json" for i in range(399)], rng.normal(size=(399, 32)))
+    assert not index.needs_training()
+    index.add("one_more.json", rng.normal(size=32))
+    assert index.needs_training()
+    index.train_ivf()
+    assert len(index.centroids) == 28 and not index.needs_training()
+
+    path = str(tmp_path / "candidate_index.npz")
+    index.save(path)
+    loaded = CandidateVectorIndex.load(path)
+    assert loaded.trained_size == 800 and not loaded.needs_training()
+    assert loaded._lists == index._lists
+    assert np.array_equal(loaded._assign[:len(loaded)], index._assign[:len(index)])
+
+    # A file saved before the assignment was persisted recomputes the same buckets
+    with np.load(path) as data:
+        arrays = {key: data[key] for key in data.files if key not in ("assign", "trained_size")}
+    np.savez(path, **arrays)
+    legacy = CandidateVectorIndex.load(path)
+    assert legacy._lists == index._lists and legacy.trained_size == len(index)
+
+
+def test_interrupted_save_keeps_the_published_index(tmp_path, monkeypatch):
+    index, _, _ = _random_index(count=50)
+    path = str(tmp_path / "candidate_index.npz")
+    index.save(path)
+
+    def torn_savez(file, **arrays):
+        with open(file, "wb") as f:
+            f.write(b"PK\x03\x04 half an archive")
+        raise OSError("disk full")
+    monkeypatch.setattr(np, "savez", torn_savez)
+    index.remove("cand_0.json")
+    with pytest.raises(OSError):
+        index.save(path)
+    monkeypatch.undo()
+    assert len(CandidateVectorIndex.load(path)) == 50
+
+
+def test_remove_keeps_exact_and_ivf_search_consistent(tmp_path):
+    index, vectors, rng = _random_index(count=500)
+    index.train_ivf(nlist=12)
+    removed = {f"cand_{i}.json" for i in range(0, 500, 7)} | {"cand_499.json"}
+    for candidate_id in sorted(removed):
+        assert index.remove(candidate_id)
+    assert not index.remove("cand_0.json")
+    assert len(index) == 500 - len(removed)
+    assert sorted(row for bucket in index._lists for row in bucket) == list(range(len(index)))
+
+    keep = [i for i in range(500) if f"cand_{i}.json" not in removed]
+    query = rng.normal(size=32)
+    unit = vectors[keep] / np.linalg.norm(vectors[keep], axis=1, keepdims=True)
+    expected = [f"cand_{keep[i]}.json" for i in np.argsort(-(unit @ query))[:20]]
+    assert [candidate_id for candidate_id, _ in index.search(query, k=20)] == expected
+    assert [candidate_id for candidate_id, _ in index.search(query, k=20, mode="ivf", nprobe=12)] == expected
+
+    path = str(tmp_path / "candidate_index.npz")
+    index.save(path)
+    loaded = CandidateVectorIndex.load(path)
+    assert loaded.search(query, k=20) == index.search(query, k=20)
+    assert loaded.ids == index.ids
+
+
+def test_ids_and_tags_load_without_pickle(tmp_path):
+    index = CandidateVectorIndex(4)
+    index.add_many(["a.json", "b.json"], np.eye(4)[:2], tags=["3f2a", None])
+    path = str(tmp_path / "candidate_index.npz")
+    index.save(path)
+    with np.load(path) as data:  # allow_pickle defaults to False
+        assert data["ids"].dtype.kind == "U" and data["tags"].dtype.kind == "U"
+    loaded = CandidateVectorIndex.load(path)
+    assert (loaded.ids, loaded.tags) == (["a.json", "b.json"], ["3f2a", None])
+
+    # An index saved in the old pickled format is rebuilt rather than unpickled
+    np.savez(path, precision=np.array("float32"), vectors=np.eye(4, dtype=np.float32)[:1],
+             scales=np.empty(0, np.float32), ids=np.array(["a.json"], dtype=object),
+             tags=np.array([None], dtype=object), centroids=np.empty((0, 4), np.float32))
+    assert len(CandidateVectorIndex.load_or_create(path, 4)) == 0
+
+
+def test_profile_parts_and_tag():
+    candidate = {"skills": ["Python", "SQL"],
+                 "experience_entries": [{"job_title": "Data Analyst", "company": "Acme"}, {"job_title": " "}]}
+    skills, experience = profile_parts(candidate)
+    assert skills == ["Python", "SQL"]
+    assert experience == "Data Analyst"
+    assert profile_tag(skills, experience) != profile_tag(["Python"], experience)
+    assert profile_parts({}) == ([], "")
+
+
+def test_compact_precisions_stay_close_to_float32(tmp_path):
+    index, vectors, rng = _random_index(count=1000)
+    query = rng.normal(size=32)
+    reference = dict(index.search(query, k=50))
+
+    for precision, tolerance in (("float16", 1e-3), ("int8", 2e-2)):
+        compact = CandidateVectorIndex(32, precision=precision)
+        compact.add_many(index.ids, vectors)
+        assert compact.memory_bytes() < index.memory_bytes()
+        results = compact.search(query, k=50, block_size=128)
+        overlap = [cid for cid, _ in results if cid in reference]
+        assert len(overlap) >= 45
+        assert all(abs(score - reference[cid]) < tolerance for cid, score in results if cid in reference)
+
+        path = str(tmp_path / f"{precision}.npz")
+        compact.save(path)
+        assert CandidateVectorIndex.load(path).search(query, k=50, block_size=128) == results
+        # Asking for another precision rebuilds instead of mixing encodings
+        assert len(CandidateVectorIndex.load_or_create(path, 32, precision="float32")) == 0
@@ -0,0 +1,173 @@
+import os
+import sys
+import pytest
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if base_dir not in sys.path:
+    sys.path.append(base_dir)
+
+from parsers.candidate_store import CandidateStore
+
+
+def test_put_get_stream_and_projection(tmp_path):
+    root = str(tmp_path / "store")
+    with CandidateStore(root, segment_max_bytes=200) as store:  # Tiny segments force rollovers
+        for i in range(20):
+            store.put(f"cand_{i}.json", {"name": f"Candidate {i}", "skills": ["Python"] * (i % 3)})
+        store.put("cand_3.json", {"name": "Updated", "skills": []})  # Supersedes the first write
+        store.delete("cand_5.json")
+        assert store.get("cand_3.json") == {"name": "Updated", "skills": []}
+        assert store.get("cand_5.json") is None
+
+    assert len(os.listdir(root)) > 3  # Several segments + index
+    reopened = CandidateStore(root)
+    assert len(reopened) == 19
+    assert reopened.get("cand_7.json", columns=["name"]) == {"name": "Candidate 7"}
+
+    streamed = dict(reopened.stream(columns=["name"]))
+    assert len(streamed) == 19
+    assert streamed["cand_3.json"] == {"name": "Updated"}
+    assert "cand_5.json" not in streamed
+
+
+def test_index_catches_up_after_crash_and_torn_write(tmp_path):
+    root = str(tmp_path / "store")
+    store = CandidateStore(root)
+    store.put("a.json", {"skills": ["SQL"]})
+    store.save()
+    store.put("b.json", {"skills": ["R"]})
+    store._writer.flush()  # Appended, but the index was never saved ("crash")
+    with open(os.path.join(root, CandidateStore.segment_name(0)), "ab") as f:
+        f.write(b'{"id": "c.json", "data": {"sk')  # Torn final line
+
+    recovered = CandidateStore(root)
+    assert recovered.ids() == ["a.json", "b.json"]
+    recovered.put("d.json", {"skills": []})  # Lands cleanly after the torn tail is cut off
+    recovered.close()
+    assert CandidateStore(root).ids() == ["a.json", "b.json", "d.json"]
+
+
+def _segment_bytes(root):
+    return sum(os.path.getsize(os.path.join(root, name)) for name in os.listdir(root) if name.endswith(".ndjson"))
+
+
+def test_compact_keeps_only_live_records(tmp_path):
+    root = str(tmp_path / "store")
+    with CandidateStore(root) as store:
+        for i in range(10):
+            store.put("same.json", {"version": i})
+        store.put("gone.json", {})
+        store.delete("gone.json")
+        store.save()
+        size_before = _segment_bytes(root)
+        store.compact()
+        assert _segment_bytes(root) < size_before
+        assert dict(store.stream()) == {"same.json": {"version": 9}}
+        store.put("new.json", {"version": 0})  # Appends after the compacted segments
+    assert dict(CandidateStore(root).stream()) == {"same.json": {"version": 9}, "new.json": {"version": 0}}
+
+
+@pytest.mark.parametrize("crash_at", ["replace", "remove"])
+def test_interrupted_compact_never_loses_records(tmp_path, monkeypatch, crash_at):
+    import parsers.candidate_store as candidate_store
+
+    root = str(tmp_path / "store")
+    store = CandidateStore(root, segment_max_bytes=120)
+    for i in range(12):
+        store.put(f"cand_{i % 4}.json", {"version": i})
+    store.delete("cand_3.json")
+    store.save()
+    expected = dict(store.stream())
+
+    real = getattr(os, crash_at)
+
+    def crash(path, *args):
+        if crash_at == "replace" and not str(path).endswith(".ndjson"):
+            return real(path, *args)
+        raise OSError("disk pulled")
+    # 'replace': dies moving the first staged segment in; 'remove': dies after publishing, before unlinking
+    monkeypatch.setattr(candidate_store.os, crash_at, crash)
+    with pytest.raises(OSError):
+        store.compact()
+    monkeypatch.undo()
+
+    recovered = CandidateStore(root)
+    assert dict(recovered.stream()) == expected
+    recovered.compact()  # The next compact finishes the job and clears the leftovers
+    assert dict(recovered.stream()) == expected
+    assert not os.path.exists(os.path.join(root, ".compact"))
+    recovered.close()
+    assert dict(CandidateStore(root).stream()) == expected
+
+
+def test_unchanged_puts_add_nothing_and_dead_lines_trigger_compaction(tmp_path, monkeypatch):
+    root = str(tmp_path / "store")
+    with CandidateStore(root) as store:
+        for i in range(5):
+            store.put(f"cand_{i}.json", {"name": f"Candidate {i}"})
+
+    store = CandidateStore(root)
+    size = _segment_bytes(root)
+    writes = []
+    monkeypatch.setattr(store, "_write_index", lambda: writes.append(1))
+    for i in range(5):
+        store.put(f"cand_{i}.json", {"name": f"Candidate {i}"})  # Same record again, e.g. a cache hit
+    store.save()
+    assert _segment_bytes(root) == size and writes == []
+    assert store.dead_ratio() == 0.0 and not store.compact_if_needed()
+    monkeypatch.undo()
+
+    for version in range(6):
+        store.put("cand_0.json", {"name": "Candidate 0", "version": version})
+    assert store.dead_ratio() > 0.5
+    assert store.compact_if_needed()
+    assert store.dead_ratio() == 0.0 and len(store) == 5
+    assert store.get("cand_0.json") == {"name": "Candidate 0", "version": 5}
+    store.close()
+
+
+def test_parquet_export_is_written_in_chunks(tmp_path):
+    pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    path = str(tmp_path / "candidates.parquet")
+    with CandidateStore(str(tmp_path / "store")) as store:
+        for i in range(8):
+            store.put(f"cand_{i}.json", {"name": f"C{i}", "skills": ["SQL"] * i,
+                                         "email": f"c{i}@mail.com" if i > 4 else None})
+        store.delete("cand_2.json")
+        assert store.export_parquet(path, chunk_rows=3) == 7
+        assert pq.ParquetFile(path).metadata.num_row_groups == 3  # 3 + 3 + 1 rows
+        rows = pq.read_table(path).to_pylist()
+        assert rows == [dict(record, candidate_id=candidate_id) for candidate_id, record in store.stream()]
+        assert rows[-1]["email"] == "c7@mail.com"  # Null in the first chunk, still typed for later ones
+
+        assert store.export_parquet(path, columns=["name"]) == 7
+        assert pq.read_table(path).column_names == ["name", "candidate_id"]
+
+    with CandidateStore(str(tmp_path / "empty")) as empty:
+        assert empty.export_parquet(str(tmp_path / "empty.parquet")) == 0
+
+
+def test_read_only_reader_never_republishes_the_index(tmp_path):
+    root = str(tmp_path / "store")
+    writer = CandidateStore(root)
+    writer.put("a.json", {"name": "A"})
+    writer.save()
+
+    reader = CandidateStore(root, read_only=True)
+    writer.put("b.json", {"name": "B"})  # Published by the writer while the reader is open
+    writer.save()
+    with open(os.path.join(root, "index.json"), "rb") as f:
+        published = f.read()
+    reader.close()
+    with open(os.path.join(root, "index.json"), "rb") as f:
+        assert f.read() == published
+    assert CandidateStore(root, read_only=True).get("b.json") == {"name": "B"}
+
+    with pytest.raises(PermissionError):
+        reader.put("c.json", {})
+    writer.close()
+
+    assert len(CandidateStore(str(tmp_path / "missing"), read_only=True)) == 0
+    assert not os.path.exists(str(tmp_path / "missing"))
@@ -0,0 +1,114 @@
+import os
+import sys
+import json
+import random
+import pytest
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if base_dir not in sys.path:
+    sys.path.append(base_dir)
+
+from parsers.dedup import NearDuplicateIndex, optimal_bands
+
+
+def _resume(rng, words=400):
+    vocab = [f"term{i}" for i in range(3000)]
+    return " ".join(rng.choice(vocab) for _ in range(words))
+
+
+def test_near_duplicates_map_to_canonical_copy():
+    rng = random.Random(0)
+    resumes = [_resume(rng) for _ in range(300)]
+    index = NearDuplicateIndex(threshold=0.8)
+    for i, text in enumerate(resumes):
+        assert index.check(f"cand_{i}.json", text) is None
+    assert len(index) == 300
+
+    # An agency copy: a handful of words edited and a new header line
+    words = resumes[42].split()
+    for position in range(0, len(words), 80):
+        words[position] = "edited"
+    assert index.check("agency_copy.json", "Submitted by Agency X\n" + " ".join(words)) == "cand_42.json"
+    assert "agency_copy.json" not in index.signatures  # Duplicates are not registered as canonical
+
+    # Re-checking a canonical against itself is not a duplicate; unrelated text isn't either
+    assert index.check("cand_7.json", resumes[7]) is None
+    assert index.check("fresh.json", _resume(rng)) is None
+
+
+def test_band_choice_and_persistence(tmp_path):
+    bands, rows = optimal_bands(128, 0.8)
+    assert bands * rows == 128 and rows > 1
+
+    rng = random.Random(1)
+    index = NearDuplicateIndex(threshold=0.8)
+    texts = {f"cand_{i}.json": _resume(rng) for i in range(20)}
+    for key, text in texts.items():
+        index.check(key, text)
+    index.remove("cand_3.json")
+    path = str(tmp_path / "dedup_index.npz")
+    index.save(path)
+
+    loaded = NearDuplicateIndex.load_or_create(path, threshold=0.8)
+    assert sorted(loaded.signatures) == sorted(index.signatures)
+    assert loaded.check("copy.json", texts["cand_5.json"]) == "cand_5.json"
+    assert loaded.check("copy.json", texts["cand_3.json"]) is None  # Removed canonical is forgotten
+    assert NearDuplicateIndex.load_or_create(str(tmp_path / "missing.npz")).signatures == {}
+
+
+def test_modified_canonical_that_became_a_duplicate_is_forgotten():
+    rng = random.Random(2)
+    base, other = _resume(rng), _resume(rng)
+    index = NearDuplicateIndex(threshold=0.8)
+    index.check("a.json", base)
+    index.check("b.json", other)
+    assert index.check("b.json", base + " tail") == "a.json"  # b.json was edited into a copy of a.json
+    assert "b.json" not in index.signatures
+    assert index.check("c.json", other) is None  # Nothing matches b.json's old text any more
+
+
+def _write_docx(path, text):
+    docx = pytest.importorskip("docx")
+    document = docx.Document()
+    for line in text.split("\n"):
+        document.add_paragraph(line)
+    document.save(str(path))
+
+
+def test_parser_pipeline_reuses_canonical_parse(tmp_path):
+    pytest.importorskip("docx")
+    spacy = pytest.importorskip("spacy")
+    sys.path.append(os.path.join(base_dir, "parsers"))
+    import parser_engine_v2 as pe
+    from parse_cache import ParseCache
+
+    pe.nlp = spacy.blank("en")  # No trained model needed: names fall back to the first line
+    rng = random.Random(3)
+    raw, out = tmp_path / "raw", tmp_path / "out"
+    raw.mkdir()
+    out.mkdir()
+    texts = {i: f"Person {i}\nperson{i}@mail.com\n" + _resume(rng, 300) for i in range(4)}
+    for i, text in texts.items():
+        _write_docx(raw / f"cand_{i}.docx", text)
+    _write_docx(raw / "cand_1_agency.docx", "Agency copy\n" + texts[1] + " extra words")
+
+    cache = ParseCache(str(tmp_path / "cache"), "v1")
+    skill_index = pe.SkillBitsetIndex()
+    paths = sorted(str(path) for path in raw.iterdir())
+    rows = list(pe.iter_batch_results(paths, str(out), mode="thread", workers=2, cache=cache,
+                                      dedup=NearDuplicateIndex(), skill_index=skill_index))
+    status = {row[0]: row[1] for row in rows}
+    assert status == {"cand_0.docx": "SUCCESS", "cand_1.docx": "SUCCESS", "cand_2.docx": "SUCCESS",
+                      "cand_3.docx": "SUCCESS", "cand_1_agency.docx": "DUPLICATE"}
+    with open(out / "cand_1_agency.json", encoding="utf-8") as f:
+        copy = json.load(f)
+    assert copy["duplicate_of"] == "cand_1.json" and copy["name"] == "Person 1"
+    assert cache.stats()["entries"] == 4  # The reused parse is not cached under the copy's bytes
+    # Every written candidate, duplicates included, is in the skill index
+    assert sorted(skill_index.ids) == sorted(f"{name.rsplit('.', 1)[0]}.json" for name in status)
+    assert list(skill_index.has_all(copy["skills"], skill_index.rows_for(["cand_1_agency.json"]))) == [True]
+
+    # Without dedup the copy is parsed on its own (not served the canonical parse from the cache)
+    rows = list(pe.iter_batch_results([str(raw / "cand_1_agency.docx")], str(out), mode="thread", workers=1,
+                                      cache=cache))
+    assert rows[0][1:3] == ["SUCCESS", "Agency copy"]
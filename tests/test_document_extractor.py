@@ -0,0 +1,51 @@
+import os
+import sys
+import pytest
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if base_dir not in sys.path:
+    sys.path.append(base_dir)
+
+fitz = pytest.importorskip("fitz")
+from parsers.document_extractor import extract_pdf, extract_document
+
+
+def make_pdf(pages, with_text=True):
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        if with_text:
+            page.insert_text((72, 72), f"Page {i} Python SQL experience")
+        else:
+            page.draw_rect(fitz.Rect(50, 50, 300, 300), fill=(0.2, 0.4, 0.6))
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def test_reads_from_bytes_and_caps_pages():
+    result = extract_pdf(make_pdf(40), max_pages=5)
+    assert result["status"] == "ok"
+    assert result["pages_read"] == 5 and result["page_count"] == 40
+    assert result["truncated"] is True
+    assert "Page 4 " in result["text"] and "Page 5 " not in result["text"]
+
+
+def test_caps_characters():
+    result = extract_pdf(make_pdf(10), max_chars=50)
+    assert len(result["text"]) == 50 and result["truncated"] is True
+    assert result["pages_read"] < 10
+
+
+def test_image_only_pdf_stops_early():
+    result = extract_pdf(make_pdf(30, with_text=False))
+    assert result["status"] == "image_only"
+    assert result["text"] == "" and result["pages_read"] == 3
+
+
+def test_sample_resume_matches_full_read():
+    path = os.path.join(base_dir, "data", "raw_resumes", "sample_resume.pdf")
+    with fitz.open(path) as doc:
+        full_text = "".join(page.get_text() for page in doc)
+    assert extract_document("sample_resume.pdf", path)["text"] == full_text
+    assert extract_document("photo.png", path) is None
@@ -0,0 +1,91 @@
+import os
+import sys
+import random
+import numpy as np
+import pytest
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if base_dir not in sys.path:
+    sys.path.append(base_dir)
+
+from parsers.eligibility_engine import EligibilityEngine
+
+
+def _random_candidates(count, seed=0):
+    rng = random.Random(seed)
+    pool = ["Python", "python", "SQL", "Machine Learning", "Statistical Modeling", "Excel", "Tableau"]
+    rows = []
+    for i in range(count):
+        row = {"filename": f"cand_{i}.json",
+               "skills": rng.sample(pool, rng.randint(0, 5)),
+               "experience_years": rng.choice([None, 0, 1, 2, 3.5, 8, 10, 12]),
+               "location": rng.choice(["Bangalore", "remote", "London", "Chennai", ""]),
+               "available": rng.choice([True, False, None])}
+        rows.append(row)
+    return rows
+
+
+def test_batch_matches_per_candidate_evaluation():
+    engine = EligibilityEngine()
+    rows = _random_candidates(2000)
+    ats = [random.Random(i).uniform(40, 100) for i in range(len(rows))]
+    columns = {key: [row[key] for row in rows] for key in rows[0]}
+
+    for role in ["Data Scientist", "Quantitative Analyst", "Unknown Role"]:
+        batch = engine.evaluate_batch(columns, ats, role)
+        for i, row in enumerate(rows):
+            single = engine.evaluate_candidate(row, ats[i], role)
+            assert batch["candidate_id"][i] == single["candidate_id"]
+            assert batch["eligibility_status"][i] == single["eligibility_status"]
+            for check in ["skill_match", "experience_match", "location_match", "availability_match"]:
+                assert bool(batch["checks"][check][i]) == bool(single["checks"][check])
+
+
+def test_plan_is_compiled_once_per_role():
+    engine = EligibilityEngine()
+    plan = engine.compile_plan("Data Scientist")
+    assert plan["mandatory_skills"] == frozenset({"python", "sql"})
+    assert "remote" in plan["allowed_locations"]
+    assert engine.compile_plan("Data Scientist") is plan
+
+    result = engine.evaluate_batch({"skills": [["PYTHON", "sql"]], "experience_years": [np.nan]}, [90], "Data Scientist")
+    assert list(result["checks"]["experience_match"]) == [False]  # Missing experience counts as 0 years
+    assert result["candidate_id"] == ["Unknown"]
+
+
+def test_bitset_skill_index_gives_same_decisions():
+    from parsers.skill_bitset import SkillBitsetIndex
+
+    engine = EligibilityEngine()
+    rows = _random_candidates(500, seed=1)
+    index = SkillBitsetIndex().add_many((row["filename"], row["skills"]) for row in rows)
+    ats = [random.Random(i).uniform(40, 100) for i in range(len(rows))]
+    columns = {key: [row[key] for row in rows] for key in rows[0]}
+
+    for role in ["Data Scientist", "Quantitative Analyst"]:
+        expected = engine.evaluate_batch(columns, ats, role)
+        indexed = engine.evaluate_batch(dict(columns, skills=[None] * len(rows)), ats, role, skill_index=index)
+        assert list(indexed["checks"]["skill_match"]) == list(expected["checks"]["skill_match"])
+        assert list(indexed["eligibility_status"]) == list(expected["eligibility_status"])
+
+
+def test_dataframe_with_missing_cells():
+    pd = pytest.importorskip("pandas")
+    engine = EligibilityEngine()
+    frame = pd.DataFrame({
+        "filename": ["a.json", np.nan, None],
+        "skills": [["Python", "SQL"], np.nan, None],
+        "experience_years": [3, np.nan, None],
+        "location": pd.Series(["Bangalore", np.nan, pd.NA], dtype=object),
+        "available": [True, np.nan, None],
+    })
+    rows = [{"filename": "a.json", "skills": ["Python", "SQL"], "experience_years": 3,
+             "location": "Bangalore", "available": True}, {}, {}]
+    ats = [90, 90, 50]
+    result = engine.evaluate_batch(frame, ats, "Data Scientist")
+    assert result["candidate_id"] == ["a.json", "Unknown", "Unknown"]
+    for i, row in enumerate(rows):
+        single = engine.evaluate_candidate(row, ats[i], "Data Scientist")
+        assert result["eligibility_status"][i] == single["eligibility_status"]
+        for check in ["skill_match", "experience_match", "location_match", "availability_match"]:
+            assert bool(result["checks"][check][i]) == bool(single["checks"][check])
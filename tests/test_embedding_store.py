@@ -0,0 +1,74 @@
+import os
+import sys
+import numpy as np
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if base_dir not in sys.path:
+    sys.path.append(base_dir)
+
+from parsers.embedding_store import EmbeddingStore
+
+
+def test_round_trip_across_processes_and_read_only_readers(tmp_path):
+    root = str(tmp_path)
+    writer = EmbeddingStore(root, "all-MiniLM-L6-v2", dim=4, flush_every=2)
+    vectors = np.arange(12, dtype=np.float32).reshape(3, 4)
+    writer.add_many(["Python", "SQL", "Excel"], vectors)  # First two hit the flush threshold
+    writer.flush()
+
+    reader = EmbeddingStore(root, "all-MiniLM-L6-v2", dim=4, read_only=True)
+    matrix, missing = reader.get_many(["  python ", "Tableau", "excel"])
+    assert missing == [1]
+    assert np.array_equal(matrix[0], vectors[0]) and np.array_equal(matrix[2], vectors[2])
+    # Zero-copy: single lookups are views into the read-only memory map
+    assert isinstance(reader.get("SQL"), np.memmap)
+
+    # Read-only readers keep new vectors in memory and never touch the files
+    reader.add_many(["Tableau"], np.ones((1, 4)))
+    reader.flush()
+    assert reader.get("tableau") is not None
+    assert EmbeddingStore(root, "all-MiniLM-L6-v2", dim=4, read_only=True).get("Tableau") is None
+
+    # Another model never shares vectors
+    assert EmbeddingStore(root, "other-model", dim=4, read_only=True).get("Python") is None
+
+
+def test_compaction_drops_orphan_rows(tmp_path):
+    store = EmbeddingStore(str(tmp_path), "m", dim=2)
+    store.add_many(["a", "b", "c"], np.array([[1, 1], [2, 2], [3, 3]]))
+    store.flush()
+
+    # Simulate a writer that crashed after appending vectors but before publishing the index
+    with open(store.vectors_path, "ab") as f:
+        f.write(np.zeros((5, 2), dtype=np.float32).tobytes())
+    del store.index[store.key("b")]
+    store._write_index()
+    store.refresh()
+    assert store._rows_on_disk == 8
+
+    store.compact()
+    assert store._rows_on_disk == 2 and len(store) == 2
+    assert store.get("c").tolist() == [3.0, 3.0] and store.get("b") is None
+
+
+def test_int8_store_round_trip_and_compaction(tmp_path):
+    root = str(tmp_path)
+    rng = np.random.default_rng(3)
+    vectors = rng.normal(size=(5, 8)).astype(np.float32)
+    writer = EmbeddingStore(root, "all-MiniLM-L6-v2", dim=8, precision="int8")
+    texts = ["Python", "SQL", "Excel", "Tableau", "R"]
+    writer.add_many(texts, vectors)
+    pending = writer.get("sql").copy()
+    writer.flush()
+
+    assert os.path.getsize(writer.vectors_path) == 5 * 8  # One byte per dimension
+    reader = EmbeddingStore(root, "all-MiniLM-L6-v2", dim=8, read_only=True, precision="int8")
+    matrix, missing = reader.get_many(texts)
+    assert missing == []
+    assert np.abs(matrix - vectors).max() <= np.abs(vectors).max() / 127
+    assert np.array_equal(reader.get("sql"), pending)  # Same value before and after the flush
+
+    writer.index.pop(writer.key("Excel"))
+    writer.compact()
+    assert os.path.getsize(writer.scales_path) == 4 * 4
+    assert np.array_equal(writer.get("R"), matrix[4])
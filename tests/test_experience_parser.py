@@ -0,0 +1,42 @@
+import os
+import sys
+from datetime import datetime
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if base_dir not in sys.path:
+    sys.path.append(base_dir)
+
+from parsers.experience_parser import ExperienceParser
+
+RESUME_A = """Data Analyst at TechCorp
+Jan 2016 - Dec 2017
+Quantitative Equity Analyst | Zerodha
+06/2019 to 2021
+Financial Analyst, HDFC
+2020 - Mar 2022"""
+
+RESUME_B = """Software Engineer at Acme
+2018 - 2019"""
+
+
+def test_merged_months_gaps_and_titles():
+    result = ExperienceParser().parse_experience(RESUME_A)
+
+    titles = [job["job_title"] for job in result["experience_entries"]]
+    assert titles == ["Data Analyst", "Quantitative Equity Analyst", "Financial Analyst"]
+    assert [job["duration_months"] for job in result["experience_entries"]] == [23, 19, 26]
+    # 2016-01..2017-12 (23) + 2019-06..2022-03 merged (33); the overlap isn't double counted
+    assert result["total_experience_years"] == round(56 / 12.0, 1)
+    assert result["employment_gaps"] == [
+        {"gap_duration_months": 18, "between_roles": "Data Analyst and Quantitative Equity Analyst"}
+    ]
+    assert "start_index" not in result["experience_entries"][0]
+
+
+def test_batch_api_matches_single_and_parse_date_contract():
+    parser = ExperienceParser()
+    assert parser.parse_experience_many([RESUME_A, RESUME_B, ""]) == [
+        parser.parse_experience(RESUME_A), parser.parse_experience(RESUME_B), parser.parse_experience("")
+    ]
+    assert parser.parse_date("March 2021") == datetime(2021, 3, 1)
+    assert parser.parse_date("Present").date() == datetime.today().date()
@@ -0,0 +1,60 @@
+import os
+import sys
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if base_dir not in sys.path:
+    sys.path.append(base_dir)
+
+from parsers.ingestion_manifest import IngestionManifest
+
+
+def test_scan_reports_only_new_modified_and_deleted(tmp_path):
+    inbox = tmp_path / "raw_resumes"
+    inbox.mkdir()
+    (inbox / "alice.pdf").write_bytes(b"alice v1")
+    (inbox / "bob.docx").write_bytes(b"bob v1")
+    (inbox / ".DS_Store").write_bytes(b"junk")
+    (inbox / "notes.txt").write_bytes(b"ignored")
+
+    manifest_path = str(tmp_path / "manifest.json")
+    manifest = IngestionManifest(manifest_path)
+
+    # Tick 1: everything is new
+    changed, deleted = manifest.scan(str(inbox))
+    assert sorted(os.path.basename(p) for p in changed) == ["alice.pdf", "bob.docx"]
+    assert deleted == []
+    for path in changed:
+        manifest.mark_processed(path, os.path.basename(path).rsplit('.', 1)[0] + ".json")
+    manifest.save()
+
+    # Tick 2 (after a restart): touch without a content change, edit one, delete one
+    manifest = IngestionManifest(manifest_path)
+    alice, bob = str(inbox / "alice.pdf"), str(inbox / "bob.docx")
+    os.utime(alice, (1, 1))
+    (inbox / "bob.docx").write_bytes(b"bob v2, longer")
+    (inbox / "carol.pdf").write_bytes(b"carol v1")
+
+    changed, deleted = manifest.scan(str(inbox))
+    assert sorted(os.path.basename(p) for p in changed) == ["bob.docx", "carol.pdf"]
+    assert deleted == []
+
+    os.remove(alice)
+    _, deleted = manifest.scan(str(inbox))
+    assert deleted == [alice]
+    assert manifest.remove(alice) == "alice.json"
+    assert bob in manifest.entries
+
+
+def test_mark_processed_returns_the_output_a_failed_reparse_leaves_behind(tmp_path):
+    inbox = tmp_path / "raw_resumes"
+    inbox.mkdir()
+    resume = inbox / "alice.pdf"
+    resume.write_bytes(b"alice v1")
+    manifest = IngestionManifest(str(tmp_path / "manifest.json"))
+
+    changed, _ = manifest.scan(str(inbox))
+    assert manifest.mark_processed(changed[0], "alice.json") is None
+    resume.write_bytes(b"alice v2, now unreadable")
+    changed, _ = manifest.scan(str(inbox))
+    assert manifest.mark_processed(changed[0], None) == "alice.json"  # Caller removes the stale output
+    assert manifest.remove(changed[0]) is None
@@ -0,0 +1,66 @@
+import os
+import re
+import sys
+import json
+import pytest
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# jd_parser is a script-style module that imports its helpers by bare name
+sys.path.append(os.path.join(base_dir, "parsers"))
+
+from jd_parser import extract_skills, load_skill_synonyms, parse_jd, parse_jds
+
+JD_TEXT = """Job Title: Equity Research Analyst
+We need 3-5 years of DCF valuation work, equity analysis and financial modeling in Excel.
+Nice to have: SEBI regulations, peer comparison."""
+
+
+def regex_skills(text, synonym_dict):
+    """The original one-regex-per-synonym loop, used as the reference answer."""
+    return {official for official, synonyms in synonym_dict.items()
+            if any(re.search(r'\b' + re.escape(s) + r'\b', text, re.IGNORECASE) for s in synonyms)}
+
+
+def test_compiled_index_matches_regex_loop():
+    synonyms = load_skill_synonyms()
+    for text in [JD_TEXT, "spreadsheets only", "intrinsic valuations and business fundamentals", ""]:
+        assert set(extract_skills(text)) == regex_skills(text, synonyms)
+    # A custom dictionary still works, including one synonym shared by two skills
+    assert set(extract_skills("strong modeling", {"A": ["modeling"], "B": ["Modeling"]})) == {"A", "B"}
+
+
+def test_parse_jds_streams_same_json_as_bulk_dump(tmp_path):
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"role_{i}.txt"
+        path.write_text(JD_TEXT.replace("Equity Research Analyst", f"Analyst {i}"), encoding="utf-8")
+        paths.append(str(path))
+
+    output_path = str(tmp_path / "master_jobs_db.json")
+    assert parse_jds(paths, output_path, workers=2, chunksize=1) == 3
+
+    with open(output_path, "r", encoding="utf-8") as f:
+        written = f.read()
+    expected = [parse_jd(p) for p in paths]
+    assert json.loads(written)[1]["job_title"] == "Analyst 1"
+    assert [set(j["requirements"]["mandatory_skills"]) for j in json.loads(written)] == \
+        [set(j["requirements"]["mandatory_skills"]) for j in expected]
+
+    parse_jds([], output_path, workers=1)
+    with open(output_path, "r", encoding="utf-8") as f:
+        assert json.load(f) == []
+
+
+def test_parse_jds_replaces_the_output_only_when_complete(tmp_path):
+    good = tmp_path / "role_1.txt"
+    good.write_text(JD_TEXT, encoding="utf-8")
+    output_path = str(tmp_path / "master_jobs_db.json")
+    parse_jds([str(good)], output_path, workers=1)
+    with open(output_path, "rb") as f:
+        previous = f.read()
+
+    with pytest.raises(FileNotFoundError):
+        parse_jds([str(good), str(tmp_path / "missing.txt")], output_path, workers=1, chunksize=1)
+    with open(output_path, "rb") as f:
+        assert f.read() == previous  # The old database is intact, not half overwritten
+    assert not os.path.exists(output_path + ".tmp")
@@ -0,0 +1,91 @@
+import os
+import sys
+import numpy as np
+import pytest
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if base_dir not in sys.path:
+    sys.path.append(base_dir)
+
+from parsers.matching_cascade import MatchingCascade, NGRAM_CACHE_SIZE, cached_trigrams, char_ngrams
+from performance_tuning.prune_threshold_benchmark import (THRESHOLDS, dictionary_matching_pairs, pick_threshold,
+                                                          real_skill_lists, semantic_matching_pairs)
+
+
+class FakeSemanticEngine:
+    """Records what reaches the transformer stage; every pair scores 0.6."""
+    threshold = 0.50
+
+    def __init__(self):
+        self.calls = []
+
+    def calculate_similarity(self, text1, text2):
+        self.calls.append((text1, text2))
+        return 0.6
+
+    def similarity_matrix(self, texts_a, texts_b):
+        self.calls.append((list(texts_a), list(texts_b)))
+        return np.full((len(texts_a), len(texts_b)), 0.6, dtype=np.float32)
+
+
+def test_lexical_stages_resolve_without_the_model():
+    cascade = MatchingCascade(FakeSemanticEngine(), prune_threshold=0.1)
+    assert cascade.lexical_match("Python ", "python") == (1.0, "exact")
+    assert cascade.lexical_match("py", "Python") == (1.0, "alias")             # skills_db alias
+    assert cascade.lexical_match("DCF", "intrinsic value") == (1.0, "alias")   # synonyms_db
+    assert cascade.lexical_match("Python", "Excel") == (0.0, "pruned")
+    assert cascade.lexical_match("Data Visualization", "Data Visualisation")[1] == "semantic"
+    assert MatchingCascade().lexical_match("Python", "Excel") == (None, "semantic")  # Pruning is off by default
+
+
+def test_trigram_memo_is_bounded():
+    cascade = MatchingCascade(FakeSemanticEngine(), prune_threshold=0.1)
+    cached_trigrams.cache_clear()
+    for i in range(NGRAM_CACHE_SIZE + 500):  # More distinct skill texts than the memo holds
+        cascade.ngram_similarity(f"skill {i}", "Python")
+    assert cached_trigrams.cache_info().currsize == NGRAM_CACHE_SIZE
+    assert cascade.ngram_similarity("SQL", "sql") == 1.0
+    assert cached_trigrams("Data Viz") == char_ngrams("Data Viz")
+
+
+def test_only_ambiguous_pairs_reach_the_transformer():
+    engine = FakeSemanticEngine()
+    cascade = MatchingCascade(engine, prune_threshold=0.1)
+    result = cascade.analyze_skill_gap(["python3", "Data Visualisation", "Excel"],
+                                       ["Python", "Data Visualization", "Kubernetes"])
+    assert result == {"score": 0.533, "matched": ["Python", "Data Visualization"], "missing": ["Kubernetes"]}
+    # One batched call, restricted to the rows/columns that were still ambiguous
+    assert len(engine.calls) == 1
+    assert "Kubernetes" not in engine.calls[0][0]
+
+    rates = cascade.hit_rates()
+    assert abs(sum(rates.values()) - 1.0) < 1e-9
+    assert cascade.stats["alias"] == 1
+
+
+def test_model_is_never_loaded_when_everything_is_lexical():
+    cascade = MatchingCascade(prune_threshold=0.1)  # No engine: it would only be created for an ambiguous pair
+    assert cascade.calculate_similarity("sql", "SQL") == 1.0
+    assert cascade.calculate_similarity("Python", "Excel") == 0.0
+    assert cascade.calculate_similarity("", "SQL") == 0.0
+    assert cascade._semantic_engine is None
+
+
+def test_default_prune_threshold_keeps_every_known_synonym():
+    # Synonyms share few trigrams ('Excel' / 'spreadsheets'): pruning at 0.1 would drop a third of them
+    cascade = MatchingCascade()
+    recall = cascade.prune_recall(dictionary_matching_pairs(), THRESHOLDS)
+    assert recall[cascade.prune_threshold] == 1.0
+    assert recall[0.1] < 0.9
+    assert pick_threshold(recall) == cascade.prune_threshold
+
+
+def test_default_prune_threshold_recall_against_the_semantic_matrix():
+    pytest.importorskip("sentence_transformers")
+    from parsers.semantic_engine import SemanticEngine
+
+    cascade, engine = MatchingCascade(), SemanticEngine()
+    jd_skills, resume_skills = real_skill_lists()
+    recall = cascade.prune_recall(semantic_matching_pairs(cascade, jd_skills, resume_skills, engine), THRESHOLDS)
+    assert recall[cascade.prune_threshold] == 1.0
+    assert pick_threshold(recall) >= cascade.prune_threshold
@@ -0,0 +1,54 @@
+import os
+import sys
+import random
+import statistics
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if base_dir not in sys.path:
+    sys.path.append(base_dir)
+
+from utils.online_stats import OnlineScoreStats, KLLSketch
+from utils.normalizer import ScoreNormalizer
+
+
+def _scores(count, seed=0):
+    rng = random.Random(seed)
+    return [round(rng.betavariate(2, 3), 4) for _ in range(count)]
+
+
+def test_merged_worker_stats_match_single_pass():
+    scores = _scores(20000)
+    single = OnlineScoreStats(seed=1).update_many(scores)
+    merged = OnlineScoreStats(seed=2)
+    for shard in range(4):
+        merged.merge(OnlineScoreStats(seed=shard).update_many(scores[shard::4]))
+
+    for online in (single, merged):
+        assert online.count == len(scores)
+        assert online.stats.min == min(scores) and online.stats.max == max(scores)
+        assert abs(online.stats.mean - statistics.fmean(scores)) < 1e-9
+        assert abs(online.stats.variance - statistics.pvariance(scores)) < 1e-9
+        assert online.sketch.size < 1000  # Bounded, whatever the stream length
+
+        ordered = sorted(scores)
+        for q in (0.1, 0.5, 0.9, 0.99):
+            true_rank = ordered.index(online.sketch.quantile(q)) / len(scores)
+            assert abs(true_rank - q) < 0.02
+
+
+def test_sketch_round_trips_and_normalizes_like_score_normalizer(tmp_path):
+    candidates = [{"final_score": score} for score in _scores(500, seed=3)]
+    normalizer = ScoreNormalizer()
+    stats = normalizer.collect_stats(candidates)
+    path = str(tmp_path / "score_stats.json")
+    stats.save(path)
+    loaded = OnlineScoreStats.load(path)
+    assert loaded.to_dict() == stats.to_dict()
+
+    expected = [c["normalized_score"] for c in normalizer.normalize_scores([dict(c) for c in candidates])]
+    assert [c["normalized_score"] for c in normalizer.normalize_stream(candidates, loaded)] == expected
+
+    flat = OnlineScoreStats().update_many([0.5, 0.5])
+    assert flat.normalized(0.5) == 1.0
+    assert KLLSketch().quantile(0.5) is None
+    assert OnlineScoreStats().percentile(0.7) == 0.0
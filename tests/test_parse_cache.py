@@ -0,0 +1,52 @@
+import os
+import sys
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if base_dir not in sys.path:
+    sys.path.append(base_dir)
+
+from parsers.parse_cache import ParseCache, fingerprint
+
+
+def test_hits_misses_and_persistence(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    cache = ParseCache(cache_dir, "v1")
+
+    key = cache.key_for(b"%PDF resume bytes")
+    assert cache.get(key) is None
+    cache.put(key, {"filename": "a.pdf", "skills": ["Python"]})
+    assert cache.get(key)["skills"] == ["Python"]
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+    cache.save()
+
+    # A fresh process sees the same entries; a new fingerprint never does
+    reopened = ParseCache(cache_dir, "v1")
+    assert reopened.get(key)["filename"] == "a.pdf"
+    assert ParseCache(cache_dir, "v2").key_for(b"%PDF resume bytes") != key
+
+
+def test_lru_eviction_respects_budget(tmp_path):
+    cache = ParseCache(str(tmp_path), "v1", max_bytes=200)
+    keys = [cache.key_for(str(i).encode()) for i in range(4)]
+    for i, key in enumerate(keys[:3]):
+        cache.put(key, {"filename": f"{i}.pdf", "padding": "x" * 20})
+    assert cache.get(keys[0]) is not None  # A hit makes the oldest entry the most recent
+    cache.put(keys[3], {"filename": "3.pdf", "padding": "x" * 20})
+
+    assert cache.total_bytes <= 200
+    assert cache.stats()["evictions"] == 1
+    assert keys[1] not in cache.index and keys[0] in cache.index and keys[3] in cache.index
+    assert not os.path.exists(cache._object_path(keys[1]))
+
+    # The LRU order survives a save, even for index files that were not written in that order
+    cache.index[keys[3]]["last_used"] = 0
+    cache.save()
+    assert next(iter(ParseCache(str(tmp_path), "v1", max_bytes=200).index)) == keys[3]
+
+
+def test_fingerprint_tracks_config_contents(tmp_path):
+    config = tmp_path / "skill_patterns.json"
+    config.write_text('{"Tech": ["Python"]}')
+    before = fingerprint("2.3", str(config))
+    config.write_text('{"Tech": ["Python", "SQL"]}')
+    assert fingerprint("2.3", str(config)) != before
@@ -0,0 +1,159 @@
+import os
+import sys
+import json
+import multiprocessing
+import pytest
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# parser_engine_v2 is a script-style module that imports its helpers by bare name
+sys.path.append(os.path.join(base_dir, "parsers"))
+
+docx = pytest.importorskip("docx")
+spacy = pytest.importorskip("spacy")
+import parser_engine_v2 as pe
+
+PEOPLE = ["Asha Verma", "Rahul Nair", "Meera Iyer", "Karan Shah", "Divya Rao", "Arjun Menon"]
+
+
+def stub_nlp():
+    """No trained model needed: a blank pipeline whose entity ruler tags the known PERSON names."""
+    nlp = spacy.blank("en")
+    ruler = nlp.add_pipe("entity_ruler")
+    ruler.add_patterns([{"label": "PERSON", "pattern": name} for name in PEOPLE + ["Python", "Resume"]])
+    return nlp
+
+
+def _write_docx(path, lines):
+    document = docx.Document()
+    for line in lines:
+        document.add_paragraph(line)
+    document.save(str(path))
+
+
+def _resumes(folder):
+    folder.mkdir()
+    paths = []
+    for i, name in enumerate(PEOPLE):
+        path = folder / f"cand_{i}.docx"
+        _write_docx(path, [name, f"{name.split()[0].lower()}@mail.com", "+91 98765 4321" + str(i),
+                           "SKILLS", "Python, SQL, Excel, Machine Learning"[: 10 + 5 * i],
+                           "EXPERIENCE", f"Data Analyst at Firm {i} 2019 - 2023"])
+        paths.append(str(path))
+    broken = folder / "broken.docx"
+    broken.write_bytes(b"not a zip archive")
+    return paths + [str(broken)]
+
+
+def _outputs(folder):
+    return {name: json.loads((folder / name).read_text(encoding="utf-8")) for name in sorted(os.listdir(folder))}
+
+
+def test_process_and_thread_modes_yield_the_same_rows(tmp_path, monkeypatch):
+    monkeypatch.setattr(pe, "nlp", stub_nlp())
+    paths = _resumes(tmp_path / "raw")
+    thread_out, process_out = tmp_path / "thread", tmp_path / "process"
+    thread_out.mkdir()
+    process_out.mkdir()
+
+    thread_rows = list(pe.iter_batch_results(paths, str(thread_out), mode="thread", workers=3, chunksize=2))
+    # Forked workers inherit the stub model (a spawned worker would try to load en_core_web_sm)
+    with multiprocessing.get_context("fork").Pool(2) as pool:
+        process_rows = list(pe.iter_batch_results(paths, str(process_out), mode="process", workers=2,
+                                                  chunksize=2, pool=pool))
+
+    assert sorted(thread_rows) == sorted(process_rows)
+    assert len(thread_rows) == len(paths)
+    assert {row[0]: row[1] for row in thread_rows}["broken.docx"] == "FAILED"
+    assert {row[0]: row[2] for row in thread_rows}["cand_2.docx"] == "Meera Iyer"
+    assert _outputs(thread_out) == _outputs(process_out)
+
+
+def legacy_name(nlp, cleaned_text):
+    """The per-resume path before batching: NER over the whole text, then the first-line fallback."""
+    name = pe.pick_person_name(nlp(cleaned_text))
+    if not name:
+        first_line = cleaned_text.split('\n')[0].strip()
+        if "@" not in first_line and len(first_line) < 50:
+            name = first_line
+    return name
+
+
+def test_batched_names_match_the_per_resume_path(monkeypatch):
+    nlp = stub_nlp()
+    monkeypatch.setattr(pe, "nlp", nlp)
+    raw_texts = [
+        "Asha Verma\nasha@mail.com\nSKILLS\nPython, SQL\nEXPERIENCE\nAnalyst at Rahul Nair Consulting",
+        "Resume\nPython\nMeera Iyer\nmeera@mail.com\nEDUCATION\nB.Tech 2019",  # Header and skill are filtered
+        "Karan Shah | +91 9876543210 | karan@mail.com\nSUMMARY\nAnalyst with 4 years\nSKILLS\nExcel",
+        "Data Analyst\nno name here\nSKILLS\nSQL",                                   # Falls back to the first line
+        "divya@mail.com\nEXPERIENCE\nWorked with Python teams",                        # No name, no fallback
+        "",
+    ] + [f"{name}\n{name.split()[0].lower()}@mail.com\nSKILLS\nSQL\n" + "Excel work. " * 200 for name in PEOPLE]
+    cleaned = [pe.clean_text(text) for text in raw_texts]
+
+    per_resume = [pe.pick_person_name(nlp(text)) for text in cleaned]
+    assert pe.extract_names_batch(cleaned, batch_size=4) == per_resume
+    assert all(len(pe.name_window(text)) <= pe.NAME_WINDOW_CHARS for text in cleaned)
+
+    results = pe.parse_cleaned_batch([(f"cand_{i}.docx", text) for i, text in enumerate(cleaned)])
+    assert [result["name"] for result in results] == [legacy_name(nlp, text) for text in cleaned]
+    assert per_resume[:4] == ["Asha Verma", "Meera Iyer", "Karan Shah", None]
+
+
+@pytest.mark.parametrize("use_store", [False, True])
+def test_watch_mode_cleans_up_a_resume_that_stops_parsing(tmp_path, monkeypatch, use_store):
+    from dedup import NearDuplicateIndex
+
+    monkeypatch.setattr(pe, "nlp", stub_nlp())
+    inbox, out = tmp_path / "raw", tmp_path / "out"
+    inbox.mkdir()
+    out.mkdir()
+    resume = inbox / "asha.docx"
+    _write_docx(resume, ["Asha Verma", "asha@mail.com", "SKILLS", "Python, SQL"])
+
+    store = pe.CandidateStore(str(out / pe.STORE_DIRNAME)) if use_store else None
+    dedup, skill_index = NearDuplicateIndex(), pe.SkillBitsetIndex()
+    seen = []
+
+    def output_exists():
+        return "asha.json" in store if use_store else (out / "asha.json").exists()
+
+    def next_tick(interval):
+        # Runs between watch ticks: check what the last tick left, then change the inbox
+        seen.append((output_exists(), "asha.json" in skill_index, len(dedup)))
+        if len(seen) == 1:
+            resume.write_bytes(b"corrupted upload, no longer a docx")  # SUCCESS -> FAILED
+        elif len(seen) == 2:
+            resume.unlink()
+        else:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(pe.time, "sleep", next_tick)
+    pe.run_watch_mode(str(inbox), str(out), str(out / "report.csv"), mode="thread", workers=1, store=store,
+                      dedup=dedup, dedup_path=str(out / ".dedup.npz"),
+                      skill_index=skill_index, skill_index_path=str(out / ".skills.npz"))
+
+    assert seen == [(True, True, 1), (False, False, 0), (False, False, 0)]
+    statuses = [line.split(",")[1] for line in (out / "report.csv").read_text().splitlines()[1:]]
+    assert statuses == ["SUCCESS", "FAILED", "DELETED"]
+    manifest = pe.IngestionManifest(str(out / ".ingest_manifest.json"))
+    assert manifest.entries == {}
+
+
+def test_rerun_with_cache_leaves_the_store_untouched(tmp_path, monkeypatch):
+    from parse_cache import ParseCache
+
+    monkeypatch.setattr(pe, "nlp", stub_nlp())
+    paths = _resumes(tmp_path / "raw")
+    root = tmp_path / "out" / pe.STORE_DIRNAME
+    cache = ParseCache(str(tmp_path / "cache"), "v1")
+
+    for run in range(2):
+        with pe.CandidateStore(str(root)) as store:
+            list(pe.iter_batch_results(paths, str(tmp_path / "out"), mode="thread", workers=2,
+                                       cache=cache, store=store))
+        if run == 0:
+            first_run = {name: (root / name).read_bytes() for name in os.listdir(root)}
+    # Every second-run resume was a cache hit: no new lines, index.json not rewritten
+    assert cache.hits == len(paths) - 1
+    assert {name: (root / name).read_bytes() for name in os.listdir(root)} == first_run
@@ -0,0 +1,176 @@
+import os
+import sys
+import csv
+import json
+import zlib
+import numpy as np
+import pytest
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if base_dir not in sys.path:
+    sys.path.append(base_dir)
+
+import master_orchestrator as mo
+from parsers.matching_cascade import MatchingCascade
+
+
+class FakeSemanticEngine:
+    """Lexical stand-in: a JD skill matches when the candidate lists it verbatim."""
+    threshold = 0.50
+
+    def analyze_skill_gap(self, candidate_skills, jd_skills):
+        matched = [skill for skill in jd_skills if skill in candidate_skills]
+        return {"score": round(len(matched) / len(jd_skills), 3), "matched": matched,
+                "missing": [skill for skill in jd_skills if skill not in candidate_skills]}
+
+    def save_embeddings(self):
+        pass
+
+
+class FakeMatrixEngine:
+    """Deterministic pseudo-embeddings: a stable similarity in [0, 1) for every text pair."""
+    threshold = 0.50
+
+    def similarity_matrix(self, texts_a, texts_b):
+        return np.array([[(zlib.crc32(f"{a}|{b}".encode()) % 1000) / 1000 for b in texts_b] for a in texts_a],
+                        dtype=np.float32)
+
+    def save_embeddings(self):
+        pass
+
+
+def test_union_gap_analysis_matches_per_jd_analysis():
+    cascade = MatchingCascade(FakeMatrixEngine())
+    jds = [mo.DEFAULT_JD,
+           {"required_skills": ["Python", "Deep Learning", "Python", "Docker"]},
+           {"required_skills": []}]
+    for skills in [[], ["python", "ML"], ["Statistics", "Tableau", "Sql", "PyTorch", "Data Viz"]]:
+        expected = [cascade.analyze_skill_gap(skills, jd["required_skills"]) for jd in jds]
+        assert mo.analyze_skill_gaps(cascade, skills, jds) == expected
+
+
+@pytest.mark.parametrize("mode", ["process", "thread"])
+def test_every_jd_gets_the_sequential_rows(tmp_path, mode):
+    processed = tmp_path / "processed"
+    processed.mkdir()
+    for i in range(60):
+        skills = ["Python", "SQL", "Machine Learning"][: i % 4]
+        (processed / f"cand_{i}.json").write_text(json.dumps({"skills": skills, "experience_years": 3}))
+
+    jds = [mo.DEFAULT_JD,
+           {"role": "Quantitative Analyst", "role_level": "senior", "required_skills": ["Python", "Machine Learning"]}]
+    engine = FakeSemanticEngine()
+    written = mo.run_pipelined_orchestrator(jds, str(processed), str(tmp_path / "out"), workers=3,
+                                            queue_size=4, flush_every=7, semantic_engine=engine,
+                                            mode=mode, chunksize=5)
+    assert written == {0: 60, 1: 60}
+
+    scoring, eligibility = mo.ScoringEngine(), mo.EligibilityEngine()
+    for position, jd in enumerate(jds):
+        with open(tmp_path / "out" / mo.jd_output_name(jd, position), newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == mo.RESULT_HEADER
+        expected = [[str(value) for value in mo.score_candidate_for_jd(name, data, jd, engine, scoring, eligibility)]
+                    for name, data in mo.stream_candidates(str(processed))]
+        assert sorted(rows[1:]) == sorted(expected)
+
+
+def test_cascade_pipeline_scores_each_candidate_once_for_all_jds(tmp_path):
+    processed = tmp_path / "processed"
+    processed.mkdir()
+    for i in range(12):
+        (processed / f"cand_{i}.json").write_text(json.dumps({"skills": ["python", "Statistics", f"Skill {i}"]}))
+    jds = [mo.DEFAULT_JD, {"role": "Data Analyst", "role_level": "mid_level", "required_skills": ["SQL", "Python"]}]
+    engine = FakeMatrixEngine()
+    mo.run_pipelined_orchestrator(jds, str(processed), str(tmp_path / "out"), workers=2,
+                                  use_cascade=True, semantic_engine=engine)
+
+    cascade, scoring, eligibility = MatchingCascade(engine), mo.ScoringEngine(), mo.EligibilityEngine()
+    for position, jd in enumerate(jds):
+        with open(tmp_path / "out" / mo.jd_output_name(jd, position), newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))[1:]
+        expected = [[str(value) for value in mo.score_candidate_for_jd(name, data, jd, cascade, scoring, eligibility)]
+                    for name, data in mo.stream_candidates(str(processed))]
+        assert sorted(rows) == sorted(expected)
+
+
+@pytest.mark.skipif((os.cpu_count() or 1) < 2, reason="a process speed-up needs at least 2 cores")
+def test_process_workers_beat_gil_bound_threads():
+    from performance_tuning.pipeline_benchmark import compare_modes
+
+    report = compare_modes(count=300, workers=min(4, os.cpu_count()))  # Also checks both modes wrote the same rows
+    assert report["speedup"] > 1.3, report
+
+
+def test_near_duplicates_reuse_the_canonical_score():
+    calls = []
+
+    def score(filename):
+        return lambda: calls.append(filename) or [filename, 72.5, "Eligible", "{}", "Python", ""]
+
+    memo = {}
+    canonical = mo.reuse_duplicate_score(memo, "cand_1.json", {}, score("cand_1.json"))
+    copy_a = mo.reuse_duplicate_score(memo, "copy_a.json", {"duplicate_of": "cand_1.json"}, score("copy_a.json"))
+    copy_b = mo.reuse_duplicate_score(memo, "copy_b.json", {"duplicate_of": "cand_1.json"}, score("copy_b.json"))
+    assert calls == ["cand_1.json", "copy_a.json"]  # One score per group once a duplicate shows up
+    assert copy_b == ["copy_b.json"] + canonical[1:]
+    assert list(memo) == ["cand_1.json"]
+
+
+def test_stream_candidates_reads_store_and_legacy_json(tmp_path):
+    processed = tmp_path / "processed"
+    processed.mkdir()
+    with mo.CandidateStore(str(processed / mo.STORE_DIRNAME)) as store:
+        store.put("a.json", {"skills": ["SQL"]})
+        store.put("b.json", {"skills": ["Python"]})
+    (processed / "b.json").write_text(json.dumps({"skills": ["stale copy"]}))
+    (processed / "c.json").write_text(json.dumps({"skills": ["Excel"]}))
+
+    index_before = (processed / mo.STORE_DIRNAME / "index.json").read_bytes()
+    streamed = dict(mo.stream_candidates(str(processed), columns=["skills"]))
+    assert {name: data["skills"] for name, data in streamed.items()} == {
+        "a.json": ["SQL"], "b.json": ["Python"], "c.json": ["Excel"]}
+    assert (processed / mo.STORE_DIRNAME / "index.json").read_bytes() == index_before
+
+
+def test_candidate_index_refresh_embeds_job_titles_and_drops_deleted(tmp_path):
+    class ProfileEngine:
+        def __init__(self):
+            self.calls = []
+
+        def embed_profiles(self, skill_lists, experience_texts):
+            self.calls.append(list(experience_texts))
+            return np.ones((len(skill_lists), 4), dtype=np.float32)
+
+    processed = tmp_path / "processed"
+    processed.mkdir()
+    (processed / "a.json").write_text(json.dumps(
+        {"skills": ["SQL"], "experience_entries": [{"job_title": "Data Analyst", "duration_months": 12}]}))
+    (processed / "b.json").write_text(json.dumps({"skills": ["Python"]}))
+    engine, index = ProfileEngine(), mo.CandidateVectorIndex(4)
+    assert mo.update_candidate_index(engine, index, str(processed)) == 2
+    assert engine.calls == [["Data Analyst", ""]]
+
+    (processed / "b.json").unlink()
+    assert mo.update_candidate_index(engine, index, str(processed)) == 1
+    assert index.ids == ["a.json"] and len(engine.calls) == 1
+
+
+def test_batched_eligibility_gives_the_per_candidate_rows():
+    engine = FakeSemanticEngine()
+    scoring, eligibility = mo.ScoringEngine(), mo.EligibilityEngine()
+    pool = ["Python", "SQL", "Machine Learning", "Statistical Modeling", "Data Visualization", "Excel"]
+    candidates = [(f"cand_{i}.json", {"skills": pool[i % 3: i % 3 + i % 5], "experience_years": i % 12,
+                                      "location": ["Remote", "Pune", None][i % 3]}) for i in range(40)]
+    candidates[7] = ("cand_7.json", dict(candidates[3][1], duplicate_of="cand_3.json"))
+    candidates[30] = ("cand_30.json", dict(candidates[3][1], duplicate_of="cand_3.json"))
+
+    for jd in [mo.DEFAULT_JD, {"role": "Quantitative Analyst", "role_level": "senior",
+                               "required_skills": ["Python", "Machine Learning", "Statistical Modeling"]}]:
+        expected = [mo.score_candidate_for_jd(name, data, jd, engine, scoring, eligibility) for name, data in candidates]
+        memo = {}
+        rows = mo.score_candidate_batch(memo, candidates[:20], jd, engine, scoring, eligibility)
+        rows += mo.score_candidate_batch(memo, candidates[20:], jd, engine, scoring, eligibility)
+        assert rows == expected
+        assert {row[2] for row in rows} == {"Eligible", "Review", "Rejected"}
+        assert list(memo) == ["cand_3.json"]
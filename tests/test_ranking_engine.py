@@ -0,0 +1,63 @@
+import os
+import sys
+import copy
+import random
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if base_dir not in sys.path:
+    sys.path.append(base_dir)
+
+from utils.ranking_engine import RankingEngine
+
+
+def _mock_candidates(count, seed=0):
+    rng = random.Random(seed)
+    # Coarse scores on purpose: lots of exact ties exercise the stable tie-break
+    return [{"candidate_name": f"Candidate {i}",
+             "final_score": rng.choice([0.3, 0.55, 0.6, 0.75, 0.8, 0.9]),
+             "raw_scores": {"skills": rng.choice([0.5, 0.7]), "experience": rng.choice([0.4, 0.6])}}
+            for i in range(count)]
+
+
+def test_streaming_prefix_matches_full_sort():
+    ranker = RankingEngine()
+    candidates = _mock_candidates(3000)
+    full = ranker.rank_and_filter(copy.deepcopy(candidates))
+
+    result = ranker.rank_streaming(iter(copy.deepcopy(candidates)), review_limit=40)
+    keep = ranker.config["ranking_config"]["max_shortlist_size"] + 40
+    assert result["total"] == 3000
+    assert len(result["ranked"]) == keep
+    for streamed, reference in zip(result["ranked"], full[:keep]):
+        assert streamed["candidate_name"] == reference["candidate_name"]
+        for field in ["ats_rank", "ats_percentile", "ats_status", "ats_action", "final_percentage"]:
+            assert streamed[field] == reference[field]
+        assert "recruiter_note" not in streamed  # Built lazily
+        assert ranker.recruiter_note(streamed) == reference["recruiter_note"]
+
+    expected_counts = {}
+    for row in full:
+        expected_counts[row["ats_status"]] = expected_counts.get(row["ats_status"], 0) + 1
+    assert result["status_counts"] == expected_counts
+
+
+def test_streaming_handles_small_and_empty_inputs():
+    ranker = RankingEngine()
+    assert ranker.rank_streaming([]) == {"ranked": [], "total": 0, "status_counts": {}}
+    result = ranker.rank_streaming(_mock_candidates(5))
+    assert [row["ats_rank"] for row in result["ranked"]] == [1, 2, 3, 4, 5]
+
+
+def test_sketch_percentile_tracks_exact_percentile():
+    from utils.online_stats import OnlineScoreStats
+
+    ranker = RankingEngine()
+    rng = random.Random(7)
+    candidates = [{"candidate_name": f"Candidate {i}", "final_score": rng.random(), "raw_scores": {}}
+                  for i in range(5000)]
+    stats = OnlineScoreStats(seed=0)
+    ranker.rank_streaming(iter(copy.deepcopy(candidates)), stats=stats)
+    assert stats.count == 5000
+
+    for row in ranker.rank_and_filter(candidates)[::250]:
+        assert abs(ranker.approximate_percentile(row, stats) - row["ats_percentile"]) < 2.0
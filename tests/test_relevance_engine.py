@@ -0,0 +1,56 @@
+import os
+import sys
+import random
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if base_dir not in sys.path:
+    sys.path.append(base_dir)
+
+from parsers.relevance_engine import RelevanceEngine
+
+
+class FakeSemanticEngine:
+    def __init__(self):
+        self.calls = 0
+
+    def calculate_similarity(self, text1, text2):
+        self.calls += 1
+        return 0.42
+
+
+def _random_experiences(count, seed=0):
+    rng = random.Random(seed)
+    titles = ["Data Analyst", "Data Scientist", "Software Engineer", "Chef", "Quantitative Analyst"]
+    return [{"total_experience_years": 3.0,
+             "experience_entries": [{"job_title": rng.choice(titles), "duration_months": rng.randint(0, 60)}
+                                    for _ in range(rng.randint(0, 4))]}
+            for _ in range(count)]
+
+
+def test_batch_matches_per_candidate_path_without_printing(capsys):
+    engine = RelevanceEngine(verbose=False)
+    experiences = _random_experiences(500)
+    for target in ["Quantitative Equity Analyst", "Data Analyst", "Data Scientist"]:
+        batch = engine.calculate_relevance_batch(experiences, target, 3.0)
+        singles = [engine.calculate_relevance(experience, target, 3.0) for experience in experiences]
+        assert batch == singles
+    assert capsys.readouterr().out == ""
+
+
+def test_unknown_pairs_default_or_use_the_persisted_semantic_fallback(tmp_path):
+    plain = RelevanceEngine(verbose=False)
+    assert plain.similarity_for("Chef", "Data Analyst") == 0.1
+    assert plain.similarity_for("Data Analyst", "Data Scientist") == 0.7
+
+    path = str(tmp_path / "role_similarity.json")
+    fake = FakeSemanticEngine()
+    engine = RelevanceEngine(verbose=False, semantic_engine=fake, fallback_path=path)
+    experiences = [{"experience_entries": [{"job_title": "Chef", "duration_months": 12}] * 3}]
+    months, _ = engine.effective_months_batch(experiences, "Data Analyst")
+    assert abs(months[0] - 3 * 12 * 0.42) < 1e-9
+    assert fake.calls == 1  # Once per distinct unknown pair, then memoized
+    engine.save_fallback_cache()
+
+    reloaded = RelevanceEngine(verbose=False, semantic_engine=FakeSemanticEngine(), fallback_path=path)
+    assert reloaded.similarity_for("Chef", "Data Analyst") == 0.42
+    assert reloaded.semantic_engine.calls == 0
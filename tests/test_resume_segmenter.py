@@ -0,0 +1,40 @@
+import os
+import sys
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if base_dir not in sys.path:
+    sys.path.append(base_dir)
+
+from parsers.resume_segmenter import ResumeSegmenter
+
+SAMPLE = """
+Murthaja
+Data Scientist | Kerala, India
+*** Professional Experience ***
+Data Analyst Intern at TechCorp
+EDUCATON
+MSc in Statistics
+Technical Skills:
+Python, R, SQL
+"""
+
+
+def test_header_index_and_batch_segmentation():
+    segmenter = ResumeSegmenter()
+    first, second = segmenter.segment_many([SAMPLE, "Skills\nExcel"])
+
+    assert first["SUMMARY"] == ["Murthaja", "Data Scientist | Kerala, India"]
+    # Without the fuzzy tier the typo'd header is just another line
+    assert first["EXPERIENCE"] == ["Data Analyst Intern at TechCorp", "EDUCATON", "MSc in Statistics"]
+    assert first["SKILLS"] == ["Python, R, SQL"]
+    assert second["SKILLS"] == ["Excel"]
+
+
+def test_fuzzy_tier_and_custom_regex_patterns():
+    segmenter = ResumeSegmenter(fuzzy=True)
+    assert segmenter.segment(SAMPLE)["EDUCATION"] == ["MSc in Statistics"]
+    assert segmenter.detect_header("Python developer") is None
+
+    segmenter.HEADER_PATTERNS["PROJECTS"].append(r"projects? (?:and|&)? ?publications")
+    segmenter.build_header_index()
+    assert segmenter.detect_header("Project and Publications") == "PROJECTS"
@@ -0,0 +1,37 @@
+import os
+import sys
+import numpy as np
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if base_dir not in sys.path:
+    sys.path.append(base_dir)
+
+from parsers.scoring_engine import ScoringEngine, SCORE_COLUMNS
+
+
+def test_batch_matches_single_candidate_path():
+    engine = ScoringEngine()
+    rng = np.random.default_rng(0)
+    matrix = rng.random((3000, 4))
+    matrix[rng.random(matrix.shape) < 0.15] = np.nan
+
+    for role_level in engine.config["roles"]:
+        batch = engine.calculate_final_scores_batch(role_level, matrix)
+        for row in range(len(matrix)):
+            scores = {key: (None if np.isnan(value) else float(value)) for key, value in zip(SCORE_COLUMNS, matrix[row])}
+            single = engine.calculate_final_score(role_level, scores)
+            assert batch["final_scores"][row] == single["final_score"]
+            assert list(batch["effective_weights"][row]) == [single["effective_weights"][key] for key in SCORE_COLUMNS]
+            assert batch["audit_notes"][row] == single["audit_notes"]
+
+
+def test_batch_accepts_columns_and_builds_notes_only_for_fallback_rows():
+    engine = ScoringEngine()
+    columns = {"skills": [0.9, 0.5], "experience": [0.8, None], "projects": [0.7, 0.6], "education": [None, 0.4]}
+    batch = engine.calculate_final_scores_batch("mid_level", columns)
+    assert list(batch["audit_notes"].rows) == [0, 1]
+
+    clean = engine.calculate_final_scores_batch("mid_level", np.full((4, 4), 0.5))
+    assert len(clean["audit_notes"]) == 0
+    assert list(clean["audit_notes"].items()) == []
+    assert clean["audit_notes"][2] == []
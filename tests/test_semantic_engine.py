@@ -0,0 +1,119 @@
+import os
+import sys
+import types
+import zlib
+import random
+import importlib
+import numpy as np
+import pytest
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if base_dir not in sys.path:
+    sys.path.append(base_dir)
+
+DIM = 16
+
+
+class FakeTensor:
+    def __init__(self, array):
+        self.array = np.asarray(array, dtype=np.float64)
+
+    def item(self):
+        return float(self.array.reshape(-1)[0])
+
+    def cpu(self):
+        return self
+
+    def numpy(self):
+        return self.array
+
+
+def fake_cos_sim(a, b):
+    a = np.atleast_2d(np.asarray(a, dtype=np.float64))
+    b = np.atleast_2d(np.asarray(b, dtype=np.float64))
+    a = a / np.linalg.norm(a, axis=1, keepdims=True)
+    b = b / np.linalg.norm(b, axis=1, keepdims=True)
+    return FakeTensor(a @ b.T)
+
+
+class FakeSentenceTransformer:
+    """Deterministic stand-in encoder: texts sharing their first word get similar vectors."""
+    encode_calls = 0
+
+    def __init__(self, model_name):
+        pass
+
+    def get_sentence_embedding_dimension(self):
+        return DIM
+
+    @staticmethod
+    def _vector(text):
+        words = text.lower().split() or [""]
+        head = np.random.default_rng(zlib.crc32(words[0].encode())).normal(size=DIM)
+        tail = np.random.default_rng(zlib.crc32(text.lower().encode())).normal(size=DIM)
+        return head + 0.8 * tail
+
+    def encode(self, texts, convert_to_numpy=True):
+        FakeSentenceTransformer.encode_calls += 1
+        return np.array([self._vector(text) for text in texts], dtype=np.float32)
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    """A SemanticEngine over the fake encoder (the real model is neither needed nor loaded)."""
+    fake = types.ModuleType("sentence_transformers")
+    fake.SentenceTransformer = FakeSentenceTransformer
+    fake.util = types.SimpleNamespace(cos_sim=fake_cos_sim)
+    monkeypatch.setitem(sys.modules, "sentence_transformers", fake)
+    monkeypatch.delitem(sys.modules, "parsers.semantic_engine", raising=False)
+    semantic_engine = importlib.import_module("parsers.semantic_engine")
+    engine = semantic_engine.SemanticEngine(store_dir=str(tmp_path / "embeddings"))
+    yield engine
+    engine.save_embeddings()
+
+
+def legacy_analyze_skill_gap(engine, candidate_skills, jd_skills):
+    """The pair-by-pair double loop analyze_skill_gap ran before the similarity matrix."""
+    if not jd_skills:
+        return {"score": 0.0, "matched": [], "missing": []}
+    matched_skills, missing_skills, total_score = [], [], 0.0
+    for jd_skill in jd_skills:
+        if not candidate_skills:
+            missing_skills.append(jd_skill)
+            continue
+        best_match_score = max([engine.calculate_similarity(jd_skill, c_skill) for c_skill in candidate_skills])
+        if best_match_score >= engine.threshold:
+            matched_skills.append(jd_skill)
+        else:
+            missing_skills.append(jd_skill)
+        total_score += best_match_score
+    return {"score": round(total_score / len(jd_skills), 3), "matched": matched_skills, "missing": missing_skills}
+
+
+def test_similarity_matrix_matches_pairwise_similarity(engine):
+    texts_a = ["Machine Learning", "SQL", "", "Data Visualization"]
+    texts_b = ["machine learning engineer", "Data Viz", "Excel", ""]
+    matrix = engine.similarity_matrix(texts_a, texts_b)
+    assert matrix.shape == (4, 4)
+    for i, a in enumerate(texts_a):
+        for j, b in enumerate(texts_b):
+            assert round(float(matrix[i, j]), 3) == engine.calculate_similarity(a, b)
+
+
+def test_vectorized_gap_analysis_matches_the_old_loop(engine):
+    rng = random.Random(0)
+    pool = ["Python", "Python Scripting", "SQL", "SQL Server", "Machine Learning", "Machine Vision",
+            "Data Visualization", "Data Analysis", "Statistics", "Excel", "Tableau", "Deep Learning", ""]
+    cases = [([], ["Python"]), (["Python"], []), (["Excel"], ["Excel", "Excel"])]
+    cases += [(rng.sample(pool, rng.randint(0, 7)), rng.sample(pool[:-1], rng.randint(1, 6))) for _ in range(60)]
+
+    outcomes = set()
+    for candidate_skills, jd_skills in cases:
+        expected = legacy_analyze_skill_gap(engine, candidate_skills, jd_skills)
+        assert engine.analyze_skill_gap(candidate_skills, jd_skills) == expected
+        outcomes.add((bool(expected["matched"]), bool(expected["missing"])))
+    assert outcomes >= {(True, True), (True, False), (False, True)}  # Both sides of the threshold
+
+    calls = FakeSentenceTransformer.encode_calls
+    engine.analyze_skill_gap(["Brand New Skill", "Another One"], ["Novel JD Skill"])
+    assert FakeSentenceTransformer.encode_calls - calls <= 2  # Batched encodes, not one per pair
@@ -0,0 +1,91 @@
+import os
+import sys
+import random
+import numpy as np
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if base_dir not in sys.path:
+    sys.path.append(base_dir)
+
+from parsers.skill_bitset import SkillVocabulary, SkillBitsetIndex, popcount
+
+
+def test_vocabulary_is_seeded_from_data_files():
+    vocabulary = SkillVocabulary.from_data_files()
+    assert vocabulary.id_for("python", add=False) == vocabulary.id_for("PYTHON", add=False) is not None
+    assert vocabulary.resolve("py") == vocabulary.id_for("Python")
+    assert vocabulary.id_for("Kubernetes", add=False) is not None  # From skill_patterns.json
+    assert vocabulary.resolve("DCF") == vocabulary.id_for("Valuation")  # From synonyms_db.json
+    size = len(vocabulary)
+    bits = vocabulary.encode(["SQL", "Brand New Skill", "sql"])
+    assert len(vocabulary) == size + 1
+    assert sorted(vocabulary.decode(bits)) == ["Brand New Skill", "SQL"]
+
+
+def test_bitset_checks_and_posting_lists_match_set_logic():
+    rng = random.Random(0)
+    pool = ["Python", "SQL", "Kubernetes", "Docker", "k8s", "Excel"] + [f"Skill {i}" for i in range(150)]
+    candidates = {f"cand_{i}.json": rng.sample(pool, rng.randint(0, 12)) for i in range(800)}
+    index = SkillBitsetIndex().add_many(candidates.items())
+    index.add("cand_3.json", ["Kubernetes", "SQL"])  # Re-index replaces the old postings
+    candidates["cand_3.json"] = ["Kubernetes", "SQL"]
+    lowered = {cid: {s.lower() for s in skills} for cid, skills in candidates.items()}
+
+    expected = sorted(cid for cid, skills in lowered.items() if {"kubernetes", "sql"} <= skills)
+    assert sorted(index.query(["Kubernetes", "sql"])) == expected
+    assert index.query(["Kubernetes", "Unknown Skill"]) == []
+
+    required = {"python", "sql", "skill 149"}
+    assert list(index.has_all(required)) == [required <= lowered[cid] for cid in index.ids]
+    counts = index.matched_counts(required, index.rows_for(["cand_3.json"]))
+    assert list(counts) == [1]
+
+    with_aliases = sorted(cid for cid, skills in lowered.items() if skills & {"kubernetes", "k8s"})
+    if index.vocabulary.resolve("k8s") == index.vocabulary.resolve("kubernetes"):
+        assert sorted(index.query(["Kubernetes"], canonical=True)) == with_aliases
+    assert list(popcount(np.array([[3, 1 << 63]], dtype=np.uint64))) == [3]
+
+
+def test_save_and_load(tmp_path):
+    index = SkillBitsetIndex().add_many([("a.json", ["Python", "Rust"]), ("b.json", ["SQL"])])
+    path = str(tmp_path / "skills.npz")
+    index.save(path)
+    loaded = SkillBitsetIndex.load(path)
+    assert loaded.query(["rust"]) == ["a.json"]
+    assert list(loaded.has_all({"sql"})) == [False, True]
+    assert len(loaded.vocabulary) == len(index.vocabulary)
+    SkillBitsetIndex(SkillVocabulary()).save(path)
+    assert len(SkillBitsetIndex.load(path)) == 0
+
+
+def test_unknown_mandatory_skill_is_unmatched_and_not_added():
+    index = SkillBitsetIndex(SkillVocabulary(["Python", "SQL"])).add_many([("a.json", ["Python", "SQL"])])
+    assert list(index.has_all({"Python", "Quantum Basket Weaving"})) == [False]
+    assert list(index.has_all({"python", "SQL"})) == [True]
+    assert len(index.vocabulary) == 2
+    # Once a candidate lists the skill, the cached mask picks it up
+    index.add("b.json", ["Python", "Quantum Basket Weaving"])
+    assert list(index.has_all({"Python", "Quantum Basket Weaving"})) == [False, True]
+
+
+def test_remove_keeps_bitsets_and_postings_consistent(tmp_path):
+    rng = random.Random(1)
+    pool = ["Python", "SQL", "Docker"] + [f"Skill {i}" for i in range(80)]
+    candidates = {f"cand_{i}.json": rng.sample(pool, rng.randint(0, 8)) for i in range(200)}
+    index = SkillBitsetIndex().add_many(candidates.items())
+    for cid in [f"cand_{i}.json" for i in range(0, 200, 3)] + ["cand_199.json"]:
+        assert index.remove(cid)
+        del candidates[cid]
+    assert not index.remove("cand_0.json")
+
+    rebuilt = SkillBitsetIndex(index.vocabulary).add_many(candidates.items())
+    assert sorted(index.ids) == sorted(candidates)
+    assert sorted(index.query(["Python", "SQL"])) == sorted(rebuilt.query(["Python", "SQL"]))
+    assert all(rows == sorted(rows) and rows for rows in index.postings.values())
+    lowered = {cid: {s.lower() for s in skills} for cid, skills in candidates.items()}
+    assert list(index.has_all({"docker"})) == ["docker" in lowered[cid] for cid in index.ids]
+
+    path = str(tmp_path / "skills.npz")
+    index.save(path)
+    assert SkillBitsetIndex.load_or_create(path).ids == index.ids
+    assert len(SkillBitsetIndex.load_or_create(str(tmp_path / "missing.npz"))) == 0
@@ -0,0 +1,69 @@
+import os
+import re
+import sys
+import random
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if base_dir not in sys.path:
+    sys.path.append(base_dir)
+
+from parsers.skill_extractor import SkillExtractor
+
+
+def legacy_is_match(keyword, text):
+    """The old per-keyword regex: True if the keyword exists as a whole word."""
+    return re.search(r'\b' + re.escape(keyword.lower()) + r'\b', text) is not None
+
+
+def legacy_extract_skills(extractor, text):
+    """The per-call regex loop with one-level inference, as it was before the compiled matcher."""
+    found_skills = {}
+    text_lower = text.lower()
+    for skill in extractor.skill_db:
+        score = 0
+        if legacy_is_match(skill["name"], text_lower):
+            score = 100
+        else:
+            for alias in skill.get("aliases", []):
+                if legacy_is_match(alias, text_lower):
+                    score = 90
+                    break
+        if score > 0:
+            if found_skills.get(skill["name"], 0) < score:
+                found_skills[skill["name"]] = score
+            for related in skill.get("related_skills", []):
+                if related not in found_skills:
+                    found_skills[related] = 50
+    return found_skills
+
+
+def test_compiled_matcher_keeps_legacy_output_and_order():
+    extractor = SkillExtractor()
+    rng = random.Random(0)
+    vocabulary = [skill["name"] for skill in extractor.skill_db]
+    vocabulary += [alias for skill in extractor.skill_db for alias in skill.get("aliases", [])]
+    vocabulary += ["JavaScript", "pythonic", "data", "the", "Excel-based", "(SQL)", "\n"]
+    texts = ["", "I use Pandas for data cleaning and ML for prediction."]
+    texts += [" ".join(rng.choice(vocabulary).upper() if rng.random() < 0.2 else rng.choice(vocabulary)
+                       for _ in range(rng.randint(1, 25))) for _ in range(1500)]
+
+    batch = extractor.extract_skills_batch(texts)
+    for text, result in zip(texts, batch):
+        expected = legacy_extract_skills(extractor, text)
+        assert list(result.items()) == list(expected.items()), text
+
+
+def test_deeper_closure_decays_confidence():
+    extractor = SkillExtractor(related_depth=2, inferred_confidence=60, confidence_decay=0.5)
+    by_name = {skill["name"]: position for position, skill in enumerate(extractor.skill_db)}
+    for position, skill in enumerate(extractor.skill_db):
+        closure = dict(extractor.related_closure[position])
+        for related in skill.get("related_skills", []):
+            if related != skill["name"]:
+                assert closure[related] == 60
+        for related in skill.get("related_skills", []):
+            for second in extractor.skill_db[by_name[related]].get("related_skills", []) if related in by_name else []:
+                assert second == skill["name"] or closure[second] in (60, 30)
+
+    shallow = SkillExtractor()
+    assert all(confidence == 50 for inferred in shallow.related_closure for _, confidence in inferred)
@@ -0,0 +1,39 @@
+import os
+import re
+import sys
+import json
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if base_dir not in sys.path:
+    sys.path.append(base_dir)
+
+from parsers.skill_matcher import SkillMatcher
+
+
+def regex_skills(skills, text):
+    """The original one-regex-per-skill loop, used as the reference answer."""
+    return {s for s in skills if re.search(r'\b' + re.escape(s) + r'\b', text, re.IGNORECASE)}
+
+
+def test_matches_per_skill_regex_loop():
+    with open(os.path.join(base_dir, "data", "skill_patterns.json"), "r") as f:
+        skills = [s for group in json.load(f).values() for s in group]
+
+    matcher = SkillMatcher(skills)
+    samples = [
+        "Senior engineer: python, SQL, JavaScript, node.js and Power BI dashboards.",
+        "Java developer (not JavaScript). Docker/Kubernetes on AWS; Big Data with Spark.",
+        "Used C++ and C++11 daily. Machine Learning + Data Science, Excel, Tableau.",
+        "Reactive systems, Agile-Scrum, problem solving, teamwork_skills, Leadership.",
+        "",
+    ]
+    for text in samples:
+        assert matcher.find_all(text) == regex_skills(skills, text), text
+
+
+def test_overlapping_keywords_and_labels():
+    matcher = SkillMatcher({"machine learning": "Machine Learning", "ml": "Machine Learning", "learning": "Learning"})
+
+    assert matcher.find_all("Deep MACHINE LEARNING work") == {"Machine Learning", "Learning"}
+    assert matcher.find_all("html and xml") == set()
+    assert matcher.find_all("ML-ops") == {"Machine Learning"}
@@ -0,0 +1,26 @@
+import os
+import sys
+import random
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if base_dir not in sys.path:
+    sys.path.append(base_dir)
+
+from parsers.text_cleaner import clean_text
+from performance_tuning.text_cleaner_benchmark import legacy_clean_text, generate_mock_text
+
+
+def test_fused_cleaner_is_byte_identical_to_legacy():
+    rng = random.Random(0)
+    pieces = ["Python", "SQL", "•", "●", "▪", "■", "➤", "é", "—", " ", "\t", " ", "  ", "\n", "\n\n",
+              " \n \n", "\r\n", "\x0b", "\x1c", " ", "😀"]
+    samples = ["", " ", "\n\n", "   a \t b   "]
+    samples += ["".join(rng.choice(pieces) for _ in range(rng.randint(1, 80))) for _ in range(5000)]
+    samples += [generate_mock_text(20000), generate_mock_text(20000, unicode_heavy=True)]
+    for text in samples:
+        assert clean_text(text) == legacy_clean_text(text), repr(text)
+
+
+def test_none_and_bullets():
+    assert clean_text(None) == ""
+    assert clean_text("• Python\t\tSQL\n\n\n\n● Excel ") == "- Python SQL\n\n- Excel"
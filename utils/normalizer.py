@@ -1,3 +1,6 @@
+from utils.online_stats import OnlineScoreStats
+
+
 class ScoreNormalizer:
     def __init__(self):
         print("📈 Booting up Statistical Normalizer (Curve Grading)...")
@@ -30,4 +33,23 @@ class ScoreNormalizer:
             
             c["normalized_score"] = round(curved_score, 3)
 
-        return candidates
\ No newline at end of file
+        return candidates
+
+    def collect_stats(self, candidates, stats=None):
+        """
+        Streaming pass 1: min/max/mean/variance + quantile sketch, without keeping the candidates.
+        Pass an existing OnlineScoreStats to keep accumulating (e.g. one per worker, then merge()).
+        """
+        stats = stats or OnlineScoreStats()
+        for c in candidates:
+            stats.update(c.get("final_score", 0))
+        return stats
+
+    def normalize_stream(self, candidates, stats):
+        """
+        Streaming pass 2 (or from a persisted OnlineScoreStats): yields each candidate with
+        the same 'normalized_score' normalize_scores would give it.
+        """
+        for c in candidates:
+            c["normalized_score"] = stats.normalized(c.get("final_score", 0))
+            yield c
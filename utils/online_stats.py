@@ -0,0 +1,233 @@
+import os
+import json
+import math
+import random
+from bisect import bisect_right
+
+
+class RunningStats:
+    """
+    Streaming min / max / mean / variance (Welford), in O(1) memory.
+    Two RunningStats built on different shards merge exactly (Chan et al.).
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # Sum of squared deviations from the mean
+        self.min = math.inf
+        self.max = -math.inf
+
+    def update(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other):
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def variance(self):
+        """Population variance (0.0 until there are two values)."""
+        return self.m2 / self.count if self.count > 1 else 0.0
+
+    @property
+    def std(self):
+        return math.sqrt(self.variance)
+
+    def to_dict(self):
+        return {"count": self.count, "mean": self.mean, "m2": self.m2,
+                "min": self.min if self.count else None, "max": self.max if self.count else None}
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls()
+        stats.count, stats.mean, stats.m2 = data["count"], data["mean"], data["m2"]
+        if stats.count:
+            stats.min, stats.max = data["min"], data["max"]
+        return stats
+
+
+class KLLSketch:
+    """
+    Mergeable quantile sketch (Karnin, Lang & Liberty 2016).
+    Level h holds items that each stand for 2**h original values. When a level fills up
+    it is sorted and every other item (random offset) is promoted to the next level, so
+    memory stays around 3k items whatever the stream length; rank error is roughly 1.7/k.
+    """
+
+    def __init__(self, k=200, c=2.0 / 3.0, seed=None):
+        self.k = k
+        self.c = c
+        self.n = 0
+        self.levels = []
+        self.size = 0  # Items currently held across all levels
+        self._rng = random.Random(seed)
+        self._view = None  # Cached (sorted items, cumulative weights) for fast rank queries
+        self._grow()
+
+    def _grow(self):
+        self.levels.append([])
+        self._max_size = sum(self._capacity(level) for level in range(len(self.levels)))
+
+    def _capacity(self, level):
+        depth = len(self.levels) - level - 1
+        return int(math.ceil(self.k * self.c ** depth)) + 1
+
+    def _compress(self):
+        """Compacts the lowest full level (one level per call, like the reference implementation)."""
+        for level, items in enumerate(self.levels):
+            if len(items) >= self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self._grow()
+                items.sort()
+                keep = len(items) % 2  # An odd item out stays behind
+                offset = self._rng.randint(0, 1)
+                self.levels[level + 1].extend(items[keep + offset::2])
+                self.levels[level] = items[:keep]
+                self.size = sum(len(items) for items in self.levels)
+                return
+
+    def update(self, value):
+        self.levels[0].append(value)
+        self.n += 1
+        self.size += 1
+        self._view = None
+        if self.size >= self._max_size:
+            self._compress()
+
+    def merge(self, other):
+        """Folds another sketch in (e.g. one per parallel worker). The result is again a valid sketch."""
+        while len(self.levels) < len(other.levels):
+            self._grow()
+        for level, items in enumerate(other.levels):
+            self.levels[level].extend(items)
+        self.n += other.n
+        self.size = sum(len(items) for items in self.levels)
+        self._view = None
+        while self.size >= self._max_size:
+            self._compress()
+        return self
+
+    def _sorted_view(self):
+        if self._view is None:
+            weighted = sorted((item, 1 << level) for level, items in enumerate(self.levels) for item in items)
+            cumulative = []
+            total = 0
+            for _, weight in weighted:
+                total += weight
+                cumulative.append(total)
+            self._view = ([item for item, _ in weighted], cumulative)
+        return self._view
+
+    def rank(self, value):
+        """Approximate number of streamed values <= value (one bisect on the cached view)."""
+        items, cumulative = self._sorted_view()
+        position = bisect_right(items, value)
+        return cumulative[position - 1] if position else 0
+
+    def quantile(self, q):
+        """Approximate value at quantile q in [0, 1] (None for an empty sketch)."""
+        items, cumulative = self._sorted_view()
+        if not items:
+            return None
+        position = bisect_right(cumulative, q * cumulative[-1] - 1e-12)
+        return items[min(position, len(items) - 1)]
+
+    def to_dict(self):
+        return {"k": self.k, "c": self.c, "n": self.n, "levels": self.levels}
+
+    @classmethod
+    def from_dict(cls, data, seed=None):
+        sketch = cls(k=data["k"], c=data["c"], seed=seed)
+        while len(sketch.levels) < len(data["levels"]):
+            sketch._grow()
+        sketch.levels = [list(items) for items in data["levels"]]
+        sketch.n = data["n"]
+        sketch.size = sum(len(items) for items in sketch.levels)
+        sketch._view = None
+        return sketch
+
+
+class OnlineScoreStats:
+    """
+    Everything curve grading and percentile ranking need, collected in one streaming pass:
+    exact min/max/mean/variance plus a KLL sketch of the distribution. Workers each build
+    one and merge(); save()/load() keep it between runs, so the second pass never needs
+    the full candidate list in memory.
+    """
+
+    def __init__(self, k=200, seed=None):
+        self.stats = RunningStats()
+        self.sketch = KLLSketch(k=k, seed=seed)
+
+    @property
+    def count(self):
+        return self.stats.count
+
+    def update(self, score):
+        self.stats.update(score)
+        self.sketch.update(score)
+
+    def update_many(self, scores):
+        for score in scores:
+            self.update(score)
+        return self
+
+    def merge(self, other):
+        self.stats.merge(other.stats)
+        self.sketch.merge(other.sketch)
+        return self
+
+    def normalized(self, score):
+        """Min-max curve grade, same formula (and same all-equal rule) as ScoreNormalizer."""
+        if self.stats.max == self.stats.min:
+            return 1.0
+        return round((score - self.stats.min) / (self.stats.max - self.stats.min), 3)
+
+    def percentile(self, score):
+        """
+        Approximate ats_percentile for a score: the share of the pool ranked below it,
+        on the same (N - rank) / N * 100 scale RankingEngine uses.
+        """
+        if not self.count:
+            return 0.0
+        at_or_below = min(self.count, self.sketch.rank(score))
+        return round(max(0, at_or_below - 1) / self.count * 100, 1)
+
+    def to_dict(self):
+        return {"stats": self.stats.to_dict(), "sketch": self.sketch.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data):
+        online = cls(k=data["sketch"]["k"])
+        online.stats = RunningStats.from_dict(data["stats"])
+        online.sketch = KLLSketch.from_dict(data["sketch"])
+        return online
+
+    def save(self, path):
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
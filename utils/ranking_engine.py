@@ -1,6 +1,8 @@
 import json
 import os
 import csv # <-- Added for CSV Export
+import heapq
+from collections import Counter
 
 class RankingEngine:
     def __init__(self):
@@ -15,17 +17,18 @@ class RankingEngine:
         with open(config_path, "r", encoding="utf-8") as f:
             self.config = json.load(f)
 
+    @staticmethod
+    def rank_key(candidate):
+        """The tie-breaker tuple: final score, then skills, then experience."""
+        return (
+            candidate.get("final_score", 0),
+            candidate.get("raw_scores", {}).get("skills", 0),
+            candidate.get("raw_scores", {}).get("experience", 0)
+        )
+
     def rank_and_filter(self, candidates):
         """Sorts, applies thresholds, and generates recruiter notes."""
-        sorted_candidates = sorted(
-            candidates,
-            key=lambda c: (
-                c.get("final_score", 0),
-                c.get("raw_scores", {}).get("skills", 0),
-                c.get("raw_scores", {}).get("experience", 0)
-            ),
-            reverse=True
-        )
+        sorted_candidates = sorted(candidates, key=self.rank_key, reverse=True)
 
         thresholds = self.config["thresholds"]
         max_shortlist = self.config["ranking_config"]["max_shortlist_size"]
@@ -68,6 +71,91 @@ class RankingEngine:
 
         return processed_results
 
+    @staticmethod
+    def recruiter_note(candidate):
+        """Plain-english summary for HR, built from a ranked candidate's metadata."""
+        skill_score = candidate.get("raw_scores", {}).get("skills", 0) * 100
+        exp_score = candidate.get("raw_scores", {}).get("experience", 0) * 100
+        return (f"{candidate['ats_status']} due to {candidate['final_percentage']:.1f}% total match. "
+                f"(Skills: {skill_score:.0f}%, Exp: {exp_score:.0f}%)")
+
+    def rank_streaming(self, candidates, review_limit=None, stats=None):
+        """
+        STREAMING SHORTLIST: O(K) memory instead of O(N).
+        Keeps a bounded min-heap of the best K = max_shortlist_size + review_limit candidates
+        (same tie-breaker tuple and same stable order as rank_and_filter) while the input
+        streams past; everyone else is only counted by status. Recruiter notes are not built
+        here: export_to_csv (or recruiter_note) creates them for the rows actually exported.
+        Returns {"ranked": kept rows in rank order, "total": N, "status_counts": {label: count}}.
+        An OnlineScoreStats passed as 'stats' is fed every score on the way, for approximate_percentile later.
+        """
+        thresholds = self.config["thresholds"]
+        max_shortlist = self.config["ranking_config"]["max_shortlist_size"]
+        review_limit = max_shortlist * 10 if review_limit is None else review_limit
+        keep = max_shortlist + review_limit
+        auto_min = thresholds["auto_shortlist"]["min_score"]
+        review_min = thresholds["manual_review"]["min_score"]
+
+        # 1. One pass: bounded heap + band counters. The heap entry (key, -arrival) makes
+        #    the weakest entry the root, and among equal keys the later arrival is weaker.
+        heap = []
+        band_counts = Counter()
+        total = 0
+        for arrival, candidate in enumerate(candidates):
+            total += 1
+            score = candidate.get("final_score", 0) * 100
+            if stats is not None:
+                stats.update(candidate.get("final_score", 0))
+            band_counts["auto" if score >= auto_min else "review" if score >= review_min else "reject"] += 1
+            entry = (self.rank_key(candidate), -arrival, candidate)
+            if len(heap) < keep:
+                heapq.heappush(heap, entry)
+            elif entry[:2] > heap[0][:2]:
+                heapq.heapreplace(heap, entry)
+
+        # 2. Label the kept prefix exactly like rank_and_filter would
+        ranked = [entry[2] for entry in sorted(heap, key=lambda entry: entry[:2], reverse=True)]
+        status_counts = Counter()
+        shortlist_count = 0
+        for index, candidate in enumerate(ranked):
+            score = candidate.get("final_score", 0) * 100
+            if score >= auto_min:
+                band_counts["auto"] -= 1
+                if shortlist_count < max_shortlist:
+                    status_info = thresholds["auto_shortlist"]
+                    action = status_info["recommended_action"]
+                    shortlist_count += 1
+                else:
+                    status_info = thresholds["manual_review"]
+                    action = "Shortlist Full. Keep as Backup."
+            elif score >= review_min:
+                band_counts["review"] -= 1
+                status_info = thresholds["manual_review"]
+                action = status_info["recommended_action"]
+            else:
+                band_counts["reject"] -= 1
+                status_info = thresholds["auto_reject"]
+                action = status_info["recommended_action"]
+
+            candidate["ats_rank"] = index + 1
+            candidate["ats_percentile"] = round(((total - (index + 1)) / total) * 100, 1)
+            candidate["ats_status"] = status_info["status_label"]
+            candidate["ats_action"] = action
+            candidate["final_percentage"] = round(score, 1)
+            status_counts[status_info["status_label"]] += 1
+
+        # 3. Everyone past the kept prefix: an auto-level score there means the shortlist is already full
+        status_counts[thresholds["manual_review"]["status_label"]] += band_counts["auto"] + band_counts["review"]
+        status_counts[thresholds["auto_reject"]["status_label"]] += band_counts["reject"]
+
+        return {"ranked": ranked, "total": total,
+                "status_counts": {label: count for label, count in status_counts.items() if count}}
+
+    @staticmethod
+    def approximate_percentile(candidate, stats):
+        """ats_percentile for ANY candidate (kept or not) from an OnlineScoreStats sketch of the pool."""
+        return stats.percentile(candidate.get("final_score", 0))
+
     def export_to_csv(self, processed_candidates, output_filename="hr_shortlist_report.csv"):
         """Exports the ranked list to a recruiter-friendly CSV file (Stolen from Friend 3)."""
         base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -85,6 +173,8 @@ class RankingEngine:
             for c in processed_candidates:
                 # Only write the specific headers to the CSV, not the raw code data
                 row = {h: c.get(h, "") for h in headers}
+                if "recruiter_note" not in c and "ats_status" in c:
+                    row["recruiter_note"] = self.recruiter_note(c)  # Streaming mode: built only on export
                 writer.writerow(row)
                 
         print(f"✅ SUCCESS: HR Report exported to {filepath}")